@@ -1,12 +1,14 @@
 """AutoLocalise Python SDK"""
 
 from .translator import Translator
+from .async_translator import AsyncTranslator
 from .exceptions import AutoLocaliseError, APIError, NetworkError
 from ._version import __version__
 from string import Template
 
 __all__ = [
     "Translator",
+    "AsyncTranslator",
     "Template",
     "AutoLocaliseError",
     "APIError",
@@ -0,0 +1,110 @@
+"""Frequency-based cache admission (TinyLFU)"""
+
+from typing import Hashable, Set
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# Odd 64-bit multipliers, one per sketch row
+_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+)
+
+# Counters are 4-bit in the original design
+_MAX_COUNT = 15
+
+
+class CountMinSketch:
+    """Approximate frequency counter with saturating 4-bit style counters"""
+
+    def __init__(self, width: int, depth: int = 4):
+        """
+        Args:
+            width: Minimum number of counters per row (rounded up to a power
+                of two)
+            depth: Number of rows (independent hash functions), at most 4
+        """
+        size = 16
+        while size < width:
+            size <<= 1
+
+        self._mask = size - 1
+        self._rows = [bytearray(size) for _ in range(min(depth, len(_SEEDS)))]
+        self._seeds = _SEEDS[: len(self._rows)]
+
+    def _indexes(self, key: Hashable):
+        key_hash = hash(key) & _MASK64
+        return [
+            (((key_hash * seed) & _MASK64) >> 32) & self._mask for seed in self._seeds
+        ]
+
+    def increment(self, key: Hashable) -> None:
+        """Record one occurrence of key"""
+        indexes = self._indexes(key)
+        current = min(row[i] for row, i in zip(self._rows, indexes))
+        if current >= _MAX_COUNT:
+            return
+
+        # Conservative update: only raise the counters holding the minimum
+        for row, i in zip(self._rows, indexes):
+            if row[i] == current:
+                row[i] = current + 1
+
+    def estimate(self, key: Hashable) -> int:
+        """Estimate how often key was recorded"""
+        return min(row[i] for row, i in zip(self._rows, self._indexes(key)))
+
+    def halve(self) -> None:
+        """Halve every counter so old popularity fades"""
+        for n, row in enumerate(self._rows):
+            self._rows[n] = bytearray(count >> 1 for count in row)
+
+
+class TinyLFU:
+    """TinyLFU admission policy
+
+    A new entry may only displace the cache's eviction victim if it is
+    estimated to be accessed more often, which stops streams of one-off
+    keys from flushing a frequently used working set.
+
+    First sightings of a key are kept in a doorkeeper set instead of the
+    sketch, so one-off keys do not inflate the counters of popular ones.
+    Every ``10 * capacity`` accesses the counters are halved and the
+    doorkeeper is cleared, so estimates track recent popularity.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Number of entries in the cache being protected
+        """
+        capacity = max(capacity, 1)
+        self._sketch = CountMinSketch(4 * capacity)
+        self._doorkeeper: Set[int] = set()
+        self._records = 0
+        self.sample_size = 10 * capacity
+
+    def record(self, key: Hashable) -> None:
+        """Record an access (hit or miss) for key"""
+        key_hash = hash(key)
+        if key_hash in self._doorkeeper:
+            self._sketch.increment(key)
+        else:
+            self._doorkeeper.add(key_hash)
+
+        self._records += 1
+        if self._records >= self.sample_size:
+            self._sketch.halve()
+            self._doorkeeper.clear()
+            self._records = 0
+
+    def frequency(self, key: Hashable) -> int:
+        """Estimated recent access frequency of key"""
+        seen = 1 if hash(key) in self._doorkeeper else 0
+        return self._sketch.estimate(key) + seen
+
+    def admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        """Whether candidate should replace victim in the cache"""
+        return self.frequency(candidate) > self.frequency(victim)
@@ -0,0 +1,777 @@
+"""Asyncio translator client for AutoLocalise SDK"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import time
+from string import Template
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .exceptions import APIError, CircuitOpenError, ConfigurationError, NetworkError
+from .resilience import CircuitBreaker, RetryPolicy
+from .streaming import CATALOG_CHUNK_SIZE, CatalogStreamParser
+from .templates import compile_template
+from .tracing import span
+from .translator import BaseTranslator
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTranslator(BaseTranslator):
+    """AutoLocalise translator client for asyncio applications
+
+    Offers the same interface as ``Translator`` but ``translate``,
+    ``translate_template`` and ``__call__`` are coroutines and API calls go
+    through a non-blocking ``httpx.AsyncClient``, so cache misses never block
+    the event loop. Translations are stored in the same global cache used by
+    ``Translator``.
+
+    Existing server translations are fetched on first use rather than in the
+    constructor (or in a background task with ``background_warmup``). Use
+    the translator as an async context manager (or call ``aclose()``) to
+    release pooled connections.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        source_locale: str,
+        target_locale: str,
+        max_batch_size: int = 500,
+        max_batch_bytes: int = 512 * 1024,
+        max_workers: int = 4,
+        store: Optional[Any] = None,
+        background_warmup: bool = False,
+        preload_locales: Optional[List[str]] = None,
+        max_catalog_locales: Optional[int] = None,
+        max_catalog_entries: Optional[int] = None,
+        refresh_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        limit_requests: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+        json_codec: Optional[Any] = None,
+        compress_threshold: Optional[int] = None,
+        stream_catalog: bool = False,
+        compact_catalog: bool = False,
+        collect_metrics: bool = False,
+    ):
+        """
+        Initialize AutoLocalise async translator
+
+        Args:
+            api_key: Your AutoLocalise API key
+            source_locale: Source language code
+            target_locale: Target language code
+            max_batch_size: Maximum number of texts sent in one API request
+            max_batch_bytes: Approximate maximum request payload size in bytes
+            max_workers: Maximum number of API requests sent concurrently
+            store: Persistent store (e.g. ``SQLiteStore``) used as a
+                read-through/write-through layer behind the in-memory cache
+            background_warmup: Load existing server translations in a
+                background task on first use instead of making the first
+                translation wait; see ``ready()`` and ``wait_ready()``
+            preload_locales: Additional target locales whose server
+                translations are loaded concurrently on first use
+            max_catalog_locales: Maximum number of locales whose server
+                translations are kept in memory
+            max_catalog_entries: Maximum number of server translations kept
+                per locale
+            refresh_interval: If set, a background task started on first use
+                re-syncs server translations of every loaded locale this
+                often (in seconds)
+            retry_policy: Retries for transient translation request
+                failures, e.g. ``RetryPolicy(retries=3)`` (None sends every
+                request once)
+            circuit_breaker: A ``CircuitBreaker`` that stops translation
+                requests after repeated failures; while it is open,
+                ``translate`` returns the source text immediately and the
+                API is probed in a background task
+            limit_requests: Adapt the number of concurrent translation
+                requests to API latency and 429 responses, sharing the limit
+                with every translator (sync or async) that uses the same
+                api_key
+            connect_timeout: Seconds to wait for a connection to the API
+                (defaults to 30)
+            read_timeout: Seconds to wait for an API response (defaults
+                to 30)
+            client: HTTP client to send requests with, e.g. one
+                ``httpx.AsyncClient(limits=httpx.Limits(...))`` shared by
+                several translators on the same event loop. It is left open
+                by ``aclose()``
+            json_codec: JSON codec for request and response bodies, e.g.
+                ``"orjson"`` or ``"auto"`` (orjson when installed); None
+                leaves JSON to httpx
+            compress_threshold: Gzip request bodies of at least this many
+                bytes (None never compresses)
+            stream_catalog: Parse server translations in chunks as they
+                download instead of reading the whole response first
+            compact_catalog: Keep server translations in a compact sorted
+                array instead of a dict
+            collect_metrics: Record how texts are resolved and API request
+                latency in the registry returned by
+                ``get_metrics_registry()``
+        """
+        if httpx is None:
+            raise ConfigurationError(
+                "AsyncTranslator requires httpx: pip install autolocalise[async]"
+            )
+
+        super().__init__(
+            api_key,
+            source_locale,
+            target_locale,
+            max_batch_size=max_batch_size,
+            max_batch_bytes=max_batch_bytes,
+            max_workers=max_workers,
+            store=store,
+            preload_locales=preload_locales,
+            max_catalog_locales=max_catalog_locales,
+            max_catalog_entries=max_catalog_entries,
+            refresh_interval=refresh_interval,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            limit_requests=limit_requests,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            json_codec=json_codec,
+            compress_threshold=compress_threshold,
+            stream_catalog=stream_catalog,
+            compact_catalog=compact_catalog,
+            collect_metrics=collect_metrics,
+        )
+
+        # Created lazily so they bind to the loop that first uses them
+        self._owns_client = client is None
+        self._client: Optional["httpx.AsyncClient"] = client
+        if client is not None:
+            client.headers.update(self._default_headers())
+        self._background_warmup = background_warmup
+        self._warmup_task: Optional["asyncio.Future[None]"] = None
+        self._refresh_task: Optional["asyncio.Future[None]"] = None
+        self._probe_task: Optional["asyncio.Future[None]"] = None
+        self._closed = False
+        # Bounds the chunk requests in flight across all translate calls
+        self._chunk_slots: Optional[asyncio.Semaphore] = None
+        # Server translations currently being loaded, per language pair
+        self._catalog_loads: Dict[Tuple[str, str], "asyncio.Future[None]"] = {}
+
+    async def __aenter__(self) -> "AsyncTranslator":
+        await self._ensure_server_translations()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client (unless it was passed in)"""
+        self._closed = True
+        tasks = [
+            self._refresh_task,
+            self._warmup_task,
+            self._probe_task,
+            *self._catalog_loads.values(),
+        ]
+        for task in tasks:
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._warmup_task = None
+        self._refresh_task = None
+        self._probe_task = None
+        self._chunk_slots = None
+        self._catalog_loads.clear()
+
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(headers=self._default_headers())
+        return self._client
+
+    def _get_chunk_slots(self) -> asyncio.Semaphore:
+        """Return the semaphore of max_workers chunk requests, creating it
+        on first use"""
+        if self._chunk_slots is None:
+            self._chunk_slots = asyncio.Semaphore(self.max_workers)
+        return self._chunk_slots
+
+    def _http_timeout(self) -> Any:
+        """The request timeout in the form httpx expects"""
+        if isinstance(self.timeout, tuple):
+            connect_timeout, read_timeout = self.timeout
+            return httpx.Timeout(read_timeout, connect=connect_timeout)
+        return self.timeout
+
+    async def _ensure_server_translations(
+        self, source_lang: Optional[str] = None, target_lang: Optional[str] = None
+    ) -> None:
+        """Load server translations for the startup locales and, on first
+        use, for the requested language pair"""
+        if self.refresh_interval is not None and self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._refresh_loop())
+
+        pending = []
+        if not self._ready.is_set():
+            pending.append(self._start_warmup())
+        if source_lang and target_lang:
+            load = self._start_catalog_load(source_lang, target_lang)
+            if load is not None:
+                pending.append(load)
+
+        if pending and not self._background_warmup:
+            await asyncio.gather(*(asyncio.shield(task) for task in pending))
+
+    def _start_warmup(self) -> "asyncio.Future[None]":
+        """Start loading server translations for the startup locales"""
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.ensure_future(self._warm_up())
+        return self._warmup_task
+
+    async def _warm_up(self) -> None:
+        """Load the startup locales concurrently and mark the translator ready"""
+        loads = [
+            self._start_catalog_load(self.source, target)
+            for target in self._warmup_targets
+        ]
+        await asyncio.gather(*(load for load in loads if load is not None))
+        self._ready.set()
+
+    def _start_catalog_load(
+        self, source_lang: str, target_lang: str
+    ) -> Optional["asyncio.Future[None]"]:
+        """Start loading a language pair unless it is loaded or loading
+
+        Returns:
+            The task loading the pair, or None if it is already loaded
+        """
+        if self._catalogs.is_loaded(source_lang, target_lang):
+            return None
+
+        key = (source_lang, target_lang)
+        task = self._catalog_loads.get(key)
+        if task is None:
+            task = self._catalog_loads[key] = asyncio.ensure_future(
+                self._load_catalog(source_lang, target_lang)
+            )
+        return task
+
+    async def _load_catalog(self, source_lang: str, target_lang: str) -> None:
+        """Fetch server translations for a language pair"""
+        try:
+            await self._populate_cache_from_server(source_lang, target_lang)
+        finally:
+            self._catalog_loads.pop((source_lang, target_lang), None)
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for existing server translations to finish loading
+
+        Starts loading them if that has not happened yet.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits until done)
+
+        Returns:
+            True if loading finished, False if the timeout expired
+        """
+        if self._ready.is_set():
+            return True
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self._start_warmup()), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def _populate_cache_from_server(
+        self, source_lang: Optional[str] = None, target_lang: Optional[str] = None
+    ) -> None:
+        """Populate cache with existing translations from server for a
+        language pair (the instance default if not given)"""
+        source_lang = source_lang or self.source
+        target_lang = target_lang or self.target
+        if self._store is not None:
+            await self._run_store(self._restore_catalog, source_lang, target_lang)
+
+        try:
+            payload, headers = self._catalog_request(source_lang, target_lang)
+            response = await self._post(
+                "/v1/translations", payload, headers, stream=self.stream_catalog
+            )
+            try:
+                if response.status_code == 200:
+                    data = await self._read_catalog(response)
+                    applied = self._load_server_translations(
+                        data,
+                        source_lang,
+                        target_lang,
+                        etag=self._response_etag(response),
+                    )
+                    if applied and self._store is not None:
+                        await self._run_store(
+                            self._save_server_translations,
+                            data,
+                            source_lang,
+                            target_lang,
+                        )
+                elif response.status_code == 304:
+                    logger.debug(
+                        f"Server translations for {source_lang}:{target_lang} "
+                        f"are unchanged"
+                    )
+                elif response.status_code == 404:
+                    self._catalogs.load({}, source_lang, target_lang)
+                else:
+                    self._catalog_failed(source_lang, target_lang)
+                    if self.stream_catalog:
+                        await response.aread()
+                    self._handle_api_error(response)
+            finally:
+                if self.stream_catalog:
+                    await response.aclose()
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            self._catalog_failed(source_lang, target_lang)
+            logger.warning(f"Failed to check server translations: {e}")
+        except Exception as e:
+            self._catalog_failed(source_lang, target_lang)
+            logger.error(f"Unexpected error during server translation check: {e}")
+
+    async def _run_store(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a persistent store operation in the default executor
+
+        Store reads and writes block (SQLite waits up to its lock timeout),
+        so they never run on the event loop.
+        """
+        call = functools.partial(contextvars.copy_context().run, function, *args)
+        return await asyncio.get_running_loop().run_in_executor(None, call)
+
+    async def _read_catalog(self, response: "httpx.Response") -> Dict[str, Any]:
+        """Parse a /v1/translations response, in chunks when streaming"""
+        if not self.stream_catalog:
+            return self._decode_response(response)
+
+        with span("json_decode", streamed=True):
+            parser = CatalogStreamParser()
+            async for chunk in response.aiter_bytes(CATALOG_CHUNK_SIZE):
+                parser.feed(chunk)
+            return parser.close()
+
+    async def refresh(self) -> None:
+        """Re-sync server translations of every loaded locale
+
+        Unchanged locales cost a conditional request; changed ones only
+        transfer their changes when the server supports incremental sync.
+        """
+        await asyncio.gather(
+            *(
+                self._populate_cache_from_server(source_lang, target_lang)
+                for source_lang, target_lang in self._catalogs.pairs()
+            )
+        )
+
+    async def _refresh_loop(self) -> None:
+        """Refresh server translations every refresh_interval until closed"""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def __call__(
+        self,
+        texts: List[str],
+        target_locale: Optional[str] = None,
+        source_locale: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Translate texts (callable interface)
+
+        Args:
+            texts: List of texts to translate
+            target_locale: Target language (optional, uses instance default)
+            source_locale: Source language (optional, uses instance default)
+
+        Returns:
+            Dictionary mapping original text to translated text
+        """
+        return await self.translate(
+            texts, target_locale=target_locale, source_locale=source_locale
+        )
+
+    async def translate(
+        self,
+        texts: List[str],
+        target_locale: Optional[str] = None,
+        source_locale: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Translate multiple texts
+
+        Args:
+            texts: List of texts to translate
+            target_locale: Target language (optional, uses instance default)
+            source_locale: Source language (optional, uses instance default)
+
+        Returns:
+            Dictionary mapping original text to translated text
+        """
+        if not texts:
+            return {}
+
+        source_lang = source_locale or self.source
+        target_lang = target_locale or self.target
+
+        with span(
+            "translate", source=source_lang, target=target_lang, texts=len(texts)
+        ):
+            await self._ensure_server_translations(source_lang, target_lang)
+
+            results, texts_to_translate = self._lookup_texts(
+                texts, source_lang, target_lang
+            )
+            if self._store is not None and texts_to_translate:
+                texts_to_translate = await self._run_store(
+                    self._lookup_store,
+                    texts_to_translate,
+                    results,
+                    source_lang,
+                    target_lang,
+                )
+
+            # If all texts were cached, return results
+            if not texts_to_translate:
+                return results
+
+            # Don't wait for a request that is known to fail
+            if self._circuit_open():
+                fallbacks = self._fall_back(texts_to_translate, results)
+                self._count_outcomes(source_lang, target_lang, fallbacks=fallbacks)
+                return results
+
+            # Identical misses already being fetched by another caller (thread or
+            # coroutine) are awaited instead of being requested again
+            owned, waiting = self._inflight.claim(
+                texts_to_translate,
+                source_lang,
+                target_lang,
+                loop=asyncio.get_running_loop(),
+            )
+
+            # Translate all texts (cache misses)
+            new_translations: Dict[str, str] = {}
+            fallbacks = shared = 0
+            try:
+                if owned:
+                    new_translations = await self._translate_texts(
+                        owned, source_lang, target_lang
+                    )
+                    self._store_translations(
+                        new_translations, results, source_lang, target_lang
+                    )
+                    if self._store is not None and new_translations:
+                        await self._run_store(
+                            self._persist_translations,
+                            new_translations,
+                            source_lang,
+                            target_lang,
+                        )
+
+            except Exception as e:
+                fallbacks = self._handle_translation_error(owned, results, e)
+            finally:
+                self._inflight.release(
+                    owned, new_translations, source_lang, target_lang
+                )
+
+            # Other callers' requests are waited for as long as our own
+            # would be; texts still pending then fall back
+            deadline = time.monotonic() + self._wait_timeout()
+            for text, future in waiting.items():
+                try:
+                    # Shielded so a timeout doesn't cancel the owner's future
+                    translation = await asyncio.wait_for(
+                        asyncio.shield(asyncio.wrap_future(future)),
+                        max(0.0, deadline - time.monotonic()),
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"Timed out waiting for a shared translation of {text!r}"
+                    )
+                    continue
+                if translation is not None:
+                    results[text] = translation
+                    shared += 1
+
+            # Texts from failed chunks fall back to their original text
+            fallbacks += self._fall_back(texts_to_translate, results)
+            self._count_outcomes(
+                source_lang,
+                target_lang,
+                translated=len(new_translations),
+                shared=shared,
+                fallbacks=fallbacks,
+            )
+            return results
+
+    async def _translate_texts(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Send texts for translation, chunking large batches
+
+        At most ``max_workers`` chunks of this translator are in flight at
+        once, across all concurrent calls. A failed chunk is logged and left
+        out of the result; the error is raised only when every chunk failed.
+        """
+        chunks = self._chunk_texts(texts)
+        if len(chunks) == 1:
+            return await self._translate_chunk(chunks[0], source_lang, target_lang)
+
+        semaphore = self._get_chunk_slots()
+
+        async def send(chunk: List[str]) -> Dict[str, str]:
+            async with semaphore:
+                return await self._translate_chunk(chunk, source_lang, target_lang)
+
+        outcomes = await asyncio.gather(
+            *(send(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        translations: Dict[str, str] = {}
+        errors = []
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    f"Translation failed for a chunk of {len(chunk)} texts: {outcome}"
+                )
+                errors.append(outcome)
+            else:
+                translations.update(outcome)
+
+        if len(errors) == len(chunks):
+            raise errors[0]
+
+        return translations
+
+    async def _translate_chunk(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Send a single chunk of texts, retrying transient failures"""
+        attempt = 0
+        while True:
+            if self._circuit_open():
+                raise CircuitOpenError("Translation API is unavailable")
+
+            try:
+                translations = await self._send_chunk(texts, source_lang, target_lang)
+            except (NetworkError, APIError) as e:
+                self._record_failure(e)
+                if self._retry_policy is None or not self._retry_policy.should_retry(
+                    e, attempt
+                ):
+                    raise
+
+                delay = self._retry_policy.delay(e, attempt)
+                logger.debug(f"Retrying translation request in {delay:.2f}s: {e}")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            self._record_success()
+            return translations
+
+    def _start_probe(self) -> None:
+        """Probe the API in a background task until the circuit closes"""
+        if self._closed:
+            self._circuit_breaker.end_probe()
+            return
+
+        self._probe_task = asyncio.ensure_future(self._probe_until_recovered())
+
+    async def _probe_until_recovered(self) -> None:
+        """Send a cheap request every reset_timeout until the API answers"""
+        breaker = self._circuit_breaker
+        try:
+            while breaker.is_open:
+                await asyncio.sleep(breaker.reset_timeout)
+                if await self._probe_api():
+                    logger.info("Translation API recovered")
+                    breaker.record_success()
+        finally:
+            breaker.end_probe()
+
+    async def _probe_api(self) -> bool:
+        """Check whether the API translates again with a one-text request"""
+        try:
+            response = await self._post_translate(self._probe_payload())
+        except httpx.HTTPError:
+            return False
+        return self._probe_succeeded(response.status_code)
+
+    async def _send_chunk(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Send a single chunk of texts for translation"""
+        try:
+            payload, hash_to_text = self._translate_payload(
+                texts, source_lang, target_lang
+            )
+
+            response = await self._post_translate(payload)
+            if response.status_code == 200:
+                return self._parse_translate_response(
+                    self._decode_response(response), hash_to_text
+                )
+            else:
+                self._handle_api_error(response)
+
+        except httpx.HTTPError as e:
+            raise NetworkError(f"Failed to translate texts: {e}")
+
+        return {}
+
+    async def _post(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """POST a JSON payload to an API endpoint
+
+        A streamed response must be closed with ``aclose()``.
+        """
+        body, headers = self._encode_request(payload, headers or {})
+        kwargs: Dict[str, Any] = (
+            {"json": payload} if body is None else {"content": body}
+        )
+        if headers:
+            kwargs["headers"] = headers
+        client = self._get_client()
+        url = f"{self.base_url}{path}"
+
+        with span("http_request", path=path) as request_span:
+            if stream:
+                request = client.build_request(
+                    "POST", url, timeout=self._http_timeout(), **kwargs
+                )
+                response = await client.send(request, stream=True)
+            else:
+                response = await client.post(
+                    url, timeout=self._http_timeout(), **kwargs
+                )
+            request_span.set_attribute("http.status_code", response.status_code)
+        return response
+
+    async def _post_translate(self, payload: Dict[str, Any]) -> "httpx.Response":
+        """POST to /v1/translate, within the request limiter if enabled"""
+        if self._limiter is None and self._metrics is None:
+            return await self._post("/v1/translate", payload)
+
+        if self._limiter is not None:
+            await self._limiter.acquire_async()
+        started = time.monotonic()
+        status_code = None
+        try:
+            response = await self._post("/v1/translate", payload)
+            status_code = response.status_code
+            return response
+        finally:
+            latency = time.monotonic() - started
+            if self._limiter is not None:
+                self._limiter.release(latency, status_code)
+            self._observe_request(payload, latency, status_code)
+
+    async def translate_template(
+        self,
+        template: Template,
+        target_locale: Optional[str] = None,
+        source_locale: Optional[str] = None,
+        **params,
+    ) -> str:
+        """
+        Translate a Python Template with parameter protection.
+
+        Args:
+            template: Python string.Template object
+            target_locale: Target language (optional, uses instance default)
+            source_locale: Source language (optional, uses instance default)
+            **params: Template parameters (protected from translation)
+
+        Returns:
+            Translated text with parameters substituted
+        """
+        if not isinstance(template, Template):
+            raise ValueError("First argument must be a string.Template object")
+
+        with span("translate_template", params=len(params)):
+            template_str = template.template
+
+            # If no parameters provided, just translate the template string directly
+            if not params:
+                result = await self.translate(
+                    [template_str], target_locale, source_locale
+                )
+                return result[template_str]
+
+            # Cached per template and parameter names, so repeat renders skip
+            # all regex work
+            with span("template_compile"):
+                compiled = compile_template(template_str, frozenset(params))
+
+            translation_result = await self.translate(
+                [compiled.protected], target_locale, source_locale
+            )
+            translated_text = translation_result[compiled.protected]
+
+            return compiled.render(translated_text, params)
+
+    async def translate_templates(
+        self,
+        items: Iterable[Tuple[Template, Optional[Mapping]]],
+        target_locale: Optional[str] = None,
+        source_locale: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Translate many Python Templates with parameter protection at once
+
+        All protected templates are looked up together and their cache
+        misses are sent in a single batched request.
+
+        Args:
+            items: (template, params) pairs, params being a mapping of
+                template parameters (or None)
+            target_locale: Target language (optional, uses instance default)
+            source_locale: Source language (optional, uses instance default)
+
+        Returns:
+            Translated texts with parameters substituted, in input order
+        """
+        with span("translate_templates"):
+            with span("template_compile"):
+                compiled = self._compile_templates(items)
+            if not compiled:
+                return []
+
+            translations = await self.translate(
+                [template.protected for template, _ in compiled],
+                target_locale,
+                source_locale,
+            )
+            return [
+                template.render(translations[template.protected], params)
+                for template, params in compiled
+            ]
@@ -0,0 +1,193 @@
+"""Cross-thread micro-batching of translation requests"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SendFunction = Callable[[List[str], str, str], Dict[str, str]]
+
+
+class _PendingRequest:
+    """Texts submitted by one caller and the future it waits on"""
+
+    __slots__ = ("texts", "source_lang", "target_lang", "future")
+
+    def __init__(self, texts: List[str], source_lang: str, target_lang: str):
+        self.texts = texts
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.future: Future = Future()
+
+
+class BatchDispatcher:
+    """Collect cache misses from many threads and send them together
+
+    Submitted texts are held for at most ``window`` seconds after the first
+    one arrives, or until ``max_batch_size`` texts are pending, then sent as
+    a single request per language pair. Each caller's future resolves to the
+    translations of its own texts.
+    """
+
+    def __init__(
+        self,
+        send: SendFunction,
+        window: float = 0.005,
+        max_batch_size: int = 100,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize batch dispatcher
+
+        Args:
+            send: Function translating a list of texts for a language pair
+            window: Maximum time in seconds to wait for more texts
+            max_batch_size: Number of pending texts that triggers a send
+            max_workers: Maximum number of batches sent concurrently
+        """
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._send = send
+        self._condition = threading.Condition()
+        self._pending: List[_PendingRequest] = []
+        self._pending_texts = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="autolocalise-batch"
+        )
+
+        # Counters for stats()
+        self._requests = 0
+        self._batches = 0
+        self._batched_texts = 0
+
+    def submit(self, texts: List[str], source_lang: str, target_lang: str) -> Future:
+        """
+        Queue texts for the next batch
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Future resolving to a dict of translations for the given texts
+        """
+        request = _PendingRequest(texts, source_lang, target_lang)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BatchDispatcher is closed")
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="autolocalise-dispatcher", daemon=True
+                )
+                self._thread.start()
+
+            self._pending.append(request)
+            self._pending_texts += len(texts)
+            self._requests += 1
+            self._condition.notify()
+
+        return request.future
+
+    def stats(self) -> Dict[str, Any]:
+        """Get batching statistics
+
+        ``fill_rate`` is the average batch size as a fraction of
+        ``max_batch_size``; low values mean the window expires before
+        batches fill up.
+        """
+        with self._condition:
+            batches = self._batches
+            average = self._batched_texts / batches if batches else 0.0
+            return {
+                "requests": self._requests,
+                "batches": batches,
+                "texts": self._batched_texts,
+                "average_batch_size": average,
+                "fill_rate": min(average / self.max_batch_size, 1.0),
+            }
+
+    def close(self) -> None:
+        """Send anything still pending and stop the dispatcher"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+
+        if thread is not None:
+            thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _run(self) -> None:
+        """Dispatcher loop: wait for the window to close, then flush"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+
+                if not self._pending:
+                    return
+
+                deadline = time.monotonic() + self.window
+                while self._pending_texts < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                pending = self._pending
+                self._pending = []
+                self._pending_texts = 0
+
+            self._flush(pending)
+
+    def _flush(self, pending: List[_PendingRequest]) -> None:
+        """Group pending requests by language pair and send each group"""
+        groups: Dict[Tuple[str, str], List[_PendingRequest]] = {}
+        for request in pending:
+            key = (request.source_lang, request.target_lang)
+            groups.setdefault(key, []).append(request)
+
+        for (source_lang, target_lang), requests in groups.items():
+            texts = list(
+                dict.fromkeys(t for request in requests for t in request.texts)
+            )
+
+            with self._condition:
+                self._batches += 1
+                self._batched_texts += len(texts)
+
+            self._executor.submit(
+                self._send_batch, texts, source_lang, target_lang, requests
+            )
+
+    def _send_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        requests: List[_PendingRequest],
+    ) -> None:
+        """Send one batch and fan the results back to waiting callers"""
+        try:
+            translations = self._send(texts, source_lang, target_lang)
+        except Exception as e:
+            for request in requests:
+                request.future.set_exception(e)
+            return
+
+        for request in requests:
+            request.future.set_result(
+                {
+                    text: translations[text]
+                    for text in request.texts
+                    if text in translations
+                }
+            )
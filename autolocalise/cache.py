@@ -1,13 +1,21 @@
 """In-memory cache for translations"""
 
+import sys
 import threading
-from typing import Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
+from .admission import TinyLFU
+from .exceptions import ConfigurationError
 
 # Global shared cache instance
 _global_cache = None
 _global_cache_lock = threading.Lock()
 
+# Cached value: (translation, expiry timestamp or None, accounted size in bytes)
+_Entry = Tuple[str, Optional[float], int]
+
 
 def get_global_cache():
     """Get or create the global shared cache instance"""
@@ -19,19 +27,61 @@ def get_global_cache():
     return _global_cache
 
 
+def set_global_cache(cache) -> None:
+    """Replace the global shared cache instance
+
+    Translators pick up the global cache when they are created, so call this
+    before constructing any translator, e.g. to configure TTLs or budgets::
+
+        set_global_cache(TranslationCache(max_size=50000, ttl=3600))
+    """
+    global _global_cache
+    with _global_cache_lock:
+        _global_cache = cache
+
+
+def _entry_size(text: str, translation: str) -> int:
+    """Approximate memory used by one cached translation"""
+    return sys.getsizeof(text) + sys.getsizeof(translation)
+
+
 class TranslationCache:
-    """Thread-safe in-memory cache for translations"""
+    """Thread-safe in-memory LRU cache for translations"""
 
-    def __init__(self, max_size: int = 10000):
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        admission: Optional[str] = None,
+    ):
         """
         Initialize translation cache
 
         Args:
             max_size: Maximum number of translations to cache per language pair
+            ttl: Default time-to-live in seconds for cached translations
+                (None keeps entries until they are evicted)
+            max_bytes: Maximum memory in bytes used by keys and values per
+                language pair (None for no limit)
+            admission: Admission policy applied when the cache is full.
+                "tinylfu" only lets a new translation evict the least recently
+                used one if it is requested more often; None always admits
         """
-        self._cache: Dict[str, Dict[str, str]] = {}
+        if admission not in (None, "tinylfu"):
+            raise ConfigurationError(f"Unknown cache admission policy: {admission}")
+
+        self._cache: Dict[str, "OrderedDict[str, _Entry]"] = {}
+        self._bytes: Dict[str, int] = {}
         self._max_size = max_size
-        self._lock = threading.RLock()
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._evictions = 0
+        self._rejections = 0
+        self._filters: Optional[Dict[str, TinyLFU]] = (
+            {} if admission == "tinylfu" else None
+        )
+        self._lock = threading.Lock()
 
     def _get_cache_key(self, source_lang: str, target_lang: str) -> str:
         """Generate cache key for language pair"""
@@ -42,42 +92,163 @@ class TranslationCache:
         cache_key = self._get_cache_key(source_lang, target_lang)
 
         with self._lock:
-            lang_cache = self._cache.get(cache_key, {})
-            return lang_cache.get(text)
+            if self._filters is not None:
+                self._filter_for(cache_key).record(text)
 
-    def set(self, text: str, translation: str, source_lang: str, target_lang: str):
-        """Store translation in cache"""
+            lang_cache = self._cache.get(cache_key)
+            if lang_cache is None:
+                return None
+
+            entry = lang_cache.get(text)
+            if entry is None:
+                return None
+
+            translation, expires_at, size = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del lang_cache[text]
+                self._bytes[cache_key] -= size
+                return None
+
+            # Mark as most recently used
+            lang_cache.move_to_end(text)
+            return translation
+
+    def get_many(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Get translations of several distinct texts under a single lock
+
+        Returns:
+            Translations of the texts that are cached
+        """
         cache_key = self._get_cache_key(source_lang, target_lang)
+        found: Dict[str, str] = {}
 
         with self._lock:
-            if cache_key not in self._cache:
-                self._cache[cache_key] = {}
+            if self._filters is not None:
+                admission_filter = self._filter_for(cache_key)
+                for text in texts:
+                    admission_filter.record(text)
+
+            lang_cache = self._cache.get(cache_key)
+            if lang_cache is None:
+                return found
+
+            now = time.monotonic()
+            for text in texts:
+                entry = lang_cache.get(text)
+                if entry is None:
+                    continue
+
+                translation, expires_at, size = entry
+                if expires_at is not None and expires_at <= now:
+                    del lang_cache[text]
+                    self._bytes[cache_key] -= size
+                    continue
+
+                # Mark as most recently used
+                lang_cache.move_to_end(text)
+                found[text] = translation
 
-            # Check if we need to evict old entries
-            if len(self._cache[cache_key]) >= self._max_size:
-                # Remove first entry (FIFO)
-                oldest_key = next(iter(self._cache[cache_key]))
-                del self._cache[cache_key][oldest_key]
+        return found
 
-            self._cache[cache_key][text] = translation
+    def set(
+        self,
+        text: str,
+        translation: str,
+        source_lang: str,
+        target_lang: str,
+        ttl: Optional[float] = None,
+    ):
+        """Store translation in cache
+
+        Args:
+            ttl: Time-to-live in seconds for this entry (defaults to the
+                cache-wide ttl)
+        """
+        cache_key = self._get_cache_key(source_lang, target_lang)
+
+        with self._lock:
+            self._insert(cache_key, text, translation, ttl)
+            self._evict(cache_key)
 
     def set_batch(
-        self, translations: Dict[str, str], source_lang: str, target_lang: str
+        self,
+        translations: Dict[str, str],
+        source_lang: str,
+        target_lang: str,
+        ttl: Optional[float] = None,
     ):
         """Store multiple translations in cache"""
         cache_key = self._get_cache_key(source_lang, target_lang)
 
         with self._lock:
-            if cache_key not in self._cache:
-                self._cache[cache_key] = {}
+            for text, translation in translations.items():
+                self._insert(cache_key, text, translation, ttl)
+                self._evict(cache_key)
+
+    def _insert(
+        self, cache_key: str, text: str, translation: str, ttl: Optional[float]
+    ) -> None:
+        """Insert or replace an entry as most recently used (lock held)"""
+        lang_cache = self._cache.get(cache_key)
+        if lang_cache is None:
+            lang_cache = self._cache[cache_key] = OrderedDict()
+            self._bytes[cache_key] = 0
+
+        previous = lang_cache.pop(text, None)
+        if previous is not None:
+            self._bytes[cache_key] -= previous[2]
+
+        size = _entry_size(text, translation)
+        if self._max_bytes is not None and size > self._max_bytes:
+            # Would evict everything else and still not fit
+            return
+
+        if (
+            previous is None
+            and self._filters is not None
+            and not self._admit(cache_key, text, size)
+        ):
+            self._rejections += 1
+            return
 
-            # Check if we need to evict old entries
-            while len(self._cache[cache_key]) + len(translations) > self._max_size:
-                # Remove first entry (FIFO)
-                oldest_key = next(iter(self._cache[cache_key]))
-                del self._cache[cache_key][oldest_key]
+        ttl = self._ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
 
-            self._cache[cache_key].update(translations)
+        lang_cache[text] = (translation, expires_at, size)
+        self._bytes[cache_key] += size
+
+    def _filter_for(self, cache_key: str) -> TinyLFU:
+        """Get the admission filter for a language pair (lock held)"""
+        admission_filter = self._filters.get(cache_key)
+        if admission_filter is None:
+            admission_filter = self._filters[cache_key] = TinyLFU(self._max_size)
+        return admission_filter
+
+    def _admit(self, cache_key: str, text: str, size: int) -> bool:
+        """Decide whether a new entry may displace the LRU entry (lock held)"""
+        lang_cache = self._cache[cache_key]
+        is_full = len(lang_cache) >= self._max_size or (
+            self._max_bytes is not None
+            and self._bytes[cache_key] + size > self._max_bytes
+        )
+        if not is_full or not lang_cache:
+            return True
+
+        victim = next(iter(lang_cache))
+        return self._filter_for(cache_key).admit(text, victim)
+
+    def _evict(self, cache_key: str) -> None:
+        """Evict least recently used entries over the limits (lock held)"""
+        lang_cache = self._cache[cache_key]
+
+        while len(lang_cache) > self._max_size or (
+            self._max_bytes is not None and self._bytes[cache_key] > self._max_bytes
+        ):
+            _, (_, _, size) = lang_cache.popitem(last=False)
+            self._bytes[cache_key] -= size
+            self._evictions += 1
 
     def clear(
         self, source_lang: Optional[str] = None, target_lang: Optional[str] = None
@@ -87,10 +258,179 @@ class TranslationCache:
             if source_lang and target_lang:
                 cache_key = self._get_cache_key(source_lang, target_lang)
                 self._cache.pop(cache_key, None)
+                self._bytes.pop(cache_key, None)
             else:
                 self._cache.clear()
+                self._bytes.clear()
+
+    def purge_expired(self) -> int:
+        """Remove expired entries from every language pair
+
+        Expired entries are otherwise dropped lazily when they are read or
+        evicted. Returns the number of entries removed.
+        """
+        now = time.monotonic()
+        removed = 0
+
+        with self._lock:
+            for cache_key, lang_cache in self._cache.items():
+                expired = [
+                    text
+                    for text, (_, expires_at, _) in lang_cache.items()
+                    if expires_at is not None and expires_at <= now
+                ]
+                for text in expired:
+                    self._bytes[cache_key] -= lang_cache.pop(text)[2]
+                removed += len(expired)
+
+        return removed
 
     def size(self) -> int:
         """Get total number of cached translations"""
         with self._lock:
             return sum(len(lang_cache) for lang_cache in self._cache.values())
+
+    def size_bytes(self) -> int:
+        """Get approximate memory used by cached keys and values"""
+        with self._lock:
+            return sum(self._bytes.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            return {
+                "entries": sum(len(lang_cache) for lang_cache in self._cache.values()),
+                "bytes": sum(self._bytes.values()),
+                "evictions": self._evictions,
+                "rejections": self._rejections,
+                "language_pairs": len(self._cache),
+            }
+
+
+class ShardedTranslationCache:
+    """Translation cache split into independently locked shards
+
+    Texts are assigned to one of ``shards`` TranslationCache instances by
+    hash, so threads looking up different strings rarely contend on the same
+    lock. Offers the same interface as TranslationCache and can be installed
+    with ``set_global_cache``. Size and memory limits are divided evenly
+    between the shards, so eviction is LRU within each shard.
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        max_size: int = 10000,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        admission: Optional[str] = None,
+    ):
+        """
+        Initialize sharded translation cache
+
+        Args:
+            shards: Number of independently locked shards
+            max_size: Maximum number of translations to cache per language pair
+            ttl: Default time-to-live in seconds for cached translations
+            max_bytes: Maximum memory in bytes used by keys and values per
+                language pair (None for no limit). Each shard gets
+                ``max_bytes / shards``, and a translation larger than one
+                shard's share is never cached, even if the others have room
+            admission: Admission policy applied by each shard ("tinylfu")
+        """
+        if shards < 1:
+            raise ConfigurationError("shards must be positive")
+
+        shard_size = -(-max_size // shards)
+        shard_bytes = -(-max_bytes // shards) if max_bytes is not None else None
+
+        self._shards = [
+            TranslationCache(
+                max_size=shard_size,
+                ttl=ttl,
+                max_bytes=shard_bytes,
+                admission=admission,
+            )
+            for _ in range(shards)
+        ]
+
+    def _shard(self, text: str) -> TranslationCache:
+        return self._shards[hash(text) % len(self._shards)]
+
+    def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Get translation from cache"""
+        return self._shard(text).get(text, source_lang, target_lang)
+
+    def get_many(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Get translations of several distinct texts, one lock round per shard"""
+        by_shard: Dict[int, List[str]] = {}
+        for text in texts:
+            by_shard.setdefault(hash(text) % len(self._shards), []).append(text)
+
+        found: Dict[str, str] = {}
+        for index, shard_texts in by_shard.items():
+            found.update(
+                self._shards[index].get_many(shard_texts, source_lang, target_lang)
+            )
+        return found
+
+    def set(
+        self,
+        text: str,
+        translation: str,
+        source_lang: str,
+        target_lang: str,
+        ttl: Optional[float] = None,
+    ):
+        """Store translation in cache"""
+        self._shard(text).set(text, translation, source_lang, target_lang, ttl)
+
+    def set_batch(
+        self,
+        translations: Dict[str, str],
+        source_lang: str,
+        target_lang: str,
+        ttl: Optional[float] = None,
+    ):
+        """Store multiple translations in cache, one lock round per shard"""
+        by_shard: Dict[int, Dict[str, str]] = {}
+        for text, translation in translations.items():
+            index = hash(text) % len(self._shards)
+            by_shard.setdefault(index, {})[text] = translation
+
+        for index, shard_translations in by_shard.items():
+            self._shards[index].set_batch(
+                shard_translations, source_lang, target_lang, ttl
+            )
+
+    def clear(
+        self, source_lang: Optional[str] = None, target_lang: Optional[str] = None
+    ):
+        """Clear cache for specific language pair or all"""
+        for shard in self._shards:
+            shard.clear(source_lang, target_lang)
+
+    def purge_expired(self) -> int:
+        """Remove expired entries from every shard"""
+        return sum(shard.purge_expired() for shard in self._shards)
+
+    def size(self) -> int:
+        """Get total number of cached translations"""
+        return sum(shard.size() for shard in self._shards)
+
+    def size_bytes(self) -> int:
+        """Get approximate memory used by cached keys and values"""
+        return sum(shard.size_bytes() for shard in self._shards)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics aggregated over all shards"""
+        shard_stats = [shard.stats() for shard in self._shards]
+        totals = {
+            key: sum(stats[key] for stats in shard_stats)
+            for key in ("entries", "bytes", "evictions", "rejections")
+        }
+        totals["language_pairs"] = max(stats["language_pairs"] for stats in shard_stats)
+        totals["shards"] = len(self._shards)
+        return totals
@@ -0,0 +1,360 @@
+"""Index of existing server translations per language pair"""
+
+import logging
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+
+# Average number of hashes per bucket of a CompactCatalog
+_BUCKET_SIZE = 8
+
+
+def _entry_size(hash_key: str, translation: str) -> int:
+    return sys.getsizeof(hash_key) + sys.getsizeof(translation)
+
+
+def _catalog_size(translations: Mapping) -> int:
+    """Approximate memory used by a hash to translation map"""
+    if isinstance(translations, CompactCatalog):
+        return translations.nbytes
+    return sys.getsizeof(translations) + sum(
+        _entry_size(hash_key, translation)
+        for hash_key, translation in translations.items()
+    )
+
+
+def _int32_key(hash_key: str) -> Optional[int]:
+    """Get the integer a hash key is the decimal form of, if it fits in 32 bits"""
+    try:
+        value = int(hash_key)
+    except (TypeError, ValueError):
+        return None
+    if _INT32_MIN <= value <= _INT32_MAX and str(value) == hash_key:
+        return value
+    return None
+
+
+class CompactCatalog(Mapping):
+    """Read-only hash to translation map using a few bytes per entry
+
+    Hashes are stored as a sorted ``array('i')`` and translations as one
+    UTF-8 blob with an offset table, so an entry costs about 8 bytes plus
+    its encoded text instead of two Python strings and a dict slot. A table
+    of bucket boundaries indexed by the top bits of the hash narrows each
+    lookup to a few entries, which are binary-searched; translations are
+    decoded on access.
+
+    Keys that are not the decimal form of a signed 32-bit integer are kept
+    in a regular dict.
+    """
+
+    __slots__ = ("_hashes", "_offsets", "_blob", "_buckets", "_shift", "_other")
+
+    def __init__(self, translations: Mapping):
+        """
+        Args:
+            translations: Hash to translation map to copy
+        """
+        entries = []
+        other = {}
+        for hash_key, translation in translations.items():
+            value = _int32_key(hash_key)
+            if value is None:
+                other[hash_key] = translation
+            else:
+                entries.append((value, translation.encode("utf-8")))
+        entries.sort()
+
+        encoded = [translation for _, translation in entries]
+        self._blob = b"".join(encoded)
+        self._offsets = array("I" if len(self._blob) < 2**32 else "Q", [0])
+        position = 0
+        for translation in encoded:
+            position += len(translation)
+            self._offsets.append(position)
+        del encoded
+
+        hashes = array("i", [value for value, _ in entries])
+        del entries
+        bits = min(16, (len(hashes) // _BUCKET_SIZE).bit_length())
+        self._shift = 32 - bits
+        self._buckets = array(
+            "I",
+            (
+                bisect_left(hashes, (bucket << self._shift) + _INT32_MIN)
+                for bucket in range(2**bits + 1)
+            ),
+        )
+        self._hashes = hashes
+        self._other = other
+
+    def _find(self, value: int) -> int:
+        """Get the position of a hash, or -1"""
+        bucket = (value - _INT32_MIN) >> self._shift
+        end = self._buckets[bucket + 1]
+        index = bisect_left(self._hashes, value, self._buckets[bucket], end)
+        if index < end and self._hashes[index] == value:
+            return index
+        return -1
+
+    def _decode(self, index: int) -> str:
+        offsets = self._offsets
+        return self._blob[offsets[index] : offsets[index + 1]].decode("utf-8")
+
+    def get(self, hash_key: str, default: Any = None) -> Any:
+        value = _int32_key(hash_key)
+        if value is None:
+            return self._other.get(hash_key, default)
+
+        index = self._find(value)
+        return self._decode(index) if index >= 0 else default
+
+    def __getitem__(self, hash_key: str) -> str:
+        value = _int32_key(hash_key)
+        if value is None:
+            return self._other[hash_key]
+
+        index = self._find(value)
+        if index < 0:
+            raise KeyError(hash_key)
+        return self._decode(index)
+
+    def __contains__(self, hash_key: object) -> bool:
+        value = _int32_key(hash_key)
+        if value is None:
+            return hash_key in self._other
+        return self._find(value) >= 0
+
+    def __len__(self) -> int:
+        return len(self._hashes) + len(self._other)
+
+    def __iter__(self) -> Iterator[str]:
+        for value in self._hashes:
+            yield str(value)
+        yield from self._other
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used, in bytes"""
+        return (
+            sys.getsizeof(self._hashes)
+            + sys.getsizeof(self._offsets)
+            + sys.getsizeof(self._buckets)
+            + sys.getsizeof(self._blob)
+            + (_catalog_size(self._other) if self._other else 0)
+        )
+
+
+class _Catalog:
+    """Translations of one language pair and the validators to refresh them"""
+
+    __slots__ = ("source", "target", "translations", "size", "etag", "cursor")
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        translations: Mapping,
+        etag: Optional[str],
+        cursor: Optional[Any],
+    ):
+        self.source = source
+        self.target = target
+        self.translations = translations
+        self.size = _catalog_size(translations)
+        self.etag = etag
+        self.cursor = cursor
+
+
+class CatalogIndex:
+    """Thread-safe index of server translations keyed by text hash
+
+    Each language pair is loaded separately. When more than ``max_locales``
+    pairs are loaded, the least recently used one is dropped and will be
+    loaded again on its next use.
+
+    Alongside the translations, each pair keeps the ``ETag`` and sync cursor
+    of the response it came from so it can be refreshed incrementally.
+
+    With ``compact=True`` translations are stored as ``CompactCatalog``
+    objects, which take a fraction of the memory of a dict at the cost of
+    slower lookups and of rebuilding the pair on every incremental update.
+    """
+
+    def __init__(
+        self,
+        max_locales: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        compact: bool = False,
+    ):
+        """
+        Initialize catalog index
+
+        Args:
+            max_locales: Maximum number of language pairs kept in memory
+                (None for no limit)
+            max_entries: Maximum number of translations kept per language
+                pair (None for no limit)
+            compact: Store translations as ``CompactCatalog`` objects
+        """
+        self._catalogs: "OrderedDict[str, _Catalog]" = OrderedDict()
+        self._max_locales = max_locales
+        self._max_entries = max_entries
+        self._compact = compact
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _get_key(self, source_lang: str, target_lang: str) -> str:
+        """Generate index key for language pair"""
+        return f"{source_lang}:{target_lang}"
+
+    def _truncate(
+        self, translations: Dict[str, str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Keep at most max_entries translations"""
+        if self._max_entries is None or len(translations) <= self._max_entries:
+            return translations
+
+        logger.warning(
+            f"Server has {len(translations)} translations for "
+            f"{source_lang}:{target_lang}, keeping the first {self._max_entries}"
+        )
+        return dict(islice(translations.items(), self._max_entries))
+
+    def is_loaded(self, source_lang: str, target_lang: str) -> bool:
+        """Whether translations for the language pair have been loaded"""
+        return self._get_key(source_lang, target_lang) in self._catalogs
+
+    def get(self, source_lang: str, target_lang: str) -> Optional[Mapping]:
+        """Get the hash to translation map for a language pair, if loaded"""
+        key = self._get_key(source_lang, target_lang)
+
+        with self._lock:
+            catalog = self._catalogs.get(key)
+            if catalog is None:
+                return None
+            self._catalogs.move_to_end(key)
+            return catalog.translations
+
+    def validators(
+        self, source_lang: str, target_lang: str
+    ) -> Tuple[Optional[str], Optional[Any]]:
+        """Get the ETag and sync cursor of a loaded language pair"""
+        catalog = self._catalogs.get(self._get_key(source_lang, target_lang))
+        if catalog is None:
+            return None, None
+        return catalog.etag, catalog.cursor
+
+    def pairs(self) -> List[Tuple[str, str]]:
+        """Get the loaded language pairs"""
+        with self._lock:
+            return [(c.source, c.target) for c in self._catalogs.values()]
+
+    def load(
+        self,
+        translations: Dict[str, str],
+        source_lang: str,
+        target_lang: str,
+        etag: Optional[str] = None,
+        cursor: Optional[Any] = None,
+    ) -> None:
+        """Replace the translations of a language pair"""
+        translations = self._truncate(translations, source_lang, target_lang)
+        if self._compact:
+            translations = CompactCatalog(translations)
+        key = self._get_key(source_lang, target_lang)
+        catalog = _Catalog(source_lang, target_lang, translations, etag, cursor)
+
+        with self._lock:
+            self._catalogs[key] = catalog
+            self._catalogs.move_to_end(key)
+
+            while (
+                self._max_locales is not None
+                and len(self._catalogs) > self._max_locales
+            ):
+                self._catalogs.popitem(last=False)
+                self._evictions += 1
+
+    def merge(
+        self,
+        changed: Dict[str, str],
+        deleted: Iterable[str],
+        source_lang: str,
+        target_lang: str,
+        etag: Optional[str] = None,
+        cursor: Optional[Any] = None,
+    ) -> bool:
+        """Apply an incremental update to a loaded language pair
+
+        Only the changed and deleted hashes are touched, so the cost is
+        proportional to the size of the update (compact pairs are rebuilt).
+
+        Returns:
+            False if the pair is not loaded (the update was not applied)
+        """
+        key = self._get_key(source_lang, target_lang)
+
+        with self._lock:
+            catalog = self._catalogs.get(key)
+            if catalog is None:
+                return False
+
+            translations = catalog.translations
+            if isinstance(translations, CompactCatalog):
+                translations = dict(translations)
+            for hash_key in deleted:
+                previous = translations.pop(hash_key, None)
+                if previous is not None:
+                    catalog.size -= _entry_size(hash_key, previous)
+
+            for hash_key, translation in changed.items():
+                previous = translations.get(hash_key)
+                if previous is not None:
+                    catalog.size -= _entry_size(hash_key, previous)
+                elif (
+                    self._max_entries is not None
+                    and len(translations) >= self._max_entries
+                ):
+                    continue
+                translations[hash_key] = translation
+                catalog.size += _entry_size(hash_key, translation)
+
+            if translations is not catalog.translations:
+                catalog.translations = CompactCatalog(translations)
+                catalog.size = _catalog_size(catalog.translations)
+            catalog.etag = etag
+            catalog.cursor = cursor
+            return True
+
+    def clear(self) -> None:
+        """Forget all loaded translations"""
+        with self._lock:
+            self._catalogs.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get entries and approximate memory used per language pair"""
+        with self._lock:
+            locales = {
+                key: {"entries": len(catalog.translations), "bytes": catalog.size}
+                for key, catalog in self._catalogs.items()
+            }
+            evictions = self._evictions
+
+        return {
+            "entries": sum(locale["entries"] for locale in locales.values()),
+            "bytes": sum(locale["bytes"] for locale in locales.values()),
+            "evictions": evictions,
+            "locales": locales,
+        }
@@ -10,10 +10,12 @@ class AutoLocaliseError(Exception):
 class APIError(AutoLocaliseError):
     """Raised when API returns an error response"""
 
-    def __init__(self, message, status_code=None, response_data=None):
+    def __init__(self, message, status_code=None, response_data=None, retry_after=None):
         super().__init__(message)
         self.status_code = status_code
         self.response_data = response_data
+        # Seconds the server asked us to wait before retrying (Retry-After)
+        self.retry_after = retry_after
 
 
 class NetworkError(AutoLocaliseError):
@@ -22,6 +24,12 @@ class NetworkError(AutoLocaliseError):
     pass
 
 
+class CircuitOpenError(NetworkError):
+    """Raised when a request is not sent because the circuit breaker is open"""
+
+    pass
+
+
 class ConfigurationError(AutoLocaliseError):
     """Raised when SDK is misconfigured"""
 
@@ -0,0 +1,119 @@
+"""Text hashing compatible with the React SDK"""
+
+import threading
+from operator import mul
+from typing import Dict, Iterable, List
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_MASK32 = 0xFFFFFFFF
+
+# Number of recently hashed texts remembered per process
+HASH_MEMO_SIZE = 8192
+
+# Batches with at least this many characters are hashed with NumPy
+NUMPY_MIN_CHARS = 2048
+
+# _POWERS[k] == 31 ** k mod 2 ** 32, extended on demand
+_POWERS: List[int] = [1]
+
+_memo: Dict[str, str] = {}
+_memo_lock = threading.Lock()
+
+
+def _powers(count: int) -> List[int]:
+    """Return at least count powers of 31 modulo 2 ** 32"""
+    if len(_POWERS) < count:
+        power = _POWERS[-1]
+        extension = []
+        for _ in range(count - len(_POWERS)):
+            power = (power * 31) & _MASK32
+            extension.append(power)
+        # A single extend keeps concurrent readers consistent
+        _POWERS.extend(extension)
+    return _POWERS
+
+
+def _to_signed(value: int) -> str:
+    """Format an unsigned 32-bit value as a signed 32-bit integer"""
+    if value > 0x7FFFFFFF:
+        value -= 0x100000000
+    return str(value)
+
+
+def _hash(text: str) -> str:
+    # The React SDK computes h = h * 31 + c for every character c, so
+    # h = sum(c[i] * 31 ** (n - 1 - i)) mod 2 ** 32. Evaluating the sum with
+    # map() keeps the per-character work in C.
+    codes = memoryview(text.encode("utf-32-le", "surrogatepass")).cast("I")
+    return _to_signed(sum(map(mul, reversed(codes), _powers(len(codes)))) & _MASK32)
+
+
+def _hash_batch_numpy(texts: List[str]) -> List[str]:
+    """Hash non-empty texts with one vectorized pass over all characters"""
+    lengths = numpy.fromiter(map(len, texts), dtype=numpy.int64, count=len(texts))
+    ends = numpy.cumsum(lengths)
+    total = int(ends[-1])
+
+    encoded = "".join(texts).encode("utf-32-le", "surrogatepass")
+    codes = numpy.frombuffer(encoded, dtype="<u4").astype(numpy.uint64)
+
+    # Exponent of 31 for each character: distance to the end of its text
+    exponents = numpy.repeat(ends, lengths) - 1 - numpy.arange(total)
+    powers = numpy.array(_powers(int(lengths.max())), dtype=numpy.uint64)
+
+    # uint64 arithmetic wraps modulo 2 ** 64, which preserves the low 32 bits
+    sums = numpy.add.reduceat(codes * powers[exponents], ends - lengths)
+    signed = (sums & numpy.uint64(_MASK32)).astype(numpy.uint32).view(numpy.int32)
+    return [str(value) for value in signed.tolist()]
+
+
+def _remember(text: str, key: str) -> None:
+    with _memo_lock:
+        if len(_memo) >= HASH_MEMO_SIZE:
+            # Drop the oldest entry
+            del _memo[next(iter(_memo))]
+        _memo[text] = key
+
+
+def text_hash(text: str) -> str:
+    """Hash text to the signed 32-bit string key used by the API
+
+    Results are memoized, so a text looked up and then sent for translation
+    is only hashed once.
+    """
+    key = _memo.get(text)
+    if key is None:
+        key = _hash(text)
+        _remember(text, key)
+    return key
+
+
+def hash_texts(texts: Iterable[str]) -> List[str]:
+    """Hash many texts, returning their keys in order
+
+    Texts that are not memoized are hashed together with NumPy when it is
+    installed and the batch is large enough.
+    """
+    texts = list(texts)
+    keys = [_memo.get(text) for text in texts]
+
+    missing = [i for i, key in enumerate(keys) if key is None and texts[i]]
+    if not missing:
+        return [key if key is not None else "0" for key in keys]
+
+    pending = [texts[i] for i in missing]
+    if numpy is not None and sum(map(len, pending)) >= NUMPY_MIN_CHARS:
+        computed = _hash_batch_numpy(pending)
+    else:
+        computed = [_hash(text) for text in pending]
+
+    for i, text, key in zip(missing, pending, computed):
+        keys[i] = key
+        _remember(text, key)
+
+    # Empty texts hash to 0
+    return [key if key is not None else "0" for key in keys]
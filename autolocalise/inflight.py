@@ -0,0 +1,139 @@
+"""Registry of translations currently being fetched from the API"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Tuple
+
+InFlightKey = Tuple[str, str, str]
+
+# Global shared registry instance
+_global_registry = None
+_global_registry_lock = threading.Lock()
+
+
+def get_inflight_registry():
+    """Get or create the global shared in-flight registry"""
+    global _global_registry
+    if _global_registry is None:
+        with _global_registry_lock:
+            if _global_registry is None:
+                _global_registry = InFlightRegistry()
+    return _global_registry
+
+
+def running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the event loop running in the current thread, if any"""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class InFlightRegistry:
+    """Single-flight coordination for concurrent identical cache misses
+
+    The first caller to miss on a (text, source, target) key becomes its
+    owner and fetches the translation; concurrent callers missing on the same
+    key wait on the owner's future instead of sending a duplicate request.
+    Futures resolve to the translation, or ``None`` when the owner failed.
+
+    Owners that are coroutines record their event loop, so that callers
+    blocking that loop's thread can avoid waiting on them (see ``owned_on``).
+    """
+
+    def __init__(self):
+        self._pending: Dict[InFlightKey, Future] = {}
+        self._loops: Dict[Future, asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+
+    def claim(
+        self,
+        texts: Iterable[str],
+        source_lang: str,
+        target_lang: str,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Tuple[List[str], Dict[str, Future]]:
+        """
+        Claim ownership of the given cache misses
+
+        Args:
+            texts: Texts that missed the cache
+            source_lang: Source language code
+            target_lang: Target language code
+            loop: Event loop the caller fetches on, for coroutine callers
+
+        Returns:
+            Tuple of the texts the caller now owns and must fetch, and futures
+            for texts already being fetched by another caller
+        """
+        owned = []
+        waiting = {}
+
+        with self._lock:
+            # dict.fromkeys de-duplicates so a caller never waits on itself
+            for text in dict.fromkeys(texts):
+                key = (text, source_lang, target_lang)
+                future = self._pending.get(key)
+                if future is None:
+                    future = self._pending[key] = Future()
+                    if loop is not None:
+                        self._loops[future] = loop
+                    owned.append(text)
+                else:
+                    waiting[text] = future
+
+        return owned, waiting
+
+    def release(
+        self,
+        texts: Iterable[str],
+        translations: Dict[str, str],
+        source_lang: str,
+        target_lang: str,
+    ) -> None:
+        """
+        Publish results for owned texts and wake up waiting callers
+
+        Args:
+            texts: Texts previously returned as owned by ``claim``
+            translations: Translations fetched for those texts
+            source_lang: Source language code
+            target_lang: Target language code
+        """
+        with self._lock:
+            futures = [
+                (text, self._pending.pop((text, source_lang, target_lang), None))
+                for text in texts
+            ]
+            for _, future in futures:
+                self._loops.pop(future, None)
+
+        for text, future in futures:
+            if future is not None:
+                future.set_result(translations.get(text))
+
+    def owned_on(
+        self, futures: Dict[str, Future], loop: asyncio.AbstractEventLoop
+    ) -> List[str]:
+        """
+        Get the texts whose owner is a coroutine on the given event loop
+
+        A synchronous caller running on that loop's thread must not wait for
+        these: the owner cannot make progress while the loop is blocked.
+
+        Args:
+            futures: Futures returned by ``claim``, keyed by text
+            loop: Event loop running in the caller's thread
+        """
+        with self._lock:
+            return [
+                text
+                for text, future in futures.items()
+                if self._loops.get(future) is loop
+            ]
+
+    def pending(self) -> int:
+        """Get number of translations currently being fetched"""
+        with self._lock:
+            return len(self._pending)
@@ -0,0 +1,285 @@
+"""Adaptive concurrency and rate limiting for API requests"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from .exceptions import ConfigurationError
+
+# Responses telling the client to slow down
+_OVERLOAD_STATUSES = (429, 503)
+
+# Weight of a new latency sample in the baseline when it is above it
+_BASELINE_DECAY = 0.01
+
+# Shared limiters per API key
+_limiters: Dict[str, "RequestLimiter"] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_request_limiter(api_key: str) -> "RequestLimiter":
+    """Get or create the limiter shared by translators using an API key"""
+    limiter = _limiters.get(api_key)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(api_key)
+            if limiter is None:
+                limiter = _limiters[api_key] = RequestLimiter()
+    return limiter
+
+
+def set_request_limiter(api_key: str, limiter: Optional["RequestLimiter"]) -> None:
+    """Replace (or with None, forget) the limiter shared for an API key
+
+    Translators pick up the limiter when they are created, so call this
+    before constructing any translator, e.g. to add a rate limit::
+
+        set_request_limiter("your-api-key", RequestLimiter(rate=20))
+    """
+    with _limiters_lock:
+        if limiter is None:
+            _limiters.pop(api_key, None)
+        else:
+            _limiters[api_key] = limiter
+
+
+class _Waiter:
+    """A caller queued for a request slot"""
+
+    __slots__ = ("wake", "granted")
+
+    def __init__(self, wake: Callable[[], Any]):
+        self.wake = wake
+        self.granted = False
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class RequestLimiter:
+    """Limit concurrent API requests adaptively, with an optional rate limit
+
+    The concurrency limit follows AIMD (additive increase, multiplicative
+    decrease): every successful request that found the limit fully used
+    raises it by ``1 / limit`` (about one per round trip), while a 429/503
+    response or a latency above ``latency_tolerance`` times the baseline
+    (lowest recent) latency multiplies it by ``backoff_ratio``, at most once
+    per round trip. The limit therefore settles just below the point where
+    the API starts queueing or throttling.
+
+    With ``rate`` set, requests are also spaced by a token bucket allowing
+    ``rate`` requests per second and bursts of ``burst``.
+
+    Threads and asyncio tasks can share one limiter; callers wait in FIFO
+    order. Translators wait for a slot at most as long as a request would
+    take, and a sync call made on an event loop thread only takes a free
+    one, since the slots may be held by that loop's coroutines.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.5,
+    ):
+        """
+        Initialize request limiter
+
+        Args:
+            initial_limit: Concurrent requests allowed before any feedback
+            min_limit: Lowest concurrency limit
+            max_limit: Highest concurrency limit
+            rate: Maximum requests per second (None for no rate limit)
+            burst: Requests that may be sent at once after an idle period
+                (defaults to max(1, rate))
+            latency_tolerance: Latency relative to the baseline above which
+                the API is considered congested
+            backoff_ratio: Factor applied to the limit on congestion
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ConfigurationError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+
+        if rate is not None and rate <= 0:
+            raise ConfigurationError("rate must be positive")
+
+        if latency_tolerance <= 1 or not 0 < backoff_ratio < 1:
+            raise ConfigurationError(
+                "latency_tolerance must exceed 1 and backoff_ratio be in (0, 1)"
+            )
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(initial_limit)
+        self._inflight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._throttled = 0
+        self._decreases = 0
+
+        self.rate = rate
+        self._burst = burst if burst is not None else max(1, int(rate or 1))
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent requests allowed"""
+        return int(self._limit)
+
+    def _reserve_token(self) -> float:
+        """Take a token, returning how long to wait until it is available"""
+        if self.rate is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _try_enter(self) -> bool:
+        """Take a free slot if nobody is queued (lock held)"""
+        if not self._waiters and self._inflight < int(self._limit):
+            self._inflight += 1
+            return True
+        return False
+
+    def _grant(self) -> None:
+        """Hand free slots to queued callers (lock held)"""
+        while self._waiters and self._inflight < int(self._limit):
+            waiter = self._waiters.popleft()
+            try:
+                waiter.wake()
+            except RuntimeError:
+                # The waiter's event loop is closed
+                continue
+            waiter.granted = True
+            self._inflight += 1
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a request slot (and rate limit token)
+
+        Args:
+            timeout: Seconds to wait for a slot (None waits indefinitely,
+                0 only takes a free one)
+
+        Returns:
+            True if a slot was taken and must be released with ``release``
+        """
+        delay = self._reserve_token()
+        if delay:
+            time.sleep(delay)
+
+        with self._lock:
+            if self._try_enter():
+                return True
+            if timeout is not None and timeout <= 0:
+                return False
+            event = threading.Event()
+            waiter = _Waiter(event.set)
+            self._waiters.append(waiter)
+
+        if event.wait(timeout):
+            return True
+
+        with self._lock:
+            if waiter.granted:
+                return True
+            self._waiters.remove(waiter)
+            return False
+
+    async def acquire_async(self) -> None:
+        """Wait for a request slot without blocking the event loop"""
+        delay = self._reserve_token()
+        if delay:
+            await asyncio.sleep(delay)
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_enter():
+                return
+            future = loop.create_future()
+            waiter = _Waiter(lambda: loop.call_soon_threadsafe(_resolve, future))
+            self._waiters.append(waiter)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._inflight -= 1
+                    self._grant()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: Optional[float], status_code: Optional[int]) -> None:
+        """
+        Free a request slot and adjust the limit from the outcome
+
+        Args:
+            latency: Seconds the request took
+            status_code: HTTP status of the response (None if it failed
+                without one, which does not affect the limit)
+        """
+        with self._lock:
+            saturated = self._inflight >= int(self._limit)
+            self._inflight -= 1
+
+            if status_code in _OVERLOAD_STATUSES:
+                self._throttled += 1
+                self._decrease(latency)
+            elif status_code is not None and latency is not None:
+                if self._baseline is None or latency < self._baseline:
+                    self._baseline = latency
+                else:
+                    # Let the baseline follow a lasting latency increase
+                    self._baseline += (latency - self._baseline) * _BASELINE_DECAY
+
+                if latency > self._baseline * self.latency_tolerance:
+                    self._decrease(latency)
+                elif saturated:
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+            self._grant()
+
+    def _decrease(self, latency: Optional[float]) -> None:
+        """Back off multiplicatively, once per round trip (lock held)"""
+        now = time.monotonic()
+        if now - self._last_decrease < (latency or self._baseline or 0.0):
+            return
+
+        self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        self._last_decrease = now
+        self._decreases += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get limiter statistics"""
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "inflight": self._inflight,
+                "waiting": len(self._waiters),
+                "throttled": self._throttled,
+                "decreases": self._decreases,
+                "baseline_latency": self._baseline,
+            }
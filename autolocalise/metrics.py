@@ -0,0 +1,273 @@
+"""Counters and latency histograms for translation traffic"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .cache import get_global_cache
+
+# Upper bounds of the /v1/translate latency buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds of the texts-per-request buckets
+BATCH_SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Ways translate() resolves a text
+OUTCOMES = ("cache", "catalog", "store", "api", "shared", "fallback")
+
+_registry: Optional["MetricsRegistry"] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> "MetricsRegistry":
+    """Get or create the registry translators with collect_metrics record to"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
+
+
+def set_metrics_registry(registry: Optional["MetricsRegistry"]) -> None:
+    """Replace the shared registry (None starts a fresh one on next use)
+
+    Translators pick up the registry when they are created.
+    """
+    global _registry
+    with _registry_lock:
+        _registry = registry
+
+
+class _Histogram:
+    """Bucketed distribution of observed values"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        # One count per bound plus the +Inf bucket
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "bounds": list(self.bounds),
+            "counts": list(self.counts),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+class _PairMetrics:
+    """Metrics of one language pair"""
+
+    __slots__ = ("texts", "requests", "latency", "batch_size")
+
+    def __init__(self, latency_buckets, batch_buckets):
+        self.texts = dict.fromkeys(OUTCOMES, 0)
+        self.requests: Dict[str, int] = {}
+        self.latency = _Histogram(latency_buckets)
+        self.batch_size = _Histogram(batch_buckets)
+
+
+class MetricsRegistry:
+    """Thread-safe per-language-pair translation metrics
+
+    Records how texts passed to ``translate`` were resolved (``OUTCOMES``:
+    local cache, server catalog, persistent store, API, a request shared
+    with another caller, or fallback to the source text), the status of
+    each /v1/translate request, and histograms of request latency and
+    texts per request. Snapshots also include the statistics (evictions,
+    entries, bytes) of the global translation cache.
+
+    Repeated texts in one call are looked up and requested once, so each
+    distinct text in a call is counted once.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        batch_size_buckets: Sequence[float] = BATCH_SIZE_BUCKETS,
+    ):
+        """
+        Initialize metrics registry
+
+        Args:
+            latency_buckets: Upper bounds of the request latency histogram
+                in seconds, ascending
+            batch_size_buckets: Upper bounds of the texts-per-request
+                histogram, ascending
+        """
+        self._latency_buckets = tuple(latency_buckets)
+        self._batch_buckets = tuple(batch_size_buckets)
+        self._pairs: Dict[Tuple[str, str], _PairMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _pair(self, source_lang: str, target_lang: str) -> _PairMetrics:
+        """Get the metrics of a language pair; call with the lock held"""
+        pair = self._pairs.get((source_lang, target_lang))
+        if pair is None:
+            pair = self._pairs[(source_lang, target_lang)] = _PairMetrics(
+                self._latency_buckets, self._batch_buckets
+            )
+        return pair
+
+    def count_texts(self, source_lang: str, target_lang: str, **outcomes: int) -> None:
+        """Add to the number of texts resolved per outcome, e.g. ``cache=3``"""
+        with self._lock:
+            texts = self._pair(source_lang, target_lang).texts
+            for outcome, amount in outcomes.items():
+                if amount:
+                    texts[outcome] += amount
+
+    def observe_request(
+        self,
+        source_lang: str,
+        target_lang: str,
+        batch_size: int,
+        latency: float,
+        status_code: Optional[int],
+    ) -> None:
+        """
+        Record a /v1/translate request
+
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            batch_size: Number of texts sent
+            latency: Seconds until the response (or error) arrived
+            status_code: HTTP status, or None if no response was received
+        """
+        status = "error" if status_code is None else str(status_code)
+        with self._lock:
+            pair = self._pair(source_lang, target_lang)
+            pair.requests[status] = pair.requests.get(status, 0) + 1
+            pair.latency.observe(latency)
+            pair.batch_size.observe(batch_size)
+
+    def reset(self) -> None:
+        """Forget all recorded metrics"""
+        with self._lock:
+            self._pairs.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a copy of all metrics
+
+        Returns:
+            ``{"pairs": {"en:fr": {"texts", "requests", "latency",
+            "batch_size"}}, "cache": {...}}`` where histograms hold their
+            bucket bounds, per-bucket counts (the last one unbounded), sum
+            and count
+        """
+        with self._lock:
+            pairs = {
+                f"{source}:{target}": {
+                    "texts": dict(pair.texts),
+                    "requests": dict(pair.requests),
+                    "latency": pair.latency.snapshot(),
+                    "batch_size": pair.batch_size.snapshot(),
+                }
+                for (source, target), pair in self._pairs.items()
+            }
+
+        stats = getattr(get_global_cache(), "stats", None)
+        return {"pairs": pairs, "cache": stats() if stats is not None else {}}
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def header(name: str, kind: str, description: str) -> None:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        pairs = []
+        for key, pair in snapshot["pairs"].items():
+            source, target = key.split(":", 1)
+            pairs.append((_labels(source=source, target=target), pair))
+
+        header(
+            "autolocalise_texts_total",
+            "counter",
+            "Texts resolved by translate, by outcome",
+        )
+        for labels, pair in pairs:
+            for outcome, value in pair["texts"].items():
+                lines.append(
+                    f"autolocalise_texts_total{{{labels},"
+                    f"{_labels(outcome=outcome)}}} {value}"
+                )
+
+        header(
+            "autolocalise_requests_total",
+            "counter",
+            "Translation API requests, by HTTP status",
+        )
+        for labels, pair in pairs:
+            for status, value in pair["requests"].items():
+                lines.append(
+                    f"autolocalise_requests_total{{{labels},"
+                    f"{_labels(status=status)}}} {value}"
+                )
+
+        for name, key, description in (
+            (
+                "autolocalise_request_duration_seconds",
+                "latency",
+                "Translation API request latency",
+            ),
+            (
+                "autolocalise_request_texts",
+                "batch_size",
+                "Texts sent per translation API request",
+            ),
+        ):
+            header(name, "histogram", description)
+            for labels, pair in pairs:
+                lines.extend(_histogram_lines(name, labels, pair[key]))
+
+        cache = snapshot["cache"]
+        for stat, kind, description in (
+            ("entries", "gauge", "Translations in the global cache"),
+            ("bytes", "gauge", "Approximate memory used by the global cache"),
+            ("evictions", "counter", "Translations evicted from the global cache"),
+            ("rejections", "counter", "Translations refused by cache admission"),
+        ):
+            if stat in cache:
+                name = f"autolocalise_cache_{stat}"
+                if kind == "counter":
+                    name += "_total"
+                header(name, kind, description)
+                lines.append(f"{name} {cache[stat]}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _histogram_lines(name: str, labels: str, histogram: Dict[str, Any]) -> List[str]:
+    """Render a histogram snapshot as cumulative Prometheus buckets"""
+    lines = []
+    cumulative = 0
+    bounds = [repr(float(bound)) for bound in histogram["bounds"]] + ["+Inf"]
+    for bound, count in zip(bounds, histogram["counts"]):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram['sum']}")
+    lines.append(f"{name}_count{{{labels}}} {histogram['count']}")
+    return lines
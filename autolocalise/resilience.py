@@ -0,0 +1,182 @@
+"""Retries and circuit breaking for API requests"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+from .exceptions import APIError, ConfigurationError, NetworkError
+
+# Status codes worth retrying: rate limiting and temporary server failures
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds"""
+    if not isinstance(value, str):
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def is_transient(error: Exception, statuses: Tuple[int, ...] = RETRY_STATUSES) -> bool:
+    """Whether an error is likely to go away if the request is repeated"""
+    if isinstance(error, NetworkError):
+        return True
+    return isinstance(error, APIError) and error.status_code in statuses
+
+
+class RetryPolicy:
+    """Retry transient failures with exponentially growing, jittered delays
+
+    The delay before retry ``n`` (starting at 0) is drawn uniformly from
+    ``[0, min(max_backoff, backoff * 2 ** n)]`` ("full jitter"), so clients
+    that failed together do not retry together. A ``Retry-After`` sent with
+    a 429 or 503 response is honoured instead, up to ``max_retry_after``.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 10.0,
+        max_retry_after: float = 60.0,
+        statuses: Tuple[int, ...] = RETRY_STATUSES,
+    ):
+        """
+        Initialize retry policy
+
+        Args:
+            retries: Maximum number of retries after the first attempt
+            backoff: Base delay in seconds
+            max_backoff: Upper bound of the computed delay in seconds
+            max_retry_after: Upper bound in seconds for server-requested
+                Retry-After delays
+            statuses: HTTP status codes that are retried
+        """
+        if retries < 0 or backoff < 0 or max_backoff < 0:
+            raise ConfigurationError("Retry settings must not be negative")
+
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = tuple(statuses)
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """Whether to retry after the given failed attempt (0-based)"""
+        return attempt < self.retries and is_transient(error, self.statuses)
+
+    def delay(self, error: Exception, attempt: int) -> float:
+        """Seconds to wait before retrying the given failed attempt"""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+class CircuitBreaker:
+    """Stop sending requests after repeated transient failures
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    translators fall back to the source text immediately instead of
+    waiting for requests to time out. While it is open, one translator
+    probes the API in the background every ``reset_timeout`` seconds and
+    closes the circuit once a probe succeeds.
+
+    One breaker can be shared by several translators; if the probing one is
+    closed, the next one that finds the circuit open takes over.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds between recovery probes while open
+        """
+        if failure_threshold < 1 or reset_timeout <= 0:
+            raise ConfigurationError(
+                "failure_threshold and reset_timeout must be positive"
+            )
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._open = False
+        self._opened = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently being short-circuited"""
+        return self._open
+
+    def allow(self) -> bool:
+        """Whether a request may be sent"""
+        return not self._open
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit"""
+        with self._lock:
+            self._failures = 0
+            self._open = False
+
+    def record_failure(self) -> bool:
+        """
+        Record a transient failure
+
+        Returns:
+            True if this failure opened the circuit
+        """
+        with self._lock:
+            self._failures += 1
+            if self._open or self._failures < self.failure_threshold:
+                return False
+
+            self._open = True
+            self._opened += 1
+            return True
+
+    def start_probe(self) -> bool:
+        """
+        Claim the recovery probe of an open circuit
+
+        Returns:
+            True if the circuit is open and nobody probes it yet, in which
+            case the caller probes until it closes and then calls
+            ``end_probe``
+        """
+        with self._lock:
+            if not self._open or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def end_probe(self) -> None:
+        """Release the recovery probe claimed with ``start_probe``"""
+        with self._lock:
+            self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Get circuit breaker statistics"""
+        with self._lock:
+            return {
+                "state": "open" if self._open else "closed",
+                "failures": self._failures,
+                "opened": self._opened,
+            }
@@ -0,0 +1,411 @@
+"""Translation cache shared between processes through a memory-mapped file"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .exceptions import ConfigurationError
+
+_MAGIC = b"ALSHMC01"
+
+# magic, slots, arena size, arena used, entries, tombstones, evictions
+_HEADER = struct.Struct("<8sQQQQQQ")
+_HEADER_SIZE = 64
+
+# key hash (0 = empty, 1 = deleted), record offset, record length
+_SLOT = struct.Struct("<QII")
+
+# expiry timestamp (0 = never), key length, value length
+_RECORD = struct.Struct("<dII")
+
+_EMPTY = 0
+_DELETED = 1
+
+# Keep the hash table at most this full
+_LOAD_FACTOR = 0.75
+
+
+def _key_bytes(text: str, source_lang: str, target_lang: str) -> bytes:
+    return f"{source_lang}:{target_lang}\x00{text}".encode("utf-8")
+
+
+def _key_hash(key: bytes) -> int:
+    """Process-independent 64-bit hash (never one of the slot markers)"""
+    value = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+    return value if value > _DELETED else value + 2
+
+
+class SharedMemoryCache:
+    """Translation cache shared by every process that maps the same file
+
+    Entries live in a fixed-size open-addressing hash table plus an
+    append-only data area inside a memory-mapped file, so translations
+    learned by one worker are immediately visible to the others and memory
+    use does not grow with the number of workers. Put the file on a tmpfs
+    such as ``/dev/shm`` to keep it in RAM.
+
+    Offers the same interface as TranslationCache and can be installed with
+    ``set_global_cache``. The first process to create the file decides its
+    size; later processes adopt it. When the table or the data area is full
+    the whole cache is cleared and refilled (there is no per-entry LRU).
+    Server catalogs are not stored here; each worker keeps its own.
+
+    Access is serialised across processes with ``flock``, so it is only
+    available on Unix. The file is reopened automatically after ``fork``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 100000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Initialize shared memory cache
+
+        Args:
+            path: File backing the shared memory (created if missing)
+            max_size: Maximum number of translations across all language pairs
+            max_bytes: Size in bytes of the area holding keys and values
+            ttl: Default time-to-live in seconds for cached translations
+                (None keeps entries until the cache is cleared)
+        """
+        if fcntl is None:
+            raise ConfigurationError("SharedMemoryCache requires a Unix platform")
+
+        if max_size < 1 or max_bytes < 1:
+            raise ConfigurationError("max_size and max_bytes must be positive")
+
+        self.path = path
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+        slots = 16
+        while slots * _LOAD_FACTOR < max_size:
+            slots <<= 1
+
+        self._open(slots, max_bytes)
+
+    def _open(self, slots: int, arena_size: int) -> None:
+        """Map the file, creating and formatting it if necessary"""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            header = os.pread(fd, _HEADER.size, 0)
+
+            if len(header) == _HEADER.size and header[:8] == _MAGIC:
+                # Another process created the file first; adopt its geometry
+                _, slots, arena_size = _HEADER.unpack(header)[:3]
+                formatted = True
+            else:
+                os.ftruncate(fd, _HEADER_SIZE + slots * _SLOT.size + arena_size)
+                formatted = False
+
+            mapping = mmap.mmap(fd, _HEADER_SIZE + slots * _SLOT.size + arena_size)
+            if not formatted:
+                _HEADER.pack_into(mapping, 0, _MAGIC, slots, arena_size, 0, 0, 0, 0)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+        self._fd = fd
+        self._map = mapping
+        self._pid = os.getpid()
+        self._slots = slots
+        self._mask = slots - 1
+        self._max_entries = int(slots * _LOAD_FACTOR)
+        self._arena_start = _HEADER_SIZE + slots * _SLOT.size
+        self._arena_size = arena_size
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[mmap.mmap]:
+        """Hold the thread lock and the cross-process file lock"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # The descriptor and its lock are shared with the parent
+                # after fork, so open our own
+                self._map.close()
+                os.close(self._fd)
+                self._open(self._slots, self._arena_size)
+
+            fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield self._map
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _header(self) -> Tuple[int, int, int, int]:
+        """Read arena used, entries, tombstones and evictions (lock held)"""
+        return _HEADER.unpack_from(self._map, 0)[3:]
+
+    def _write_header(
+        self, arena_used: int, entries: int, tombstones: int, evictions: int
+    ) -> None:
+        struct.pack_into(
+            "<QQQQ", self._map, 24, arena_used, entries, tombstones, evictions
+        )
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER_SIZE + index * _SLOT.size
+
+    def _read_record(self, offset: int) -> Tuple[float, bytes, bytes]:
+        """Read expiry, key and value of the record at offset (lock held)"""
+        start = self._arena_start + offset
+        expires_at, key_length, value_length = _RECORD.unpack_from(self._map, start)
+        start += _RECORD.size
+        key = self._map[start : start + key_length]
+        value = self._map[start + key_length : start + key_length + value_length]
+        return expires_at, key, value
+
+    def _find(self, key: bytes, key_hash: int) -> Tuple[int, bool]:
+        """Find the slot for key (lock held)
+
+        Returns:
+            Tuple of the slot index and whether it holds key; when key is
+            missing the index is the first reusable slot
+        """
+        index = key_hash & self._mask
+        free = -1
+
+        for _ in range(self._slots):
+            slot_hash, offset, _ = _SLOT.unpack_from(
+                self._map, self._slot_offset(index)
+            )
+            if slot_hash == _EMPTY:
+                return (index if free < 0 else free), False
+            if slot_hash == _DELETED:
+                if free < 0:
+                    free = index
+            elif slot_hash == key_hash and self._read_record(offset)[1] == key:
+                return index, True
+            index = (index + 1) & self._mask
+
+        return free, False
+
+    def _delete_slot(self, index: int) -> None:
+        """Mark a slot as deleted (exclusive lock held)"""
+        arena_used, entries, tombstones, evictions = self._header()
+        _SLOT.pack_into(self._map, self._slot_offset(index), _DELETED, 0, 0)
+        self._write_header(arena_used, entries - 1, tombstones + 1, evictions)
+
+    def _delete_expired(self, keys: List[Tuple[bytes, int]]) -> None:
+        """Delete the entries of keys that are still expired (exclusive lock
+        held), keeping any fresh value another process wrote meanwhile"""
+        now = time.time()
+        for key, key_hash in keys:
+            index, found = self._find(key, key_hash)
+            if not found:
+                continue
+            offset = _SLOT.unpack_from(self._map, self._slot_offset(index))[1]
+            expires_at = self._read_record(offset)[0]
+            if expires_at and expires_at <= now:
+                self._delete_slot(index)
+
+    def _reset(self, evicted: int = 0) -> None:
+        """Empty the table and data area (exclusive lock held)"""
+        evictions = self._header()[3]
+        self._map[_HEADER_SIZE : self._arena_start] = bytes(self._slots * _SLOT.size)
+        self._write_header(0, 0, 0, evictions + evicted)
+
+    def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Get translation from cache"""
+        key = _key_bytes(text, source_lang, target_lang)
+        key_hash = _key_hash(key)
+
+        with self._locked(exclusive=False):
+            index, found = self._find(key, key_hash)
+            if not found:
+                return None
+
+            offset = _SLOT.unpack_from(self._map, self._slot_offset(index))[1]
+            expires_at, _, value = self._read_record(offset)
+
+        if expires_at and expires_at <= time.time():
+            with self._locked(exclusive=True):
+                self._delete_expired([(key, key_hash)])
+            return None
+
+        return value.decode("utf-8")
+
+    def get_many(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Get translations of several distinct texts under a single lock
+
+        Returns:
+            Translations of the texts that are cached
+        """
+        keys = []
+        for text in texts:
+            key = _key_bytes(text, source_lang, target_lang)
+            keys.append((text, key, _key_hash(key)))
+
+        values: Dict[str, bytes] = {}
+        expired = []
+        now = time.time()
+        with self._locked(exclusive=False):
+            for text, key, key_hash in keys:
+                index, found = self._find(key, key_hash)
+                if not found:
+                    continue
+
+                offset = _SLOT.unpack_from(self._map, self._slot_offset(index))[1]
+                expires_at, _, value = self._read_record(offset)
+                if expires_at and expires_at <= now:
+                    expired.append((key, key_hash))
+                else:
+                    values[text] = value
+
+        if expired:
+            with self._locked(exclusive=True):
+                self._delete_expired(expired)
+
+        return {text: value.decode("utf-8") for text, value in values.items()}
+
+    def set(
+        self,
+        text: str,
+        translation: str,
+        source_lang: str,
+        target_lang: str,
+        ttl: Optional[float] = None,
+    ):
+        """Store translation in cache
+
+        Args:
+            ttl: Time-to-live in seconds for this entry (defaults to the
+                cache-wide ttl)
+        """
+        self.set_batch({text: translation}, source_lang, target_lang, ttl)
+
+    def set_batch(
+        self,
+        translations: Dict[str, str],
+        source_lang: str,
+        target_lang: str,
+        ttl: Optional[float] = None,
+    ):
+        """Store multiple translations under a single lock"""
+        ttl = self._ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else 0.0
+
+        records = []
+        for text, translation in translations.items():
+            key = _key_bytes(text, source_lang, target_lang)
+            value = translation.encode("utf-8")
+            record = _RECORD.pack(expires_at, len(key), len(value)) + key + value
+            if len(record) <= self._arena_size:
+                records.append((key, _key_hash(key), record))
+
+        if not records:
+            return
+
+        with self._locked(exclusive=True):
+            for key, key_hash, record in records:
+                self._insert(key, key_hash, record)
+
+    def _insert(self, key: bytes, key_hash: int, record: bytes) -> None:
+        """Append a record and point its slot at it (exclusive lock held)"""
+        arena_used, entries, tombstones, evictions = self._header()
+
+        if (
+            arena_used + len(record) > self._arena_size
+            or entries + tombstones >= self._max_entries
+        ):
+            self._reset(evicted=entries)
+            arena_used, entries, tombstones, evictions = self._header()
+
+        index, found = self._find(key, key_hash)
+        if not found:
+            slot_hash = _SLOT.unpack_from(self._map, self._slot_offset(index))[0]
+            if slot_hash == _DELETED:
+                tombstones -= 1
+            entries += 1
+
+        start = self._arena_start + arena_used
+        self._map[start : start + len(record)] = record
+        _SLOT.pack_into(
+            self._map, self._slot_offset(index), key_hash, arena_used, len(record)
+        )
+        self._write_header(arena_used + len(record), entries, tombstones, evictions)
+
+    def _scan(self) -> Iterator[Tuple[int, float, bytes]]:
+        """Yield slot index, expiry and key of every entry (lock held)"""
+        for index in range(self._slots):
+            slot_hash, offset, _ = _SLOT.unpack_from(
+                self._map, self._slot_offset(index)
+            )
+            if slot_hash > _DELETED:
+                expires_at, key, _ = self._read_record(offset)
+                yield index, expires_at, key
+
+    def clear(
+        self, source_lang: Optional[str] = None, target_lang: Optional[str] = None
+    ):
+        """Clear cache for specific language pair or all"""
+        with self._locked(exclusive=True):
+            if source_lang and target_lang:
+                prefix = f"{source_lang}:{target_lang}\x00".encode("utf-8")
+                for index, _, key in list(self._scan()):
+                    if key.startswith(prefix):
+                        self._delete_slot(index)
+            else:
+                self._reset()
+
+    def purge_expired(self) -> int:
+        """Remove expired entries, returning the number removed"""
+        now = time.time()
+
+        with self._locked(exclusive=True):
+            expired = [
+                index
+                for index, expires_at, _ in self._scan()
+                if expires_at and expires_at <= now
+            ]
+            for index in expired:
+                self._delete_slot(index)
+
+        return len(expired)
+
+    def size(self) -> int:
+        """Get total number of cached translations"""
+        with self._locked(exclusive=False):
+            return self._header()[1]
+
+    def size_bytes(self) -> int:
+        """Get bytes used in the data area (including replaced entries)"""
+        with self._locked(exclusive=False):
+            return self._header()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics
+
+        Read from the header only, so metrics scrapes never scan the table
+        while other processes wait; unlike the in-process caches, there is
+        no ``language_pairs`` count.
+        """
+        with self._locked(exclusive=False):
+            arena_used, entries, _, evictions = self._header()
+
+        return {
+            "entries": entries,
+            "bytes": arena_used,
+            "evictions": evictions,
+            "rejections": 0,
+        }
+
+    def close(self) -> None:
+        """Unmap the file (it stays available to other processes)"""
+        with self._lock:
+            self._map.close()
+            os.close(self._fd)
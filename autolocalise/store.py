@@ -0,0 +1,322 @@
+"""Persistent translation stores shared between processes"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional
+
+# Stay well below SQLite's default limit of 999 bound parameters
+_MAX_QUERY_PARAMS = 500
+
+# Tables holding data of a language pair
+_TABLES = ("translations", "catalog_state", "catalog_entries")
+
+
+class _ConnectionHolder:
+    """Thread-local reference to a connection of the current process"""
+
+    __slots__ = ("connection", "pid", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.pid = os.getpid()
+
+
+def _release_connection(
+    store_ref: "weakref.ref[SQLiteStore]", connection: sqlite3.Connection, pid: int
+) -> None:
+    """Close the connection of a thread that exited"""
+    # A forked child must not close its parent's connections
+    if os.getpid() != pid:
+        return
+
+    store = store_ref()
+    if store is not None:
+        with store._connections_lock:
+            if connection not in store._connections:
+                return
+            store._connections.remove(connection)
+    connection.close()
+
+
+class SQLiteStore:
+    """Persistent translation store backed by SQLite in WAL mode
+
+    Used by translators as a read-through/write-through layer behind the
+    in-memory cache, so translations survive restarts and are shared by
+    every process on the host that opens the same file. WAL mode lets
+    readers proceed while another process writes; writers wait up to
+    ``timeout`` seconds for the database lock.
+
+    The last synced server translations of each language pair are saved
+    too, one row per hash, so a restarted translator can sync them
+    conditionally instead of downloading them again, and incremental
+    updates only write the rows that changed.
+
+    Each thread (and each forked process) gets its own connection, closed
+    when the thread exits.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Initialize SQLite translation store
+
+        Args:
+            path: Database file path (created if missing)
+            timeout: Seconds to wait for a lock held by another writer
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        with self._connection() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS translations (
+                    source TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    translation TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (source, target, text)
+                ) WITHOUT ROWID
+                """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS catalog_state (
+                    source TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    etag TEXT,
+                    cursor TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (source, target)
+                )
+                """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS catalog_entries (
+                    source TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    translation TEXT NOT NULL,
+                    PRIMARY KEY (source, target, hash)
+                ) WITHOUT ROWID
+                """)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection for the current thread and process"""
+        holder = getattr(self._local, "holder", None)
+        if holder is not None and holder.pid == os.getpid():
+            return holder.connection
+
+        # Connections must not be shared with a forked child, so a new one is
+        # opened whenever the process id changes
+        connection = sqlite3.connect(
+            self.path, timeout=self.timeout, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+
+        holder = _ConnectionHolder(connection)
+        # The thread's local storage, and so the holder, is released when
+        # the thread exits
+        weakref.finalize(
+            holder, _release_connection, weakref.ref(self), connection, holder.pid
+        )
+        self._local.holder = holder
+        with self._connections_lock:
+            self._connections.append(connection)
+        return connection
+
+    def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Get a stored translation"""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT translation FROM translations "
+                "WHERE source = ? AND target = ? AND text = ?",
+                (source_lang, target_lang, text),
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def get_many(
+        self, texts: Iterable[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Get stored translations for many texts
+
+        Returns:
+            Dictionary of the texts that were found and their translations
+        """
+        texts = list(dict.fromkeys(texts))
+        found = {}
+        connection = self._connection()
+
+        for start in range(0, len(texts), _MAX_QUERY_PARAMS):
+            chunk = texts[start : start + _MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                "SELECT text, translation FROM translations "
+                f"WHERE source = ? AND target = ? AND text IN ({placeholders})",
+                (source_lang, target_lang, *chunk),
+            )
+            found.update(rows)
+
+        return found
+
+    def set(self, text: str, translation: str, source_lang: str, target_lang: str):
+        """Store a translation"""
+        self.set_batch({text: translation}, source_lang, target_lang)
+
+    def set_batch(
+        self, translations: Dict[str, str], source_lang: str, target_lang: str
+    ):
+        """Store multiple translations in one transaction"""
+        if not translations:
+            return
+
+        now = time.time()
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO translations "
+                "(source, target, text, translation, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (source_lang, target_lang, text, translation, now)
+                    for text, translation in translations.items()
+                ],
+            )
+
+    def get_catalog(
+        self, source_lang: str, target_lang: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get the saved server translations of a language pair
+
+        Returns:
+            Dictionary with the hash-keyed ``translations`` and the ``etag``
+            and ``cursor`` they were synced with, or None if nothing is saved
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT etag, cursor FROM catalog_state WHERE source = ? AND target = ?",
+            (source_lang, target_lang),
+        ).fetchone()
+        if row is None:
+            return None
+
+        etag, cursor = row
+        translations = dict(
+            connection.execute(
+                "SELECT hash, translation FROM catalog_entries "
+                "WHERE source = ? AND target = ?",
+                (source_lang, target_lang),
+            )
+        )
+        return {
+            "translations": translations,
+            "etag": etag,
+            "cursor": json.loads(cursor) if cursor is not None else None,
+        }
+
+    def set_catalog(
+        self,
+        translations: Dict[str, str],
+        source_lang: str,
+        target_lang: str,
+        etag: Optional[str] = None,
+        cursor: Optional[Any] = None,
+    ):
+        """Replace the saved server translations of a language pair"""
+        with self._connection() as connection:
+            connection.execute(
+                "DELETE FROM catalog_entries WHERE source = ? AND target = ?",
+                (source_lang, target_lang),
+            )
+            self._write_catalog(
+                connection, translations, (), source_lang, target_lang, etag, cursor
+            )
+
+    def update_catalog(
+        self,
+        changed: Dict[str, str],
+        deleted: Iterable[str],
+        source_lang: str,
+        target_lang: str,
+        etag: Optional[str] = None,
+        cursor: Optional[Any] = None,
+    ):
+        """Apply an incremental update to the saved server translations
+
+        Only the changed and deleted hashes are written.
+        """
+        with self._connection() as connection:
+            self._write_catalog(
+                connection, changed, deleted, source_lang, target_lang, etag, cursor
+            )
+
+    def _write_catalog(
+        self,
+        connection: sqlite3.Connection,
+        changed: Dict[str, str],
+        deleted: Iterable[str],
+        source_lang: str,
+        target_lang: str,
+        etag: Optional[str],
+        cursor: Optional[Any],
+    ) -> None:
+        """Write catalog rows and validators (inside a transaction)"""
+        connection.executemany(
+            "DELETE FROM catalog_entries WHERE source = ? AND target = ? AND hash = ?",
+            [(source_lang, target_lang, hash_key) for hash_key in deleted],
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO catalog_entries "
+            "(source, target, hash, translation) VALUES (?, ?, ?, ?)",
+            [
+                (source_lang, target_lang, hash_key, translation)
+                for hash_key, translation in changed.items()
+            ],
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO catalog_state "
+            "(source, target, etag, cursor, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (
+                source_lang,
+                target_lang,
+                etag,
+                json.dumps(cursor) if cursor is not None else None,
+                time.time(),
+            ),
+        )
+
+    def clear(
+        self, source_lang: Optional[str] = None, target_lang: Optional[str] = None
+    ):
+        """Delete translations for a specific language pair or all"""
+        with self._connection() as connection:
+            if source_lang and target_lang:
+                for table in _TABLES:
+                    connection.execute(
+                        f"DELETE FROM {table} WHERE source = ? AND target = ?",
+                        (source_lang, target_lang),
+                    )
+            else:
+                for table in _TABLES:
+                    connection.execute(f"DELETE FROM {table}")
+
+    def size(self) -> int:
+        """Get total number of stored translations"""
+        row = self._connection().execute("SELECT COUNT(*) FROM translations")
+        return row.fetchone()[0]
+
+    def close(self) -> None:
+        """Close every connection opened by this process"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
@@ -0,0 +1,233 @@
+"""Incremental parsing of /v1/translations responses"""
+
+import codecs
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Dict, Iterable
+
+# Bytes read from the response per step
+CATALOG_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+# A complete "hash": "translation" entry and the character after it
+_STRING = r'"([^"\\]*(?:\\.[^"\\]*)*)"'
+_SIMPLE_ENTRY = re.compile(rf"\s*{_STRING}\s*:\s*{_STRING}\s*([,}}])")
+
+# Parser states
+_START = 0
+_KEY = 1  # top-level key after ","
+_COLON = 2
+_VALUE = 3
+_AFTER_VALUE = 4  # "," or "}"
+_ENTRY_KEY = 5  # translation hash after ","
+_ENTRY_COLON = 6
+_ENTRY_VALUE = 7
+_AFTER_ENTRY = 8  # "," or "}"
+_DONE = 9
+_FIRST_KEY = 10  # top-level key or "}"
+_FIRST_ENTRY_KEY = 11  # translation hash or "}"
+
+# Returned by _token when the buffer ends inside a token
+_MORE = object()
+
+# Characters that can follow a complete prefix of a JSON number
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+
+
+def _unescape(string: str) -> str:
+    """Decode the escape sequences of a JSON string's contents"""
+    return scanstring(string + '"', 0)[0]
+
+
+class CatalogStreamParser:
+    """Parse a /v1/translations body as it arrives
+
+    Bytes are pushed with ``feed`` (from a sync or async response stream);
+    entries of the top-level ``"translations"`` object go straight into
+    ``translations`` one by one, so neither the raw body nor a second copy
+    of the parsed catalog is ever held in memory. Other top-level fields
+    (``cursor``, ``delta``, ``deleted``...) are parsed whole.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = ""
+        self.translations: Dict[str, Any] = {}
+        self.fields: Dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the body"""
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(chunk)
+        self._pos = 0
+        self._parse(final=False)
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish parsing
+
+        Returns:
+            The parsed response, like ``response.json()``
+
+        Raises:
+            json.JSONDecodeError: If the body is not a complete JSON object
+        """
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._parse(final=True)
+
+        if self._state != _DONE or self._buffer[self._pos :].strip(_WHITESPACE):
+            raise json.JSONDecodeError(
+                "Incomplete translations response", self._buffer, self._pos
+            )
+
+        data = dict(self.fields)
+        if "translations" not in data:
+            data["translations"] = self.translations
+        return data
+
+    def _next_char(self) -> str:
+        """Skip whitespace and return the next character ("" if none)"""
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else ""
+
+    def _token(self, final: bool) -> Any:
+        """Decode the JSON value at the current position"""
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _MORE
+
+        if not final:
+            # Literals at the end of the buffer may continue
+            if end == len(self._buffer) and not isinstance(value, (str, list, dict)):
+                return _MORE
+            # raw_decode stops before a fraction or exponent it cannot finish
+            # yet, e.g. at "." in "12." or "e" in "12.5e"
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and self._buffer[end] in _NUMBER_CONTINUATION
+            ):
+                return _MORE
+
+        self._pos = end
+        return value
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char not in expected:
+            raise json.JSONDecodeError(
+                f"Expected one of {expected!r}", self._buffer, self._pos
+            )
+        self._pos += 1
+
+    def _parse_simple_entries(self) -> bool:
+        """Consume consecutive string entries with a regular expression
+
+        Returns:
+            True if any entry was consumed
+        """
+        match = _SIMPLE_ENTRY.match
+        buffer = self._buffer
+        translations = self.translations
+        start = pos = self._pos
+
+        entry = match(buffer, pos)
+        while entry is not None:
+            key, value, separator = entry.groups()
+            if "\\" in key:
+                key = _unescape(key)
+            if "\\" in value:
+                value = _unescape(value)
+            translations[key] = value
+            pos = entry.end()
+            if separator == "}":
+                self._state = _AFTER_VALUE
+                break
+            self._state = _ENTRY_KEY
+            entry = match(buffer, pos)
+
+        self._pos = pos
+        return pos != start
+
+    def _parse(self, final: bool) -> None:
+        translations = self.translations
+
+        while self._state != _DONE:
+            char = self._next_char()
+            if not char:
+                return
+
+            state = self._state
+            entry_key = state == _ENTRY_KEY or state == _FIRST_ENTRY_KEY
+            if entry_key and self._parse_simple_entries():
+                continue
+            if entry_key or state == _KEY or state == _FIRST_KEY:
+                # "}" may only close an empty object, not follow a ","
+                if char == "}" and state >= _FIRST_KEY:
+                    self._pos += 1
+                    self._state = _AFTER_VALUE if entry_key else _DONE
+                    continue
+                key = self._token(final) if char == '"' else None
+                if key is _MORE:
+                    return
+                if not isinstance(key, str):
+                    raise json.JSONDecodeError(
+                        "Expected a string key", self._buffer, self._pos
+                    )
+                self._key = key
+                self._state = _ENTRY_COLON if entry_key else _COLON
+
+            elif state == _ENTRY_VALUE:
+                value = self._token(final)
+                if value is _MORE:
+                    return
+                translations[self._key] = value
+                self._state = _AFTER_ENTRY
+
+            elif state == _AFTER_ENTRY:
+                self._expect(char, ",}")
+                self._state = _ENTRY_KEY if char == "," else _AFTER_VALUE
+
+            elif state == _ENTRY_COLON or state == _COLON:
+                self._expect(char, ":")
+                self._state = _ENTRY_VALUE if state == _ENTRY_COLON else _VALUE
+
+            elif state == _VALUE:
+                if self._key == "translations" and char == "{":
+                    self._pos += 1
+                    self.fields.pop("translations", None)
+                    self._state = _FIRST_ENTRY_KEY
+                    continue
+                value = self._token(final)
+                if value is _MORE:
+                    return
+                self.fields[self._key] = value
+                self._state = _AFTER_VALUE
+
+            elif state == _AFTER_VALUE:
+                self._expect(char, ",}")
+                self._state = _KEY if char == "," else _DONE
+
+            else:  # _START
+                self._expect(char, "{")
+                self._state = _FIRST_KEY
+
+
+def parse_catalog(chunks: Iterable[bytes]) -> Dict[str, Any]:
+    """Parse a /v1/translations body from an iterable of byte chunks"""
+    parser = CatalogStreamParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
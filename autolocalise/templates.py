@@ -0,0 +1,134 @@
+"""Parameter protection helpers for string.Template translation"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Mapping, Tuple
+
+# Find all $identifier and ${identifier} patterns in a template
+_VAR_PATTERN = re.compile(
+    r"\$(?P<named>[_a-z][_a-z0-9]*)|" r"\$\{(?P<braced>[_a-z][_a-z0-9]*)\}",
+    re.IGNORECASE,
+)
+
+# A $identifier directly followed by another word character is not replaced
+_WORD_CHAR = re.compile(r"\w")
+
+# Number of compiled templates and translated forms remembered
+TEMPLATE_CACHE_SIZE = 4096
+
+
+class CompiledTemplate:
+    """A template with its parameters replaced by placeholders
+
+    ``placeholders`` lists (placeholder, parameter name) pairs in the order
+    the parameters first appear in the template.
+    """
+
+    __slots__ = ("protected", "placeholders")
+
+    def __init__(self, protected: str, placeholders: Tuple[Tuple[str, str], ...]):
+        self.protected = protected
+        self.placeholders = placeholders
+
+    def render(self, translated_text: str, params: Mapping) -> str:
+        """Substitute parameter values into the translated template"""
+        if not self.placeholders:
+            return translated_text
+
+        segments = _split_translation(translated_text, self.placeholders)
+        values = {
+            placeholder: str(params[name]) for placeholder, name in self.placeholders
+        }
+
+        # Odd segments are placeholders
+        parts = list(segments)
+        parts[1::2] = [values[placeholder] for placeholder in segments[1::2]]
+        return "".join(parts)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(template_str: str, names: FrozenSet[str]) -> CompiledTemplate:
+    """
+    Replace the given template parameters with short placeholders
+
+    Results are cached, so repeat renders of a template do no regex work.
+
+    Args:
+        template_str: Raw template string (``Template.template``)
+        names: Names of the parameters to protect
+
+    Returns:
+        The compiled template
+    """
+    # Create unique placeholders for each parameter
+    placeholder_map: Dict[str, str] = {}
+    param_counter = 1
+
+    for match in _VAR_PATTERN.finditer(template_str):
+        var_name = match.group("named") or match.group("braced")
+        if var_name in names and var_name not in placeholder_map:
+            # Create a short, unique placeholder to minimize translation costs
+            # Format: X1X, X2X, etc. (unlikely to appear in real text)
+            placeholder_map[var_name] = f"X{param_counter}X"
+            param_counter += 1
+
+    def replace(match: "re.Match") -> str:
+        named = match.group("named")
+        placeholder = placeholder_map.get(named or match.group("braced"))
+        if placeholder is None or (
+            named and _WORD_CHAR.match(template_str, match.end())
+        ):
+            return match.group(0)
+        return placeholder
+
+    # Replace both $var and ${var} formats in a single pass
+    protected = (
+        _VAR_PATTERN.sub(replace, template_str) if placeholder_map else template_str
+    )
+    return CompiledTemplate(
+        protected,
+        tuple(
+            (placeholder, var_name) for var_name, placeholder in placeholder_map.items()
+        ),
+    )
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _split_translation(
+    translated_text: str, placeholders: Tuple[Tuple[str, str], ...]
+) -> Tuple[str, ...]:
+    """Split a translated template into literal text and placeholders"""
+    pattern = "|".join(
+        re.escape(placeholder)
+        for placeholder, _ in sorted(placeholders, key=lambda p: -len(p[0]))
+    )
+    return tuple(re.split(f"({pattern})", translated_text))
+
+
+def protect_template(template_str: str, params: Dict) -> Tuple[str, Dict[str, str]]:
+    """
+    Replace template parameters with short placeholders
+
+    Args:
+        template_str: Raw template string (``Template.template``)
+        params: Template parameters (protected from translation)
+
+    Returns:
+        Tuple of the protected template string and a mapping of placeholder
+        to the string value it should be restored to
+    """
+    compiled = compile_template(template_str, frozenset(params))
+    reverse_placeholder_map = {
+        placeholder: str(params[var_name])
+        for placeholder, var_name in compiled.placeholders
+    }
+    return compiled.protected, reverse_placeholder_map
+
+
+def restore_params(
+    translated_text: str, reverse_placeholder_map: Dict[str, str]
+) -> str:
+    """Restore original parameter values into a translated template"""
+    for placeholder, param_value in reverse_placeholder_map.items():
+        translated_text = translated_text.replace(placeholder, param_value)
+    return translated_text
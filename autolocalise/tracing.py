@@ -0,0 +1,195 @@
+"""Tracing hooks around the phases of a translation
+
+A hook is a callable taking a span name and a dict of attributes and
+returning a context manager that is entered for the duration of the phase,
+e.g. an OpenTelemetry span. Hooks apply to every translator in the process::
+
+    from autolocalise.tracing import OpenTelemetryHook, add_hook
+
+    add_hook(OpenTelemetryHook())
+
+Spans are named ``autolocalise.<phase>``: ``translate`` and
+``translate_template`` around whole calls, then ``validate``,
+``cache_lookup``, ``hash``, ``catalog_lookup``, ``store_lookup``,
+``http_request``, ``json_decode`` and ``cache_write``. While no hook is
+registered, ``span`` returns a shared no-op context manager.
+"""
+
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+from .exceptions import ConfigurationError
+
+Hook = Callable[[str, Dict[str, Any]], ContextManager]
+
+# Replaced rather than mutated, so span() can read it without the lock
+_hooks: Tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Hook) -> None:
+    """Register a hook called for every translation phase"""
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Unregister a hook (no-op if it is not registered)"""
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(registered for registered in _hooks if registered is not hook)
+
+
+class _NullSpan:
+    """Span used while no hook is registered"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Enters the context managers of every hook for one phase"""
+
+    __slots__ = ("_name", "_attributes", "_hooks", "_entered")
+
+    def __init__(self, name: str, attributes: Dict[str, Any], hooks: Tuple[Hook]):
+        self._name = name
+        self._attributes = attributes
+        self._hooks = hooks
+        self._entered: List[Tuple[ContextManager, Any]] = []
+
+    def __enter__(self) -> "_Span":
+        for hook in self._hooks:
+            manager = hook(self._name, self._attributes)
+            self._entered.append((manager, manager.__enter__()))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        while self._entered:
+            manager, _ = self._entered.pop()
+            manager.__exit__(exc_type, exc_value, traceback)
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the spans that support it"""
+        for _, entered in self._entered:
+            set_attribute = getattr(entered, "set_attribute", None)
+            if set_attribute is not None:
+                set_attribute(key, value)
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """
+    Trace a translation phase
+
+    Args:
+        name: Phase name, without the ``autolocalise.`` prefix
+        **attributes: Span attributes
+
+    Returns:
+        A context manager whose value has a ``set_attribute`` method
+    """
+    hooks = _hooks
+    if not hooks:
+        return _NULL_SPAN
+    return _Span(f"autolocalise.{name}", attributes, hooks)
+
+
+class OpenTelemetryHook:
+    """Hook recording translation phases as OpenTelemetry spans
+
+    Requires ``opentelemetry-api``; spans go to whatever tracer provider
+    the application configured.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None):
+        """
+        Args:
+            tracer: OpenTelemetry tracer (defaults to one named
+                ``autolocalise`` from the global tracer provider)
+        """
+        if tracer is None:
+            if otel_trace is None:
+                raise ConfigurationError("OpenTelemetryHook requires opentelemetry-api")
+            tracer = otel_trace.get_tracer("autolocalise")
+        self._tracer = tracer
+
+    def __call__(self, name: str, attributes: Dict[str, Any]) -> ContextManager:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+class _Timer:
+    __slots__ = ("_timer", "_name", "_started")
+
+    def __init__(self, timer: "PhaseTimer", name: str):
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self) -> "_Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self._timer.record(self._name, time.perf_counter() - self._started)
+        return False
+
+
+class PhaseTimer:
+    """Hook accumulating the time spent in each phase
+
+    A lightweight profiler for finding where translation time goes without
+    a tracing backend::
+
+        timer = PhaseTimer()
+        add_hook(timer)
+        ...
+        timer.stats()["autolocalise.hash"]
+    """
+
+    def __init__(self):
+        self._phases: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, name: str, attributes: Dict[str, Any]) -> ContextManager:
+        return _Timer(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add one timing of a phase"""
+        with self._lock:
+            phase = self._phases.get(name)
+            if phase is None:
+                self._phases[name] = [1, seconds, seconds]
+            else:
+                phase[0] += 1
+                phase[1] += seconds
+                phase[2] = max(phase[2], seconds)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Get the count, total and maximum seconds of every phase"""
+        with self._lock:
+            return {
+                name: {"count": count, "total": total, "max": longest}
+                for name, (count, total, longest) in self._phases.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._phases.clear()
@@ -2,27 +2,73 @@
 
 import json
 import logging
-import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from string import Template
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 import requests
 
+from .batching import BatchDispatcher
 from .cache import get_global_cache
-from .exceptions import APIError, NetworkError, ConfigurationError
+from .catalog import CatalogIndex
+from .codec import encode_body, get_codec
+from .exceptions import APIError, CircuitOpenError, NetworkError, ConfigurationError
+from .hashing import hash_texts, text_hash
+from .inflight import get_inflight_registry, running_loop
+from .limiter import get_request_limiter
+from .metrics import get_metrics_registry
+from .resilience import CircuitBreaker, RetryPolicy, is_transient, parse_retry_after
+from .streaming import CATALOG_CHUNK_SIZE, parse_catalog
+from .templates import CompiledTemplate, compile_template
+from .tracing import span
+from .transport import create_session, request_timeout
 from ._version import __version__
 
-
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://autolocalise-main-53fde32.zuplo.app"
 
-class Translator:
-    """AutoLocalise translator client"""
+# Approximate JSON overhead of one {"hashkey", "text", "persist"} text object
+_TEXT_OBJECT_OVERHEAD = 64
+
+# Text sent by recovery probes while the circuit is open
+_PROBE_TEXT = "OK"
+
+
+class BaseTranslator(ABC):
+    """Translator logic shared by the sync and async clients
+
+    Everything here is independent of the HTTP transport: input validation,
+    cache and server translation lookups, hashing and request/response
+    (de)serialisation.
+    """
 
     def __init__(
         self,
         api_key: str,
         source_locale: str,
         target_locale: str,
+        max_batch_size: int = 500,
+        max_batch_bytes: int = 512 * 1024,
+        max_workers: int = 4,
+        store: Optional[Any] = None,
+        preload_locales: Optional[List[str]] = None,
+        max_catalog_locales: Optional[int] = None,
+        max_catalog_entries: Optional[int] = None,
+        refresh_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        limit_requests: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        json_codec: Optional[Any] = None,
+        compress_threshold: Optional[int] = None,
+        stream_catalog: bool = False,
+        compact_catalog: bool = False,
+        collect_metrics: bool = False,
     ):
         """
         Initialize AutoLocalise translator
@@ -31,6 +77,43 @@ class Translator:
             api_key: Your AutoLocalise API key
             source_locale: Source language code
             target_locale: Target language code
+            max_batch_size: Maximum number of texts sent in one API request
+            max_batch_bytes: Approximate maximum request payload size in bytes
+            max_workers: Maximum number of API requests sent concurrently
+            store: Persistent store (e.g. ``SQLiteStore``) used as a
+                read-through/write-through layer behind the in-memory cache
+            preload_locales: Additional target locales whose server
+                translations are loaded at startup alongside target_locale
+            max_catalog_locales: Maximum number of locales whose server
+                translations are kept in memory (least recently used are
+                dropped and reloaded on demand)
+            max_catalog_entries: Maximum number of server translations kept
+                per locale
+            refresh_interval: If set, server translations of every loaded
+                locale are re-synced this often (in seconds) and cached
+                translations expire after the same time
+            retry_policy: Retries for transient translation request
+                failures (None sends every request once)
+            circuit_breaker: Stops translation requests after repeated
+                failures, falling back to the source text until the API
+                recovers (None always sends requests)
+            limit_requests: Pass translation requests through the
+                ``RequestLimiter`` shared by all translators using api_key
+            connect_timeout: Seconds to wait for a connection to the API
+                (defaults to 30)
+            read_timeout: Seconds to wait for an API response (defaults
+                to 30)
+            json_codec: JSON codec for request and response bodies:
+                ``"auto"``, ``"orjson"``, ``"json"`` or a codec object (None
+                leaves JSON to the HTTP client)
+            compress_threshold: Gzip request bodies of at least this many
+                bytes (None never compresses)
+            stream_catalog: Parse server translations while they download
+                instead of reading the whole response first
+            compact_catalog: Store server translations as ``CompactCatalog``
+                objects instead of dicts
+            collect_metrics: Record lookups, fallbacks and API requests in
+                the shared ``MetricsRegistry``
         """
         if not api_key:
             raise ConfigurationError("API key is required")
@@ -41,88 +124,288 @@ class Translator:
         if not target_locale:
             raise ConfigurationError("Target Locale is required")
 
+        if max_batch_size < 1 or max_batch_bytes < 1 or max_workers < 1:
+            raise ConfigurationError(
+                "max_batch_size, max_batch_bytes and max_workers must be positive"
+            )
+
+        if refresh_interval is not None and refresh_interval <= 0:
+            raise ConfigurationError("refresh_interval must be positive")
+
+        if compress_threshold is not None and compress_threshold < 0:
+            raise ConfigurationError("compress_threshold must not be negative")
+
         self.api_key = api_key
         self.source = source_locale
         self.target = target_locale
-        self.base_url = "https://autolocalise-main-53fde32.zuplo.app"
-        self.timeout = 30  # Default API request timeout in seconds
+        self.base_url = DEFAULT_BASE_URL
+        # API request timeout in seconds, or a (connect, read) tuple
+        self.timeout = request_timeout(connect_timeout, read_timeout)
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_workers = max_workers
+        self.refresh_interval = refresh_interval
+        self._store = store
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._limiter = get_request_limiter(api_key) if limit_requests else None
+        self._metrics = get_metrics_registry() if collect_metrics else None
+        self.compress_threshold = compress_threshold
+        self._codec = (
+            get_codec(json_codec or "auto")
+            if json_codec is not None or compress_threshold is not None
+            else None
+        )
+        self.stream_catalog = stream_catalog
+        # Refreshed server edits must not be hidden by the cache for longer
+        # than one refresh
+        self._cache_ttl = refresh_interval
 
         # Always use shared global cache
 
         self._cache = get_global_cache()
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "User-Agent": f"autolocalise-python-sdk/{__version__}",
-            }
+        self._inflight = get_inflight_registry()
+        self._catalogs = CatalogIndex(
+            max_locales=max_catalog_locales,
+            max_entries=max_catalog_entries,
+            compact=compact_catalog,
+        )
+        self._warmup_targets = list(
+            dict.fromkeys([target_locale] + list(preload_locales or []))
         )
+        self._ready = threading.Event()
 
-        # Pre-populate cache with existing translations from server
-        if self._cache:
-            self._populate_cache_from_server()
+    def ready(self) -> bool:
+        """Whether existing server translations have finished loading
 
-    def _populate_cache_from_server(self) -> None:
-        """Populate cache with existing translations from server during
-        initialization"""
-        try:
-            response = self._session.post(
-                f"{self.base_url}/v1/translations",
-                json={
-                    "apiKey": self.api_key,
-                    "targetLocale": self.target,
-                    "version": f"py-v{__version__}",
-                },
-                timeout=self.timeout,
-            )
+        Lookups work before this returns True; texts the server already
+        knows are just sent to the API instead of coming from the catalog.
+        """
+        return self._ready.is_set()
+
+    @property
+    def _server_translations(self) -> Dict[str, str]:
+        """Server translations for the default language pair"""
+        return self._catalogs.get(self.source, self.target) or {}
+
+    def catalog_stats(self) -> Dict[str, Any]:
+        """Get entries and approximate memory of loaded server translations"""
+        return self._catalogs.stats()
+
+    def _default_headers(self) -> Dict[str, str]:
+        """HTTP headers sent with every API request"""
+        return {
+            "Content-Type": "application/json",
+            "User-Agent": f"autolocalise-python-sdk/{__version__}",
+        }
+
+    def _catalog_payload(self, target_lang: Optional[str] = None) -> Dict[str, Any]:
+        """Build the request body for /v1/translations"""
+        return {
+            "apiKey": self.api_key,
+            "targetLocale": target_lang or self.target,
+            "version": f"py-v{__version__}",
+        }
+
+    def _catalog_request(
+        self, source_lang: str, target_lang: str
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Build the /v1/translations body and conditional headers
+
+        The ETag and cursor of the last response for the language pair are
+        sent back, so an unchanged catalog costs a 304 and a server that
+        supports incremental sync only returns what changed since then.
+        """
+        payload = self._catalog_payload(target_lang)
+        etag, cursor = self._catalogs.validators(source_lang, target_lang)
 
-            if response.status_code == 200:
-                data = response.json()
-                hash_translations = data.get("translations", {})
+        if cursor is not None:
+            payload["since"] = cursor
+        headers = {"If-None-Match": etag} if etag else {}
+        return payload, headers
 
-                if hash_translations:
-                    # Merge hash-based translations into cache
-                    self._server_translations = hash_translations
+    def _encode_request(
+        self, payload: Dict[str, Any], headers: Dict[str, str]
+    ) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Serialize a request body with the configured codec
 
-                    logger.debug(
-                        f"Server has {len(hash_translations)} existing "
-                        f"translations available"
-                    )
-                else:
-                    self._server_translations = {}
-            elif response.status_code == 404:
-                self._server_translations = {}
-            else:
-                self._server_translations = {}
-                self._handle_api_error(response)
-        except (requests.RequestException, json.JSONDecodeError) as e:
-            self._server_translations = {}
-            logger.warning(f"Failed to check server translations: {e}")
-        except Exception as e:
-            self._server_translations = {}
-            logger.error(f"Unexpected error during server translation check: {e}")
-
-    def __call__(
-        self,
-        texts: List[str],
-        target_locale: Optional[str] = None,
-        source_locale: Optional[str] = None,
-    ) -> Dict[str, str]:
+        Returns:
+            Tuple of the body (None when the HTTP client should encode the
+            payload itself) and the request headers
         """
-        Translate texts (callable interface)
+        if self._codec is None:
+            return None, headers
+
+        body, body_headers = encode_body(payload, self._codec, self.compress_threshold)
+        return body, {**headers, **body_headers}
+
+    def _decode_response(self, response: Any) -> Any:
+        """Parse a JSON response body with the configured codec"""
+        with span("json_decode"):
+            if self._codec is None:
+                return response.json()
+            return self._codec.loads(response.content)
+
+    @staticmethod
+    def _response_etag(response: Any) -> Optional[str]:
+        """Get the ETag header of a response, if any"""
+        etag = response.headers.get("ETag")
+        return etag if isinstance(etag, str) else None
+
+    def _load_server_translations(
+        self,
+        data: Dict[str, Any],
+        source_lang: str,
+        target_lang: str,
+        etag: Optional[str] = None,
+    ) -> bool:
+        """Store the hash-based translations returned by /v1/translations
 
-        Args:
-            texts: List of texts to translate
-            target_locale: Target language (optional, uses instance default)
-            source_locale: Source language (optional, uses instance default)
+        A response marked ``"delta": true`` only holds the translations that
+        changed (and the ``"deleted"`` hashes) since the cursor that was
+        sent; it is merged into the loaded catalog. Anything else replaces
+        the catalog.
 
         Returns:
-            Dictionary mapping original text to translated text
+            False if the response was dropped, and so must not be saved
         """
-        return self.translate(
-            texts, target_locale=target_locale, source_locale=source_locale
+        hash_translations = data.get("translations", {}) or {}
+        cursor = data.get("cursor")
+
+        if data.get("delta"):
+            deleted = data.get("deleted", []) or []
+            if not self._catalogs.merge(
+                hash_translations,
+                deleted,
+                source_lang,
+                target_lang,
+                etag=etag,
+                cursor=cursor,
+            ):
+                # The pair was evicted while the request was in flight. The
+                # delta is dropped with its cursor, so the next use of the
+                # pair loads the full catalog
+                logger.debug(
+                    f"Dropped server translation changes for unloaded "
+                    f"{source_lang}:{target_lang}"
+                )
+                return False
+
+            logger.debug(
+                f"Merged {len(hash_translations)} changed server translations "
+                f"for {source_lang}:{target_lang}"
+            )
+            return True
+
+        self._catalogs.load(
+            hash_translations, source_lang, target_lang, etag=etag, cursor=cursor
+        )
+        if hash_translations:
+            logger.debug(
+                f"Server has {len(hash_translations)} existing "
+                f"translations available for {source_lang}:{target_lang}"
+            )
+        return True
+
+    def _save_server_translations(
+        self, data: Dict[str, Any], source_lang: str, target_lang: str
+    ) -> None:
+        """Save a loaded /v1/translations response to the store, if any"""
+        if not data.get("delta"):
+            self._save_catalog(source_lang, target_lang)
+            return
+
+        self._save_catalog_changes(
+            data.get("translations", {}) or {},
+            data.get("deleted", []) or [],
+            source_lang,
+            target_lang,
         )
 
+    def _catalog_failed(self, source_lang: str, target_lang: str) -> None:
+        """Record a failed load, keeping any catalog already loaded"""
+        if not self._catalogs.is_loaded(source_lang, target_lang):
+            self._catalogs.load({}, source_lang, target_lang)
+
+    def _restore_catalog(self, source_lang: str, target_lang: str) -> None:
+        """Load the last saved catalog of a language pair from the store
+
+        Its validators are then sent with the next request, so a restart
+        does not download an unchanged catalog again.
+        """
+        get_catalog = getattr(self._store, "get_catalog", None)
+        if get_catalog is None or self._catalogs.is_loaded(source_lang, target_lang):
+            return
+
+        try:
+            snapshot = get_catalog(source_lang, target_lang)
+        except Exception as e:
+            logger.warning(f"Failed to read server translations from store: {e}")
+            return
+
+        if isinstance(snapshot, dict):
+            self._catalogs.load(
+                snapshot.get("translations") or {},
+                source_lang,
+                target_lang,
+                etag=snapshot.get("etag"),
+                cursor=snapshot.get("cursor"),
+            )
+
+    def _save_catalog(self, source_lang: str, target_lang: str) -> None:
+        """Save the catalog of a language pair to the store, if supported"""
+        set_catalog = getattr(self._store, "set_catalog", None)
+        translations = self._catalogs.get(source_lang, target_lang)
+        if set_catalog is None or translations is None:
+            return
+
+        etag, cursor = self._catalogs.validators(source_lang, target_lang)
+        try:
+            set_catalog(
+                dict(translations), source_lang, target_lang, etag=etag, cursor=cursor
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write server translations to store: {e}")
+
+    def _save_catalog_changes(
+        self,
+        changed: Dict[str, str],
+        deleted: List[str],
+        source_lang: str,
+        target_lang: str,
+    ) -> None:
+        """Save an incremental catalog update to the store, if supported
+
+        Stores without ``update_catalog`` get the whole catalog again.
+        """
+        update_catalog = getattr(self._store, "update_catalog", None)
+        if update_catalog is None:
+            self._save_catalog(source_lang, target_lang)
+            return
+
+        etag, cursor = self._catalogs.validators(source_lang, target_lang)
+        try:
+            update_catalog(
+                changed, deleted, source_lang, target_lang, etag=etag, cursor=cursor
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write server translations to store: {e}")
+
+    def _compile_templates(
+        self, items: Iterable[Tuple[Template, Optional[Mapping]]]
+    ) -> List[Tuple[CompiledTemplate, Mapping]]:
+        """Protect the parameters of many (template, params) pairs"""
+        compiled = []
+        for template, params in items:
+            if not isinstance(template, Template):
+                raise ValueError("Templates must be string.Template objects")
+
+            params = params or {}
+            compiled.append(
+                (compile_template(template.template, frozenset(params)), params)
+            )
+        return compiled
+
     def _validate_text(self, text: str) -> str:
         """Validate and sanitize text input"""
         if len(text) > 10000:
@@ -130,61 +413,733 @@ class Translator:
 
         return text
 
-    def _process_text_for_translation(
+    def _lookup_texts(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Tuple[Dict[str, str], List[str]]:
+        """Resolve texts from cache and server translations
+
+        Callers then look up the remaining texts in the persistent store,
+        if any, with ``_lookup_store``.
+
+        Returns:
+            Tuple of resolved results and the texts that still need translating
+        """
+        results: Dict[str, str] = {}
+
+        with span("validate", texts=len(texts)):
+            valid_texts = []
+            for text in texts:
+                # Skip invalid text (non-strings)
+                if not isinstance(text, str):
+                    continue
+
+                # Handle empty strings - return as-is
+                if not text.strip():
+                    results[text] = text
+                    continue
+
+                # Validate text input (length check)
+                valid_texts.append(self._validate_text(text))
+
+        # Check local cache first, looking up repeated texts once
+        with span("cache_lookup", texts=len(valid_texts)):
+            distinct = list(dict.fromkeys(valid_texts))
+            cached = self._cache.get_many(distinct, source_lang, target_lang)
+            results.update(cached)
+            misses = [text for text in distinct if text not in cached]
+
+        # Check server translations for this language pair if loaded
+        texts_to_translate = misses
+        catalog = self._catalogs.get(source_lang, target_lang)
+        if catalog and misses:
+            texts_to_translate = self._lookup_catalog(
+                misses, catalog, results, source_lang, target_lang
+            )
+
+        if self._metrics is not None:
+            self._metrics.count_texts(
+                source_lang,
+                target_lang,
+                cache=len(cached),
+                catalog=len(misses) - len(texts_to_translate),
+            )
+        return results, texts_to_translate
+
+    def _lookup_catalog(
         self,
-        text: str,
+        texts: List[str],
+        catalog: Mapping,
+        results: Dict[str, str],
         source_lang: str,
         target_lang: str,
+    ) -> List[str]:
+        """Resolve cache misses from server translations
+
+        Found translations are cached for future use.
+
+        Returns:
+            Texts that the server has no translation for
+        """
+        with span("hash", texts=len(texts)):
+            hash_keys = hash_texts(texts)
+
+        with span("catalog_lookup", texts=len(texts)):
+            found = {}
+            remaining = []
+            for text, hash_key in zip(texts, hash_keys):
+                translation = catalog.get(hash_key)
+                if translation is not None:
+                    found[text] = translation
+                else:
+                    remaining.append(text)
+
+        if found:
+            results.update(found)
+            with span("cache_write", texts=len(found)):
+                self._cache.set_batch(
+                    found, source_lang, target_lang, ttl=self._cache_ttl
+                )
+        return remaining
+
+    def _lookup_store(
+        self,
+        texts: List[str],
         results: Dict[str, str],
-        texts_to_translate: List[str],
-    ) -> None:
-        """Process a single text for translation, checking cache and server"""
-        # Skip invalid text (non-strings)
-        if not isinstance(text, str):
-            return
+        source_lang: str,
+        target_lang: str,
+    ) -> List[str]:
+        """Resolve cache misses from the persistent store
 
-        # Handle empty strings - return as-is
-        if not text.strip():
-            results[text] = text
-            return
+        Found translations are promoted into the in-memory cache.
 
-        # Validate text input (length check)
-        validated_text = self._validate_text(text)
+        Returns:
+            Texts that were not found in the store
+        """
+        try:
+            with span("store_lookup", texts=len(texts)):
+                stored = self._store.get_many(texts, source_lang, target_lang)
+        except Exception as e:
+            logger.warning(f"Failed to read from translation store: {e}")
+            return texts
 
-        # Check local cache first
-        cached = self._cache.get(validated_text, source_lang, target_lang)
-        if cached is not None:
-            results[validated_text] = cached
-            return
+        if not stored:
+            return texts
 
-        # Check server translations if available
-        if hasattr(self, "_server_translations") and self._server_translations:
-            text_hash = self._generate_hash(validated_text)
-            if text_hash in self._server_translations:
-                translation = self._server_translations[text_hash]
-                results[validated_text] = translation
-                # Cache the translation for future use
-                self._cache.set(validated_text, translation, source_lang, target_lang)
-                return
+        results.update(stored)
+        self._cache.set_batch(stored, source_lang, target_lang, ttl=self._cache_ttl)
+        if self._metrics is not None:
+            self._metrics.count_texts(source_lang, target_lang, store=len(stored))
+        return [text for text in texts if text not in stored]
 
-        texts_to_translate.append(validated_text)
+    def _store_translations(
+        self,
+        new_translations: Dict[str, str],
+        results: Dict[str, str],
+        source_lang: str,
+        target_lang: str,
+    ) -> None:
+        """Update results and cache with new translations"""
+        results.update(new_translations)
+        if new_translations:
+            with span("cache_write", texts=len(new_translations)):
+                self._cache.set_batch(
+                    new_translations, source_lang, target_lang, ttl=self._cache_ttl
+                )
+
+    def _persist_translations(
+        self, new_translations: Dict[str, str], source_lang: str, target_lang: str
+    ) -> None:
+        """Write new translations to the persistent store, if any"""
+        if self._store is not None and new_translations:
+            try:
+                self._store.set_batch(new_translations, source_lang, target_lang)
+            except Exception as e:
+                logger.warning(f"Failed to write to translation store: {e}")
 
     def _handle_translation_error(
         self,
         texts_to_translate: List[str],
         results: Dict[str, str],
         error: Exception,
-    ) -> None:
-        """Handle translation errors by falling back to original text"""
+    ) -> int:
+        """Handle translation errors by falling back to original text
+
+        Returns:
+            Number of texts that fell back
+        """
         if isinstance(error, (NetworkError, APIError)):
             logger.warning(f"Translation failed: {error}")
         else:
             logger.error(f"Unexpected error during translation: {error}")
 
-        # Fallback: return original texts for untranslated items
-        for text in texts_to_translate:
+        return self._fall_back(texts_to_translate, results)
+
+    @staticmethod
+    def _fall_back(texts: Iterable[str], results: Dict[str, str]) -> int:
+        """Return untranslated texts as they are
+
+        Returns:
+            Number of texts that fell back
+        """
+        fallbacks = 0
+        for text in texts:
             if text not in results:
                 results[text] = text
+                fallbacks += 1
+        return fallbacks
+
+    def _count_outcomes(
+        self,
+        source_lang: str,
+        target_lang: str,
+        translated: int = 0,
+        shared: int = 0,
+        fallbacks: int = 0,
+    ) -> None:
+        """Record how cache misses were resolved, if collecting metrics"""
+        if self._metrics is not None:
+            self._metrics.count_texts(
+                source_lang,
+                target_lang,
+                api=translated,
+                shared=shared,
+                fallback=fallbacks,
+            )
+
+    def _observe_request(
+        self, payload: Dict[str, Any], latency: float, status_code: Optional[int]
+    ) -> None:
+        """Record a /v1/translate request, if collecting metrics"""
+        if self._metrics is not None:
+            self._metrics.observe_request(
+                payload["sourceLocale"],
+                payload["targetLocale"],
+                len(payload["texts"]),
+                latency,
+                status_code,
+            )
+
+    def _circuit_open(self) -> bool:
+        """Whether translation requests are currently short-circuited"""
+        breaker = self._circuit_breaker
+        if breaker is None or breaker.allow():
+            return False
+
+        # Take over probing if the translator that was probing has closed
+        if breaker.start_probe():
+            self._start_probe()
+        return True
+
+    def _wait_timeout(self) -> float:
+        """Seconds to wait for a translation requested by another caller"""
+        if isinstance(self.timeout, tuple):
+            return sum(self.timeout)
+        return self.timeout
+
+    @abstractmethod
+    def _start_probe(self) -> None:
+        """Probe the API in the background until the circuit closes, then
+        call ``end_probe`` on the circuit breaker"""
+
+    def _record_success(self) -> None:
+        """Report a successful translation request to the circuit breaker"""
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success()
+
+    def _record_failure(self, error: Exception) -> None:
+        """Report a failed translation request to the circuit breaker,
+        starting the recovery probe if this failure opened the circuit"""
+        breaker = self._circuit_breaker
+        if breaker is None or not is_transient(error):
+            return
+
+        if breaker.record_failure():
+            logger.warning(
+                f"Translation API unavailable ({error}), falling back to source "
+                f"text until it recovers"
+            )
+            if breaker.start_probe():
+                self._start_probe()
+
+    def _probe_payload(self) -> Dict[str, Any]:
+        """Build the minimal /v1/translate request sent by recovery probes"""
+        payload, _ = self._translate_payload([_PROBE_TEXT], self.source, self.target)
+        payload["texts"][0]["persist"] = False
+        return payload
+
+    @staticmethod
+    def _probe_succeeded(status_code: int) -> bool:
+        """Whether a recovery probe response shows the API is back"""
+        return 200 <= status_code < 300
+
+    def _generate_hash(self, text: str) -> str:
+        """Generate hash for text (matches React SDK implementation)"""
+        # TODO: Implement more secure hash function
+        return text_hash(text)
+
+    def _chunk_texts(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into request-sized chunks by count and payload bytes"""
+        chunks = []
+        chunk: List[str] = []
+        chunk_bytes = 0
+
+        for text in texts:
+            text_bytes = len(text.encode("utf-8")) + _TEXT_OBJECT_OVERHEAD
+            if chunk and (
+                len(chunk) >= self.max_batch_size
+                or chunk_bytes + text_bytes > self.max_batch_bytes
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_bytes = 0
+
+            # A single text larger than the byte budget gets a chunk of its own
+            chunk.append(text)
+            chunk_bytes += text_bytes
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _translate_payload(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Build the /v1/translate request body and its hash to text mapping"""
+        # Create text objects with hash keys
+        text_objects = []
+        hash_to_text = {}
+
+        for text, hash_key in zip(texts, hash_texts(texts)):
+            text_objects.append({"hashkey": hash_key, "text": text, "persist": True})
+            hash_to_text[hash_key] = text
+
+        payload = {
+            "texts": text_objects,
+            "sourceLocale": source_lang,
+            "targetLocale": target_lang,
+            "apiKey": self.api_key,
+            "version": f"py-v{__version__}",
+        }
+        return payload, hash_to_text
+
+    def _parse_translate_response(
+        self, data: Dict[str, Any], hash_to_text: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Convert a hash-based /v1/translate response back to text-based"""
+        # The API returns translations directly, not nested under
+        # "translations" key
+        hash_translations = data.get("translations", data)
+        # Fallback to data itself if no "translations" key
+
+        text_translations = {}
+        for hash_key, translation in hash_translations.items():
+            if hash_key in hash_to_text:
+                original_text = hash_to_text[hash_key]
+                text_translations[original_text] = translation
+        return text_translations
+
+    def _handle_api_error(self, response: Any) -> None:
+        """Handle API error responses"""
+        error_data = None
+        try:
+            error_data = response.json()
+            message = error_data.get("error", f"API error: {response.status_code}")
+        except (ValueError, json.JSONDecodeError):
+            message = f"API error: {response.status_code} - {response.text}"
+
+        retry_after = None
+        if response.status_code in (429, 503):
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+        raise APIError(
+            message,
+            status_code=response.status_code,
+            response_data=error_data,
+            retry_after=retry_after,
+        )
+
+    def clear_cache(self):
+        """Clear translation cache for this instance's language pairs"""
+        # Only clear cache for this instance's language pairs
+        # This is safer than clearing the entire global cache
+        self._cache.clear(self.source, self.target)
+
+    @classmethod
+    def clear_global_cache(cls):
+        """Clear the entire global shared cache"""
+        from .cache import get_global_cache
+
+        cache = get_global_cache()
+        cache.clear()
+
+    def cache_size(self) -> int:
+        """Get number of cached translations"""
+        return self._cache.size()
+
+    def set_languages(self, source_locale: str, target_locale: str):
+        """Update source and target languages"""
+        self.source = source_locale
+        self.target = target_locale
+
+
+class Translator(BaseTranslator):
+    """AutoLocalise translator client"""
+
+    def __init__(
+        self,
+        api_key: str,
+        source_locale: str,
+        target_locale: str,
+        max_batch_size: int = 500,
+        max_batch_bytes: int = 512 * 1024,
+        max_workers: int = 4,
+        store: Optional[Any] = None,
+        batch_window: Optional[float] = None,
+        background_warmup: bool = False,
+        preload_locales: Optional[List[str]] = None,
+        max_catalog_locales: Optional[int] = None,
+        max_catalog_entries: Optional[int] = None,
+        refresh_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        limit_requests: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        session: Optional[requests.Session] = None,
+        json_codec: Optional[Any] = None,
+        compress_threshold: Optional[int] = None,
+        stream_catalog: bool = False,
+        compact_catalog: bool = False,
+        collect_metrics: bool = False,
+    ):
+        """
+        Initialize AutoLocalise translator
+
+        Args:
+            api_key: Your AutoLocalise API key
+            source_locale: Source language code
+            target_locale: Target language code
+            max_batch_size: Maximum number of texts sent in one API request
+            max_batch_bytes: Approximate maximum request payload size in bytes
+            max_workers: Maximum number of API requests sent concurrently
+            store: Persistent store (e.g. ``SQLiteStore``) used as a
+                read-through/write-through layer behind the in-memory cache
+            batch_window: If set, cache misses from all threads are collected
+                for up to this many seconds (or until max_batch_size texts are
+                pending) and sent together in one request
+            background_warmup: Load existing server translations on a
+                background thread instead of blocking the constructor (and
+                the first use of another locale); see ``ready()`` and
+                ``wait_ready()``
+            preload_locales: Additional target locales whose server
+                translations are loaded concurrently at startup
+            max_catalog_locales: Maximum number of locales whose server
+                translations are kept in memory
+            max_catalog_entries: Maximum number of server translations kept
+                per locale
+            refresh_interval: If set, a background thread re-syncs server
+                translations of every loaded locale this often (in seconds)
+            retry_policy: Retries for transient translation request
+                failures, e.g. ``RetryPolicy(retries=3)`` (None sends every
+                request once)
+            circuit_breaker: A ``CircuitBreaker`` that stops translation
+                requests after repeated failures; while it is open,
+                ``translate`` returns the source text immediately and the
+                API is probed in the background
+            limit_requests: Adapt the number of concurrent translation
+                requests to API latency and 429 responses, sharing the limit
+                (and any rate limit set with ``set_request_limiter``) with
+                every translator that uses the same api_key
+            connect_timeout: Seconds to wait for a connection to the API
+                (defaults to 30)
+            read_timeout: Seconds to wait for an API response (defaults
+                to 30)
+            session: HTTP session to send requests with, e.g. one made by
+                ``create_session`` and shared by several translators so they
+                reuse the same pooled connections. It is left open by
+                ``close()``. By default each translator creates its own,
+                pooling up to max(10, max_workers) connections
+            json_codec: JSON codec for request and response bodies, e.g.
+                ``"orjson"`` or ``"auto"`` (orjson when installed); None
+                leaves JSON to requests
+            compress_threshold: Gzip request bodies of at least this many
+                bytes (None never compresses); responses are compressed
+                whenever the server supports it
+            stream_catalog: Parse server translations in chunks as they
+                download, so loading a large catalog never holds the whole
+                response body (and a parsed copy of it) in memory
+            compact_catalog: Keep server translations in a compact sorted
+                array instead of a dict, using about a third of the memory
+                for large catalogs at the cost of slower lookups
+            collect_metrics: Record how texts are resolved (cache, server
+                catalog, API, fallback) and API request latency in the
+                registry returned by ``get_metrics_registry()``
+        """
+        super().__init__(
+            api_key,
+            source_locale,
+            target_locale,
+            max_batch_size=max_batch_size,
+            max_batch_bytes=max_batch_bytes,
+            max_workers=max_workers,
+            store=store,
+            preload_locales=preload_locales,
+            max_catalog_locales=max_catalog_locales,
+            max_catalog_entries=max_catalog_entries,
+            refresh_interval=refresh_interval,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            limit_requests=limit_requests,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            json_codec=json_codec,
+            compress_threshold=compress_threshold,
+            stream_catalog=stream_catalog,
+            compact_catalog=compact_catalog,
+            collect_metrics=collect_metrics,
+        )
+
+        self._owns_session = session is None
+        if session is None:
+            session = create_session(pool_maxsize=max(10, max_workers))
+        self._session = session
+        self._session.headers.update(self._default_headers())
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        self.dispatcher: Optional[BatchDispatcher] = None
+        if batch_window is not None:
+            self.dispatcher = BatchDispatcher(
+                self._translate_texts,
+                window=batch_window,
+                max_batch_size=max_batch_size,
+                max_workers=max_workers,
+            )
+
+        # Server translations currently being loaded, per language pair
+        self._catalog_loads: Dict[Tuple[str, str], threading.Event] = {}
+        self._catalog_loads_lock = threading.Lock()
+        # Background loads started by wait=False, joined by close()
+        self._catalog_threads: List[threading.Thread] = []
+        self._background_warmup = background_warmup
+
+        # Pre-populate cache with existing translations from server
+        self._warmup_thread: Optional[threading.Thread] = None
+        if background_warmup:
+            self._warmup_thread = threading.Thread(
+                target=self._warm_up, name="autolocalise-warmup", daemon=True
+            )
+            self._warmup_thread.start()
+        elif self._cache:
+            self._warm_up()
+
+        self._closed = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._probe_thread: Optional[threading.Thread] = None
+        if refresh_interval is not None:
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name="autolocalise-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _warm_up(self) -> None:
+        """Load server translations for the startup locales and mark ready"""
+        try:
+            targets = self._warmup_targets
+            if len(targets) == 1:
+                self._ensure_catalog(self.source, targets[0], wait=True)
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(targets), self.max_workers),
+                    thread_name_prefix="autolocalise-warmup",
+                ) as executor:
+                    list(
+                        executor.map(
+                            lambda target: self._ensure_catalog(
+                                self.source, target, wait=True
+                            ),
+                            targets,
+                        )
+                    )
+        finally:
+            self._ready.set()
+
+    def _ensure_catalog(self, source_lang: str, target_lang: str, wait: bool) -> None:
+        """Load server translations for a language pair on first use
+
+        Concurrent callers share a single request. With wait=False the load
+        runs on a background thread and the caller continues without it.
+        """
+        if self._catalogs.is_loaded(source_lang, target_lang):
+            return
+
+        key = (source_lang, target_lang)
+        with self._catalog_loads_lock:
+            if self._catalogs.is_loaded(source_lang, target_lang):
+                return
+            done = self._catalog_loads.get(key)
+            owner = done is None
+            if owner:
+                done = self._catalog_loads[key] = threading.Event()
+
+        if owner and wait:
+            self._load_catalog(source_lang, target_lang, done)
+        elif owner:
+            thread = threading.Thread(
+                target=self._load_catalog,
+                args=(source_lang, target_lang, done),
+                name="autolocalise-catalog",
+                daemon=True,
+            )
+            with self._catalog_loads_lock:
+                self._catalog_threads = [
+                    running for running in self._catalog_threads if running.is_alive()
+                ]
+                self._catalog_threads.append(thread)
+            thread.start()
+        elif wait:
+            done.wait()
+
+    def _load_catalog(
+        self, source_lang: str, target_lang: str, done: threading.Event
+    ) -> None:
+        """Fetch server translations for a language pair and signal waiters"""
+        try:
+            self._populate_cache_from_server(source_lang, target_lang)
+        finally:
+            with self._catalog_loads_lock:
+                del self._catalog_loads[(source_lang, target_lang)]
+            done.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for existing server translations to finish loading
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits until done)
+
+        Returns:
+            True if loading finished, False if the timeout expired
+        """
+        return self._ready.wait(timeout)
+
+    def _populate_cache_from_server(
+        self, source_lang: Optional[str] = None, target_lang: Optional[str] = None
+    ) -> None:
+        """Populate cache with existing translations from server for a
+        language pair (the instance default if not given)"""
+        source_lang = source_lang or self.source
+        target_lang = target_lang or self.target
+        self._restore_catalog(source_lang, target_lang)
+
+        try:
+            payload, headers = self._catalog_request(source_lang, target_lang)
+            response = self._post(
+                "/v1/translations", payload, headers, stream=self.stream_catalog
+            )
+            try:
+                if response.status_code == 200:
+                    data = self._read_catalog(response)
+                    if self._load_server_translations(
+                        data,
+                        source_lang,
+                        target_lang,
+                        etag=self._response_etag(response),
+                    ):
+                        self._save_server_translations(data, source_lang, target_lang)
+                elif response.status_code == 304:
+                    logger.debug(
+                        f"Server translations for {source_lang}:{target_lang} "
+                        f"are unchanged"
+                    )
+                elif response.status_code == 404:
+                    self._catalogs.load({}, source_lang, target_lang)
+                else:
+                    self._catalog_failed(source_lang, target_lang)
+                    self._handle_api_error(response)
+            finally:
+                if self.stream_catalog:
+                    response.close()
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            self._catalog_failed(source_lang, target_lang)
+            logger.warning(f"Failed to check server translations: {e}")
+        except Exception as e:
+            self._catalog_failed(source_lang, target_lang)
+            logger.error(f"Unexpected error during server translation check: {e}")
+
+    def _read_catalog(self, response: requests.Response) -> Dict[str, Any]:
+        """Parse a /v1/translations response, in chunks when streaming"""
+        if not self.stream_catalog:
+            return self._decode_response(response)
+        with span("json_decode", streamed=True):
+            return parse_catalog(response.iter_content(CATALOG_CHUNK_SIZE))
+
+    def refresh(self) -> None:
+        """Re-sync server translations of every loaded locale
+
+        Unchanged locales cost a conditional request; changed ones only
+        transfer their changes when the server supports incremental sync.
+        """
+        for source_lang, target_lang in self._catalogs.pairs():
+            if self._closed.is_set():
+                return
+            self._populate_cache_from_server(source_lang, target_lang)
+
+    def _refresh_loop(self) -> None:
+        """Refresh server translations every refresh_interval until closed"""
+        while not self._closed.wait(self.refresh_interval):
+            self.refresh()
+
+    def _start_probe(self) -> None:
+        """Probe the API on a background thread until the circuit closes"""
+        if self._closed.is_set():
+            self._circuit_breaker.end_probe()
+            return
+
+        self._probe_thread = threading.Thread(
+            target=self._probe_until_recovered, name="autolocalise-probe", daemon=True
+        )
+        self._probe_thread.start()
+
+    def _probe_until_recovered(self) -> None:
+        """Send a cheap request every reset_timeout until the API answers"""
+        breaker = self._circuit_breaker
+        try:
+            while breaker.is_open and not self._closed.wait(breaker.reset_timeout):
+                if self._probe_api():
+                    logger.info("Translation API recovered")
+                    breaker.record_success()
+        finally:
+            breaker.end_probe()
+
+    def _probe_api(self) -> bool:
+        """Check whether the API translates again with a one-text request"""
+        try:
+            response = self._post_translate(self._probe_payload())
+        except requests.RequestException:
+            return False
+        return self._probe_succeeded(response.status_code)
+
+    def __call__(
+        self,
+        texts: List[str],
+        target_locale: Optional[str] = None,
+        source_locale: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Translate texts (callable interface)
+
+        Args:
+            texts: List of texts to translate
+            target_locale: Target language (optional, uses instance default)
+            source_locale: Source language (optional, uses instance default)
+
+        Returns:
+            Dictionary mapping original text to translated text
+        """
+        return self.translate(
+            texts, target_locale=target_locale, source_locale=source_locale
+        )
 
     def translate(
         self,
@@ -209,91 +1164,212 @@ class Translator:
         source_lang = source_locale or self.source
         target_lang = target_locale or self.target
 
-        # Filter out empty strings and check cache
-        texts_to_translate = []
-        results = {}
+        with span(
+            "translate", source=source_lang, target=target_lang, texts=len(texts)
+        ):
+            # Server translations for other locales are loaded on first use
+            self._ensure_catalog(
+                source_lang, target_lang, wait=not self._background_warmup
+            )
 
-        for text in texts:
-            self._process_text_for_translation(
-                text, source_lang, target_lang, results, texts_to_translate
+            results, texts_to_translate = self._lookup_texts(
+                texts, source_lang, target_lang
             )
+            if self._store is not None and texts_to_translate:
+                texts_to_translate = self._lookup_store(
+                    texts_to_translate, results, source_lang, target_lang
+                )
 
-        # If all texts were cached, return results
-        if not texts_to_translate:
-            return results
+            # If all texts were cached, return results
+            if not texts_to_translate:
+                return results
 
-        # Translate all texts (cache misses)
-        try:
-            new_translations = self._translate_texts(
+            # Don't wait for a request that is known to fail
+            if self._circuit_open():
+                fallbacks = self._fall_back(texts_to_translate, results)
+                self._count_outcomes(source_lang, target_lang, fallbacks=fallbacks)
+                return results
+
+            # Identical misses already being fetched by another caller are
+            # awaited instead of being requested again
+            owned, waiting = self._inflight.claim(
                 texts_to_translate, source_lang, target_lang
             )
 
-            # Update results and cache with new translations
-            for text, translation in new_translations.items():
-                results[text] = translation
-                self._cache.set(text, translation, source_lang, target_lang)
+            # Called from a coroutine, this call blocks the event loop, so
+            # misses owned by coroutines on that loop are fetched here
+            fetch = owned
+            loop = running_loop()
+            if loop is not None and waiting:
+                unshared = self._inflight.owned_on(waiting, loop)
+                for text in unshared:
+                    del waiting[text]
+                fetch = owned + unshared
+
+            # Translate all texts (cache misses)
+            new_translations: Dict[str, str] = {}
+            fallbacks = shared = 0
+            try:
+                if fetch and self.dispatcher is not None:
+                    new_translations = self.dispatcher.submit(
+                        fetch, source_lang, target_lang
+                    ).result()
+                elif fetch:
+                    new_translations = self._translate_texts(
+                        fetch, source_lang, target_lang
+                    )
+                self._store_translations(
+                    new_translations, results, source_lang, target_lang
+                )
+                self._persist_translations(new_translations, source_lang, target_lang)
 
-        except Exception as e:
-            self._handle_translation_error(texts_to_translate, results, e)
+            except Exception as e:
+                fallbacks = self._handle_translation_error(fetch, results, e)
+            finally:
+                self._inflight.release(
+                    owned, new_translations, source_lang, target_lang
+                )
 
-        return results
+            # Other callers' requests are waited for as long as our own
+            # would be; texts still pending then fall back
+            deadline = time.monotonic() + self._wait_timeout()
+            for text, future in waiting.items():
+                try:
+                    translation = future.result(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except FutureTimeoutError:
+                    logger.warning(
+                        f"Timed out waiting for a shared translation of {text!r}"
+                    )
+                    continue
+                if translation is not None:
+                    results[text] = translation
+                    shared += 1
+
+            # Texts from failed chunks fall back to their original text
+            fallbacks += self._fall_back(texts_to_translate, results)
+            self._count_outcomes(
+                source_lang,
+                target_lang,
+                translated=len(new_translations),
+                shared=shared,
+                fallbacks=fallbacks,
+            )
+            return results
 
-    def _generate_hash(self, text: str) -> str:
-        """Generate hash for text (matches React SDK implementation)"""
-        # TODO: Implement more secure hash function
-        hash_value = 0
-        for char in text:
-            char_code = ord(char)
-            hash_value = (hash_value << 5) - hash_value + char_code
-            hash_value = hash_value & 0xFFFFFFFF  # Keep as 32-bit integer
-            # Convert to signed 32-bit integer
-            if hash_value > 0x7FFFFFFF:
-                hash_value -= 0x100000000
-        return str(hash_value)
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool used to send chunks concurrently"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="autolocalise",
+                    )
+        return self._executor
+
+    def close(self) -> None:
+        """Release the worker pool and pooled HTTP connections (unless the
+        session was passed in)"""
+        self._closed.set()
+        with self._catalog_loads_lock:
+            catalog_threads, self._catalog_threads = self._catalog_threads, []
+        for thread in (
+            self._warmup_thread,
+            self._refresh_thread,
+            self._probe_thread,
+            *catalog_threads,
+        ):
+            if thread is not None:
+                thread.join()
+        if self.dispatcher is not None:
+            self.dispatcher.close()
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._owns_session:
+            self._session.close()
 
     def _translate_texts(
         self, texts: List[str], source_lang: str, target_lang: str
     ) -> Dict[str, str]:
-        """Send texts for translation"""
-        try:
-            # Create text objects with hash keys
-            text_objects = []
-            text_to_hash = {}
-            hash_to_text = {}
+        """Send texts for translation, chunking large batches
 
-            for text in texts:
-                hash_key = self._generate_hash(text)
-                text_objects.append(
-                    {"hashkey": hash_key, "text": text, "persist": True}
+        Chunks are sent concurrently and merged as they complete. A failed
+        chunk is logged and left out of the result so only its own texts
+        fall back; the error is raised only when every chunk failed.
+        """
+        chunks = self._chunk_texts(texts)
+        if len(chunks) == 1:
+            return self._translate_chunk(chunks[0], source_lang, target_lang)
+
+        translations: Dict[str, str] = {}
+        errors = []
+        futures = {
+            self._get_executor().submit(
+                self._translate_chunk, chunk, source_lang, target_lang
+            ): chunk
+            for chunk in chunks
+        }
+
+        for future in as_completed(futures):
+            try:
+                translations.update(future.result())
+            except Exception as e:
+                logger.warning(
+                    f"Translation failed for a chunk of {len(futures[future])} "
+                    f"texts: {e}"
                 )
-                text_to_hash[text] = hash_key
-                hash_to_text[hash_key] = text
+                errors.append(e)
 
-            response = self._session.post(
-                f"{self.base_url}/v1/translate",
-                json={
-                    "texts": text_objects,
-                    "sourceLocale": source_lang,
-                    "targetLocale": target_lang,
-                    "apiKey": self.api_key,
-                    "version": f"py-v{__version__}",
-                },
-                timeout=self.timeout,
+        if len(errors) == len(chunks):
+            raise errors[0]
+
+        return translations
+
+    def _translate_chunk(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Send a single chunk of texts, retrying transient failures"""
+        attempt = 0
+        while True:
+            if self._circuit_open():
+                raise CircuitOpenError("Translation API is unavailable")
+
+            try:
+                translations = self._send_chunk(texts, source_lang, target_lang)
+            except (NetworkError, APIError) as e:
+                self._record_failure(e)
+                if self._retry_policy is None or not self._retry_policy.should_retry(
+                    e, attempt
+                ):
+                    raise
+
+                delay = self._retry_policy.delay(e, attempt)
+                logger.debug(f"Retrying translation request in {delay:.2f}s: {e}")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self._record_success()
+            return translations
+
+    def _send_chunk(
+        self, texts: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """Send a single chunk of texts for translation"""
+        try:
+            payload, hash_to_text = self._translate_payload(
+                texts, source_lang, target_lang
             )
+
+            response = self._post_translate(payload)
             if response.status_code == 200:
-                data = response.json()
-                # The API returns translations directly, not nested under
-                # "translations" key
-                hash_translations = data.get("translations", data)
-                # Fallback to data itself if no "translations" key
-
-                # Convert hash-based response back to text-based
-                text_translations = {}
-                for hash_key, translation in hash_translations.items():
-                    if hash_key in hash_to_text:
-                        original_text = hash_to_text[hash_key]
-                        text_translations[original_text] = translation
-                return text_translations
+                return self._parse_translate_response(
+                    self._decode_response(response), hash_to_text
+                )
             else:
                 self._handle_api_error(response)
 
@@ -302,40 +1378,52 @@ class Translator:
 
         return {}
 
-    def _handle_api_error(self, response: requests.Response) -> None:
-        """Handle API error responses"""
+    def _post(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """POST a JSON payload to an API endpoint"""
+        body, headers = self._encode_request(payload, headers or {})
+        kwargs: Dict[str, Any] = {"json": payload} if body is None else {"data": body}
+        # Only requests that need them carry extra headers
+        if headers:
+            kwargs["headers"] = headers
+        if stream:
+            kwargs["stream"] = True
+        with span("http_request", path=path) as request_span:
+            response = self._session.post(
+                f"{self.base_url}{path}", timeout=self.timeout, **kwargs
+            )
+            request_span.set_attribute("http.status_code", response.status_code)
+        return response
+
+    def _post_translate(self, payload: Dict[str, Any]) -> requests.Response:
+        """POST to /v1/translate, within the request limiter if enabled"""
+        if self._limiter is None and self._metrics is None:
+            return self._post("/v1/translate", payload)
+
+        limited = False
+        if self._limiter is not None:
+            # A call on an event loop thread must not wait for slots held by
+            # that loop's coroutines; others wait as long as a request would
+            timeout = 0.0 if running_loop() is not None else self._wait_timeout()
+            limited = self._limiter.acquire(timeout=timeout)
+            if not limited:
+                logger.debug("No request slot available, sending without one")
+        started = time.monotonic()
+        status_code = None
         try:
-            error_data = response.json()
-            message = error_data.get("error", f"API error: {response.status_code}")
-        except (ValueError, json.JSONDecodeError):
-            message = f"API error: {response.status_code} - {response.text}"
-
-        raise APIError(
-            message, status_code=response.status_code, response_data=error_data
-        )
-
-    def clear_cache(self):
-        """Clear translation cache for this instance's language pairs"""
-        # Only clear cache for this instance's language pairs
-        # This is safer than clearing the entire global cache
-        self._cache.clear(self.source, self.target)
-
-    @classmethod
-    def clear_global_cache(cls):
-        """Clear the entire global shared cache"""
-        from .cache import get_global_cache
-
-        cache = get_global_cache()
-        cache.clear()
-
-    def cache_size(self) -> int:
-        """Get number of cached translations"""
-        return self._cache.size()
-
-    def set_languages(self, source_locale: str, target_locale: str):
-        """Update source and target languages"""
-        self.source = source_locale
-        self.target = target_locale
+            response = self._post("/v1/translate", payload)
+            status_code = response.status_code
+            return response
+        finally:
+            latency = time.monotonic() - started
+            if limited:
+                self._limiter.release(latency, status_code)
+            self._observe_request(payload, latency, status_code)
 
     def translate_template(
         self,
@@ -367,54 +1455,70 @@ class Translator:
         if not isinstance(template, Template):
             raise ValueError("First argument must be a string.Template object")
 
-        # Get the template string
-        template_str = template.template
+        with span("translate_template", params=len(params)):
+            # Get the template string
+            template_str = template.template
 
-        # If no parameters provided, just translate the template string directly
-        if not params:
-            result = self.translate([template_str], target_locale, source_locale)
-            return result[template_str]
+            # If no parameters provided, just translate the template string directly
+            if not params:
+                result = self.translate([template_str], target_locale, source_locale)
+                return result[template_str]
 
-        # Step 1: Extract template variables and create placeholder mapping
-        # Find all $identifier and ${identifier} patterns in the template
-        var_pattern = re.compile(
-            r"\$(?P<named>[_a-z][_a-z0-9]*)|" r"\$\{(?P<braced>[_a-z][_a-z0-9]*)\}",
-            re.IGNORECASE,
-        )
+            # Replace parameters with placeholders so they are never translated.
+            # Cached per template and parameter names, so repeat renders skip
+            # all regex work
+            with span("template_compile"):
+                compiled = compile_template(template_str, frozenset(params))
 
-        # Create unique placeholders for each parameter
-        placeholder_map = {}
-        reverse_placeholder_map = {}
-        param_counter = 1
-
-        for match in var_pattern.finditer(template_str):
-            var_name = match.group("named") or match.group("braced")
-            if var_name in params and var_name not in placeholder_map:
-                # Create a short, unique placeholder to minimize translation costs
-                # Format: X1X, X2X, etc. (unlikely to appear in real text)
-                placeholder = f"X{param_counter}X"
-                placeholder_map[var_name] = placeholder
-                reverse_placeholder_map[placeholder] = str(params[var_name])
-                param_counter += 1
-
-        # Step 2: Replace parameters with placeholders in template
-        protected_template_str = template_str
-        for var_name, placeholder in placeholder_map.items():
-            # Replace both $var and ${var} formats
-            protected_template_str = re.sub(
-                rf"\${var_name}\b|\${{{var_name}\}}",
-                placeholder,
-                protected_template_str,
+            # Translate the protected template
+            translation_result = self.translate(
+                [compiled.protected], target_locale, source_locale
             )
+            translated_text = translation_result[compiled.protected]
 
-        # Step 3: Translate the protected template
-        translation_result = self.translate(
-            [protected_template_str], target_locale, source_locale
-        )
-        translated_text = translation_result[protected_template_str]
+            # Restore original parameter values in a single pass
+            return compiled.render(translated_text, params)
 
-        # Step 4: Restore original parameter values
-        for placeholder, param_value in reverse_placeholder_map.items():
-            translated_text = translated_text.replace(placeholder, param_value)
+    def translate_templates(
+        self,
+        items: Iterable[Tuple[Template, Optional[Mapping]]],
+        target_locale: Optional[str] = None,
+        source_locale: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Translate many Python Templates with parameter protection at once
+
+        All protected templates are looked up together and their cache
+        misses are sent in a single batched request.
+
+        Args:
+            items: (template, params) pairs, params being a mapping of
+                template parameters (or None)
+            target_locale: Target language (optional, uses instance default)
+            source_locale: Source language (optional, uses instance default)
 
-        return translated_text
+        Returns:
+            Translated texts with parameters substituted, in input order
+
+        Example:
+            results = translator.translate_templates([
+                (Template("Hello $name!"), {"name": "John"}),
+                (Template("You have $count messages"), {"count": 5}),
+            ])
+            # Returns: ["Bonjour John!", "Vous avez 5 messages"]
+        """
+        with span("translate_templates"):
+            with span("template_compile"):
+                compiled = self._compile_templates(items)
+            if not compiled:
+                return []
+
+            translations = self.translate(
+                [template.protected for template, _ in compiled],
+                target_locale,
+                source_locale,
+            )
+            return [
+                template.render(translations[template.protected], params)
+                for template, params in compiled
+            ]
@@ -0,0 +1,77 @@
+"""Pooled HTTP transport shared by translators"""
+
+from typing import Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .exceptions import ConfigurationError
+
+# Default API request timeout in seconds
+DEFAULT_TIMEOUT = 30
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Create a ``requests.Session`` with explicit connection pool settings
+
+    Pass the session to several translators (``Translator(session=...)``)
+    to let them reuse the same connections.
+
+    Args:
+        pool_connections: Number of hosts whose connection pools are kept
+        pool_maxsize: Maximum connections kept open per host; should be at
+            least the number of threads sending requests at once, otherwise
+            extra connections are closed after use and re-established (with
+            a new TLS handshake) on the next request
+        pool_block: Wait for a free connection instead of opening one beyond
+            pool_maxsize
+        keep_alive: Reuse connections between requests (False sends
+            ``Connection: close``)
+
+    Returns:
+        The configured session
+    """
+    if pool_connections < 1 or pool_maxsize < 1:
+        raise ConfigurationError("pool_connections and pool_maxsize must be positive")
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def request_timeout(
+    connect_timeout: Optional[float], read_timeout: Optional[float]
+) -> Timeout:
+    """Combine connect and read timeouts into a ``requests`` timeout
+
+    Returns the plain default when neither is set, and a (connect, read)
+    tuple otherwise.
+    """
+    if connect_timeout is None and read_timeout is None:
+        return DEFAULT_TIMEOUT
+
+    for value in (connect_timeout, read_timeout):
+        if value is not None and value <= 0:
+            raise ConfigurationError("Timeouts must be positive")
+
+    return (
+        DEFAULT_TIMEOUT if connect_timeout is None else connect_timeout,
+        DEFAULT_TIMEOUT if read_timeout is None else read_timeout,
+    )
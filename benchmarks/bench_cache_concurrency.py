@@ -0,0 +1,73 @@
+"""Benchmark cache lookup throughput as the number of threads grows
+
+Compares the single-lock TranslationCache with ShardedTranslationCache.
+On a GIL build the shards mostly remove lock hand-offs; on free-threaded
+CPython builds lookups on different shards run in parallel.
+
+Usage:
+    python benchmarks/bench_cache_concurrency.py [--lookups N] [--threads 1,2,4,8]
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from autolocalise.cache import ShardedTranslationCache, TranslationCache
+
+KEYS = [f"UI string number {i}" for i in range(5000)]
+
+
+def populate(cache):
+    for key in KEYS:
+        cache.set(key, f"translated {key}", "en", "fr")
+    return cache
+
+
+def measure(cache, threads: int, lookups: int) -> float:
+    """Return total lookups per second across all threads"""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(offset: int):
+        get = cache.get
+        keys = KEYS
+        count = len(keys)
+        barrier.wait()
+        for i in range(lookups):
+            get(keys[(offset + i) % count], "en", "fr")
+
+    workers = [threading.Thread(target=worker, args=(n * 997,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return threads * lookups / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--threads", default="1,2,4,8")
+    parser.add_argument("--shards", type=int, default=16)
+    args = parser.parse_args()
+
+    caches = {
+        "TranslationCache": populate(TranslationCache()),
+        f"Sharded({args.shards})": populate(ShardedTranslationCache(args.shards)),
+    }
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>8}" + "".join(f"{name:>22}" for name in caches))
+
+    for threads in (int(n) for n in args.threads.split(",")):
+        row = [measure(cache, threads, args.lookups) for cache in caches.values()]
+        print(f"{threads:>8}" + "".join(f"{ops:>18,.0f} /s " for ops in row))
+
+
+if __name__ == "__main__":
+    main()
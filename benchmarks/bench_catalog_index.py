@@ -0,0 +1,80 @@
+"""Benchmark memory and lookup latency of dict vs compact server catalogs
+
+For each catalog size this reports the memory per entry (measured with
+tracemalloc while building the catalog from parsed JSON, so the shared
+input strings are not counted for the compact form), the time to build it,
+and the mean latency of hit and miss lookups as done by the translator
+(``catalog.get(hash)``).
+
+Usage:
+    python benchmarks/bench_catalog_index.py [--sizes 10000,100000,500000]
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from autolocalise.catalog import CompactCatalog
+
+
+def make_response(entries: int) -> bytes:
+    rng = random.Random(entries)
+    catalog = {}
+    while len(catalog) < entries:
+        hash_key = str(rng.randint(-(2**31), 2**31 - 1))
+        catalog[hash_key] = f"Traduction numéro {len(catalog)} d'une chaîne"
+    return json.dumps({"translations": catalog}).encode("utf-8")
+
+
+def build(kind, body):
+    """Parse a response into a catalog; return it with MiB and ms taken"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    translations = json.loads(body)["translations"]
+    if kind == "compact":
+        translations = CompactCatalog(translations)
+    elapsed = time.perf_counter() - started
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return translations, size, elapsed * 1000
+
+
+def lookup_ns(catalog, keys) -> float:
+    """Mean time of one translator-style lookup in nanoseconds"""
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for hash_key in keys:
+            catalog.get(hash_key)
+        best = min(best, time.perf_counter() - started)
+    return best / len(keys) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,500000")
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for size in (int(n) for n in args.sizes.split(",")):
+        body = make_response(size)
+        keys = list(json.loads(body)["translations"])
+        rng = random.Random(0)
+        hits = [rng.choice(keys) for _ in range(args.lookups)]
+        misses = [str(rng.randint(-(2**31), 2**31 - 1)) for _ in range(args.lookups)]
+
+        print(f"{size:,} entries")
+        for kind in ("dict", "compact"):
+            catalog, nbytes, build_ms = build(kind, body)
+            print(
+                f"  {kind:<8} {nbytes / size:6.1f} bytes/entry   build {build_ms:7.1f} ms"
+                f"   hit {lookup_ns(catalog, hits):6.0f} ns"
+                f"   miss {lookup_ns(catalog, misses):6.0f} ns"
+            )
+            del catalog
+
+
+if __name__ == "__main__":
+    main()
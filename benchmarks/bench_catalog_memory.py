@@ -0,0 +1,77 @@
+"""Benchmark peak memory and time of loading a catalog, streamed or not
+
+For each catalog size this loads the catalog from a local stand-in server
+with the default client and with ``stream_catalog=True``, and reports the
+load time, the size of the loaded catalog and the peak memory allocated
+while loading it (measured with tracemalloc, so times include its
+overhead and are only comparable with each other).
+
+Usage:
+    python benchmarks/bench_catalog_memory.py [--sizes 10000,100000,500000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from autolocalise import Translator
+
+# The stand-in API server is shared with the tests
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+)
+from fake_server import FakeAutoLocaliseServer  # noqa: E402
+
+
+def make_catalog(entries: int):
+    return {
+        str(i * 7919 - 2**31): f"Traduction numéro {i} d'une chaîne d'interface"
+        for i in range(entries)
+    }
+
+
+def measure_load(server, options):
+    """Return the load time in ms, retained and peak MiB of one catalog load"""
+    with patch("autolocalise.translator.DEFAULT_BASE_URL", server.url):
+        translator = Translator("bench-key", "en", "fr", **options)
+    translator._catalogs.clear()
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    translator._populate_cache_from_server()
+    elapsed = time.perf_counter() - started
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    translator.close()
+    return elapsed * 1000, retained / 2**20, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,500000")
+    args = parser.parse_args()
+
+    clients = {
+        "response.json()": {},
+        "stream_catalog": {"stream_catalog": True},
+    }
+
+    for size in (int(n) for n in args.sizes.split(",")):
+        print(f"{size:,} entries")
+        with FakeAutoLocaliseServer(
+            catalog=make_catalog(size), cache_catalog=True
+        ) as server:
+            for name, options in clients.items():
+                elapsed, retained, peak = measure_load(server, options)
+                print(
+                    f"  {name:<16} {elapsed:9.1f} ms   catalog {retained:7.1f} MiB"
+                    f"   peak {peak:7.1f} MiB ({peak / retained:.2f}x)"
+                )
+
+
+if __name__ == "__main__":
+    main()
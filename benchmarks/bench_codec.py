@@ -0,0 +1,120 @@
+"""Benchmark JSON codecs and gzip for catalog-sized payloads
+
+For each catalog size this reports:
+
+- encode/decode time of a /v1/translations response with the standard
+  library and with orjson (when installed)
+- size of the body raw and gzipped, and the time gzip takes
+- end-to-end time to load the catalog from a local stand-in server with
+  the default client (requests' JSON) and with a codec plus compression,
+  over a link of the given bandwidth
+
+Usage:
+    python benchmarks/bench_codec.py [--sizes 1000,10000,100000] [--mbps 100]
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+from unittest.mock import patch
+
+from autolocalise import Translator
+from autolocalise.codec import GZIP_LEVEL, JSONCodec, OrjsonCodec, orjson
+
+# The stand-in API server is shared with the tests
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+)
+from fake_server import FakeAutoLocaliseServer  # noqa: E402
+
+
+def make_catalog(entries: int):
+    return {
+        str(i * 7919 - 2**31): f"Traduction numéro {i} d'une chaîne d'interface"
+        for i in range(entries)
+    }
+
+
+def best_of(function, repeat: int = 5) -> float:
+    """Return the fastest of several runs in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def bench_codecs(catalog, codecs):
+    data = {"translations": catalog}
+    for codec in codecs:
+        encoded = codec.dumps(data)
+        dumps = best_of(lambda: codec.dumps(data))
+        loads = best_of(lambda: codec.loads(encoded))
+        print(f"  {codec.name:<8} dumps {dumps:8.2f} ms   loads {loads:8.2f} ms")
+
+    raw = JSONCodec().dumps(data)
+    compressed = gzip.compress(raw, compresslevel=GZIP_LEVEL)
+    gzip_ms = best_of(lambda: gzip.compress(raw, compresslevel=GZIP_LEVEL))
+    gunzip_ms = best_of(lambda: gzip.decompress(compressed))
+    print(
+        f"  body     {len(raw) / 1024:8.0f} KiB raw, {len(compressed) / 1024:6.0f} KiB "
+        f"gzip ({len(compressed) / len(raw):.0%}); gzip {gzip_ms:.2f} ms, "
+        f"gunzip {gunzip_ms:.2f} ms"
+    )
+
+
+def bench_catalog_load(catalog, options, bandwidth):
+    with FakeAutoLocaliseServer(
+        catalog=catalog,
+        compress=options.get("compress", False),
+        bandwidth=bandwidth,
+        cache_catalog=True,
+    ) as server:
+        with patch("autolocalise.translator.DEFAULT_BASE_URL", server.url):
+            translator = Translator("bench-key", "en", "fr", **options["translator"])
+
+        def load():
+            translator._catalogs.clear()
+            translator._populate_cache_from_server()
+
+        elapsed = best_of(load, repeat=3)
+        translator.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument(
+        "--mbps", type=float, default=100, help="simulated bandwidth (0 for none)"
+    )
+    args = parser.parse_args()
+    bandwidth = args.mbps * 125_000 if args.mbps else None
+
+    codecs = [JSONCodec()] + ([OrjsonCodec()] if orjson is not None else [])
+    fast = "orjson" if orjson is not None else "json"
+    clients = {
+        "requests json": {"translator": {}},
+        f"{fast} codec": {"translator": {"json_codec": fast}},
+        f"{fast} codec + gzip": {
+            "translator": {"json_codec": fast, "compress_threshold": 16384},
+            "compress": True,
+        },
+    }
+
+    print(f"Catalog loads over {args.mbps:g} Mbit/s" if bandwidth else "Loopback")
+    for size in (int(n) for n in args.sizes.split(",")):
+        catalog = make_catalog(size)
+        print(f"{size:,} entries")
+        bench_codecs(catalog, codecs)
+        for name, options in clients.items():
+            print(
+                f"  load via {name:<20} {bench_catalog_load(catalog, options, bandwidth):8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark HTTP connection reuse against a local stand-in server
+
+Every thread translates unique texts, so each call is one API request. The
+server counts the TCP connections it accepts: with a pool smaller than the
+number of threads, connections are closed after use and re-opened on the
+next request (a new TLS handshake against the real API).
+
+Usage:
+    python benchmarks/bench_connection_pool.py [--threads N] [--requests N]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+from autolocalise import Translator
+from autolocalise.transport import create_session
+
+# The stand-in API server is shared with the tests
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+)
+from fake_server import FakeAutoLocaliseServer  # noqa: E402
+
+
+def run(server, translators, threads: int, requests: int):
+    """Translate from several threads, returning (connections, seconds)"""
+    Translator.clear_global_cache()
+    server.reset_counters()
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(n: int):
+        barrier.wait()
+        for i in range(requests):
+            translator = translators[(n + i) % len(translators)]
+            translator.translate([f"Thread {n} text {i}"])
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return server.connections, time.perf_counter() - started
+
+
+def make_translators(server, count: int, session_factory):
+    with patch("autolocalise.translator.DEFAULT_BASE_URL", server.url):
+        return [
+            Translator("bench-key", "en", "fr", session=session_factory())
+            for _ in range(count)
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    threads = args.threads
+    shared = create_session(pool_maxsize=threads)
+    scenarios = {
+        "pool_maxsize=2": (1, lambda: create_session(pool_maxsize=2)),
+        "pool_maxsize=10 (requests default)": (1, create_session),
+        f"pool_maxsize={threads}": (1, lambda: create_session(pool_maxsize=threads)),
+        "keep_alive=False": (1, lambda: create_session(keep_alive=False)),
+        "8 translators, own sessions": (8, lambda: create_session(pool_maxsize=2)),
+        "8 translators, shared session": (8, lambda: shared),
+    }
+
+    total = threads * args.requests
+    print(f"{threads} threads x {args.requests} requests, {args.latency * 1000:g} ms")
+    print(f"{'scenario':<36}{'connections':>12}{'requests/conn':>15}{'req/s':>10}")
+
+    with FakeAutoLocaliseServer(latency=args.latency) as server:
+        for name, (count, session_factory) in scenarios.items():
+            translators = make_translators(server, count, session_factory)
+            connections, elapsed = run(server, translators, threads, args.requests)
+            print(
+                f"{name:<36}{connections:>12}{total / max(connections, 1):>15.1f}"
+                f"{total / elapsed:>10,.0f}"
+            )
+            for translator in translators:
+                translator.close()
+
+    shared.close()
+
+
+if __name__ == "__main__":
+    main()
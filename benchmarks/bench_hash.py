@@ -0,0 +1,65 @@
+"""Benchmark the text hash engine against the original per-character loop
+
+Usage:
+    python benchmarks/bench_hash.py [--texts N] [--length CHARS]
+"""
+
+import argparse
+import time
+from unittest.mock import patch
+
+from autolocalise import hashing
+
+
+def reference_hash(text: str) -> str:
+    hash_value = 0
+    for char in text:
+        hash_value = (hash_value << 5) - hash_value + ord(char)
+        hash_value = hash_value & 0xFFFFFFFF
+        if hash_value > 0x7FFFFFFF:
+            hash_value -= 0x100000000
+    return str(hash_value)
+
+
+def measure(function, texts) -> float:
+    """Return texts hashed per second"""
+    hashing._memo.clear()
+    started = time.perf_counter()
+    function(texts)
+    return len(texts) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--length", default="20,200,2000")
+    args = parser.parse_args()
+
+    print(f"NumPy {'available' if hashing.numpy is not None else 'not installed'}")
+    print(f"{'length':>8}{'reference':>16}{'python':>16}{'batch':>16}{'memoized':>16}")
+
+    for length in (int(n) for n in args.length.split(",")):
+        texts = [f"{i:08d}" + "é" * (length - 8) for i in range(args.texts)]
+
+        with patch.object(hashing, "numpy", None):
+            python = measure(hashing.hash_texts, texts)
+
+        row = [
+            measure(lambda items: [reference_hash(t) for t in items], texts),
+            python,
+            measure(hashing.hash_texts, texts),
+        ]
+        hashing.hash_texts(texts[: hashing.HASH_MEMO_SIZE])
+        started = time.perf_counter()
+        for text in texts[: hashing.HASH_MEMO_SIZE]:
+            hashing.text_hash(text)
+        memoized = min(len(texts), hashing.HASH_MEMO_SIZE) / (
+            time.perf_counter() - started
+        )
+        row.append(memoized)
+
+        print(f"{length:>8}" + "".join(f"{rate:>14,.0f}/s" for rate in row))
+
+
+if __name__ == "__main__":
+    main()
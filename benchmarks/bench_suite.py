@@ -0,0 +1,380 @@
+"""Benchmark the translator's hot paths and record the results
+
+Runs against a local stand-in server whose latency and error rate are
+configurable. Each case reports the best time per operation over several
+rounds:
+
+- hash: ``_generate_hash`` of distinct texts, cold and memoized
+- cache_contention: ``TranslationCache`` get/set mix from several threads
+- translate_hit / translate_miss / translate_mix: ``translate`` calls that
+  are fully cached, fully uncached, or mostly cached
+- translate_errors: uncached calls while the server fails requests, so
+  texts fall back to their source
+- translate_template: ``translate_template`` of a cached template
+- catalog_load: loading server translations as a dict, streamed, and
+  compact
+
+Results are written as JSON to
+``benchmarks/results/<version>-<commit>-<time>.json``, so runs never
+overwrite each other. ``results/baseline-0.2.0.json`` was recorded from
+the 0.2.0 release. Passing it (or any earlier result file) with
+``--compare`` prints the change per case and exits with status 1 if any
+case got slower than ``--threshold``.
+
+The suite runs whichever ``autolocalise`` is importable, so an older
+checkout can be measured with ``PYTHONPATH=<checkout>``. Cases using
+options that version lacks are skipped.
+
+Usage:
+    python benchmarks/bench_suite.py [--only hash,translate_hit]
+        [--latency 0.002] [--error-rate 0.2] [--catalog-size 10000]
+        [--output PATH] [--compare PATH] [--threshold 0.3]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+from string import Template
+from typing import Callable, Dict, Optional
+from unittest.mock import patch
+
+import autolocalise
+from autolocalise import Translator
+from autolocalise import translator as translator_module
+from autolocalise._version import __version__
+from autolocalise.cache import TranslationCache
+
+# The stand-in API server is shared with the tests
+sys.path.append(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests")
+)
+from fake_server import FakeAutoLocaliseServer  # noqa: E402
+
+try:
+    from autolocalise import hashing
+except ImportError:  # Releases before hash memoization
+    hashing = None
+else:
+    # An editable install can supply the module to an older checkout
+    if os.path.dirname(hashing.__file__) != os.path.dirname(autolocalise.__file__):
+        hashing = None
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def best_per_op(function: Callable[[], None], operations: int, rounds: int) -> float:
+    """Return the fastest round's seconds per operation"""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best / operations
+
+
+def make_catalog(entries: int) -> Dict[str, str]:
+    return {
+        str(i * 7919 - 2**31): f"Traduction numéro {i} d'une chaîne d'interface"
+        for i in range(entries)
+    }
+
+
+def make_translator(server: FakeAutoLocaliseServer, **options) -> Translator:
+    if hasattr(translator_module, "DEFAULT_BASE_URL"):
+        with patch("autolocalise.translator.DEFAULT_BASE_URL", server.url):
+            return Translator("bench-key", "en", "fr", **options)
+
+    # Older releases hard-code the API URL and load the catalog at once
+    with patch.object(Translator, "_populate_cache_from_server"):
+        translator = Translator("bench-key", "en", "fr", **options)
+    translator.base_url = server.url
+    translator._populate_cache_from_server()
+    return translator
+
+
+def close(translator: Translator) -> None:
+    if hasattr(translator, "close"):
+        translator.close()
+
+
+def source_commit() -> Optional[str]:
+    """Short git commit of the autolocalise checkout being measured"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(autolocalise.__file__)),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Suite:
+    """Benchmark cases sharing one stand-in server"""
+
+    def __init__(self, server: FakeAutoLocaliseServer, args: argparse.Namespace):
+        self.server = server
+        self.args = args
+        self.rounds = args.rounds
+        self.translator = make_translator(server)
+        self._unique = 0
+
+    def unique_texts(self, count: int):
+        """Texts that have never been translated"""
+        self._unique += count
+        return [f"Fresh text {i}" for i in range(self._unique - count, self._unique)]
+
+    def cached_texts(self, count: int):
+        texts = [f"Cached text {i}" for i in range(count)]
+        self.translator.translate(texts)
+        return texts
+
+    def hash(self) -> Dict[str, float]:
+        texts = [f"Button label number {i}" for i in range(2000)]
+        generate = self.translator._generate_hash
+
+        def cold():
+            if hashing is not None:
+                hashing._memo.clear()
+            for text in texts:
+                generate(text)
+
+        def memoized():
+            for text in texts:
+                generate(text)
+
+        results = {"hash_cold": best_per_op(cold, len(texts), self.rounds)}
+        memoized()
+        results["hash_memoized"] = best_per_op(memoized, len(texts), self.rounds)
+        return results
+
+    def cache_contention(self) -> Dict[str, float]:
+        cache = TranslationCache()
+        keys = [f"UI string number {i}" for i in range(5000)]
+        for key in keys:
+            cache.set(key, f"translated {key}", "en", "fr")
+        threads = self.args.threads
+        operations = 20_000
+
+        def worker(offset: int):
+            get, put = cache.get, cache.set
+            for i in range(operations):
+                key = keys[(offset + i) % len(keys)]
+                # One write per ten reads
+                if i % 10:
+                    get(key, "en", "fr")
+                else:
+                    put(key, "updated", "en", "fr")
+
+        def run():
+            workers = [
+                threading.Thread(target=worker, args=(n * 997,)) for n in range(threads)
+            ]
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+
+        return {
+            f"cache_contention_{threads}_threads": best_per_op(
+                run, threads * operations, self.rounds
+            )
+        }
+
+    def translate_hit(self) -> Dict[str, float]:
+        texts = self.cached_texts(100)
+        return {
+            "translate_hit_100": best_per_op(
+                lambda: self.translator.translate(texts), 1, self.rounds * 20
+            )
+        }
+
+    def translate_miss(self) -> Dict[str, float]:
+        return {
+            "translate_miss_10": best_per_op(
+                lambda: self.translator.translate(self.unique_texts(10)),
+                1,
+                self.rounds,
+            )
+        }
+
+    def translate_mix(self) -> Dict[str, float]:
+        cached = self.cached_texts(90)
+        return {
+            "translate_mix_90_hit_10_miss": best_per_op(
+                lambda: self.translator.translate(cached + self.unique_texts(10)),
+                1,
+                self.rounds,
+            )
+        }
+
+    def translate_errors(self) -> Dict[str, float]:
+        self.server.error_rate = self.args.error_rate
+        try:
+            calls = 20
+            seconds = best_per_op(
+                lambda: [
+                    self.translator.translate(self.unique_texts(10))
+                    for _ in range(calls)
+                ],
+                calls,
+                self.rounds,
+            )
+        finally:
+            self.server.error_rate = 0.0
+        return {f"translate_errors_{self.args.error_rate:g}": seconds}
+
+    def translate_template(self) -> Dict[str, float]:
+        template = Template("Hello $name, you have $count new messages")
+        self.translator.translate_template(template, name="Ana", count=3)
+        return {
+            "translate_template": best_per_op(
+                lambda: self.translator.translate_template(
+                    template, name="Ana", count=3
+                ),
+                1,
+                self.rounds * 20,
+            )
+        }
+
+    def catalog_load(self) -> Dict[str, float]:
+        size = self.args.catalog_size
+        results = {}
+        with FakeAutoLocaliseServer(
+            latency=self.args.latency, catalog=make_catalog(size), cache_catalog=True
+        ) as server:
+            for name, options in (
+                ("dict", {}),
+                ("stream", {"stream_catalog": True}),
+                ("compact", {"compact_catalog": True}),
+            ):
+                try:
+                    translator = make_translator(server, **options)
+                except TypeError:
+                    print(f"catalog_load_{size}_{name}: not supported, skipped")
+                    continue
+
+                def load():
+                    if hasattr(translator, "_catalogs"):
+                        translator._catalogs.clear()
+                    translator._populate_cache_from_server()
+
+                results[f"catalog_load_{size}_{name}"] = best_per_op(
+                    load, 1, max(1, self.rounds // 2)
+                )
+                close(translator)
+        return results
+
+
+CASES = (
+    "hash",
+    "cache_contention",
+    "translate_hit",
+    "translate_miss",
+    "translate_mix",
+    "translate_errors",
+    "translate_template",
+    "catalog_load",
+)
+
+
+def compare(results: Dict[str, float], path: str, threshold: float) -> bool:
+    """Print the change from an earlier result file; return True if slower"""
+    with open(path, encoding="utf-8") as f:
+        previous = json.load(f)
+
+    print(f"\nCompared with {previous['version']} ({os.path.basename(path)})")
+    regressed = False
+    for name, seconds in results.items():
+        before = previous["results"].get(name)
+        if before is None:
+            continue
+        change = seconds / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(f"  {name:<36}{change:>+9.1%}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", help="comma-separated cases to run")
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--error-rate", type=float, default=0.2)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--catalog-size", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--output", help="result file (default results/<version>-<commit>-<time>)"
+    )
+    parser.add_argument("--compare", help="earlier result file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.3)
+    args = parser.parse_args()
+
+    cases = args.only.split(",") if args.only else CASES
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    # Injected errors are logged by every failed translate call
+    logging.getLogger("autolocalise").setLevel(logging.CRITICAL)
+
+    results: Dict[str, float] = {}
+    Translator.clear_global_cache()
+    with FakeAutoLocaliseServer(latency=args.latency) as server:
+        suite = Suite(server, args)
+        for case in cases:
+            for name, seconds in getattr(suite, case)().items():
+                results[name] = seconds
+                print(f"{name:<38}{seconds * 1e6:>14,.2f} µs")
+        close(suite.translator)
+
+    commit = source_commit()
+    recorded = time.gmtime()
+    output = args.output or os.path.join(
+        RESULTS_DIR,
+        f"{__version__}-{commit or 'local'}-"
+        f"{time.strftime('%Y%m%dT%H%M%S', recorded)}.json",
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": __version__,
+                "commit": commit,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "numpy": hashing is not None and hashing.numpy is not None,
+                "recorded": time.strftime("%Y-%m-%dT%H:%M:%SZ", recorded),
+                "settings": {
+                    "latency": args.latency,
+                    "error_rate": args.error_rate,
+                    "threads": args.threads,
+                    "catalog_size": args.catalog_size,
+                    "rounds": args.rounds,
+                },
+                # Seconds per operation
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+        f.write("\n")
+    print(f"Results written to {output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -44,12 +44,22 @@ setup(
         "requests>=2.25.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23.0",
+        ],
+        "speedups": [
+            "numpy>=1.17",
+            "orjson>=3.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-mock>=3.0",
             "pytest-cov>=3.0",
             "black>=21.0",
             "flake8>=3.8",
+            "httpx>=0.23.0",
+            "numpy>=1.17",
+            "orjson>=3.0",
         ],
     },
 )
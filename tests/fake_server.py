@@ -0,0 +1,204 @@
+"""Local stand-in for the AutoLocalise API used by tests and benchmarks"""
+
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Room for bursts of new connections when keep-alive is off
+    request_queue_size = 256
+
+
+class FakeAutoLocaliseServer:
+    """Serve /v1/translate and /v1/translations from a background thread
+
+    Translations are produced by prefixing the text with the target locale
+    (``"fr:Hello"``). Every request body is recorded so tests can assert on
+    the API traffic a client generates. Benchmarks can add latency, limit
+    bandwidth and fail a fraction of /v1/translate requests.
+    """
+
+    def __init__(
+        self,
+        catalog: Optional[Dict[str, str]] = None,
+        latency: float = 0.0,
+        compress: bool = False,
+        bandwidth: Optional[float] = None,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+        cache_catalog: bool = False,
+    ):
+        """
+        Args:
+            catalog: Hash-based translations returned by /v1/translations
+            latency: Seconds each response is delayed by
+            compress: Gzip responses for clients that accept it
+            bandwidth: Simulated link speed in bytes per second for
+                request and response bodies (None for loopback speed)
+            error_rate: Fraction of /v1/translate requests answered with
+                error_status instead of translations
+            error_status: HTTP status of injected errors
+            seed: Seed of the random choice of failed requests, so runs
+                fail the same requests
+            cache_catalog: Encode the catalog response once, so the
+                server's own JSON and gzip work is not part of client
+                measurements (the catalog must not change afterwards)
+        """
+        self.catalog = catalog or {}
+        self.latency = latency
+        self.compress = compress
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.cache_catalog = cache_catalog
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+        # Number of TCP connections accepted and of injected errors
+        self.connections = 0
+        self.errors = 0
+        # Content-Encoding of every request body, in order
+        self.encodings: List[Optional[str]] = []
+        self._random = random.Random(seed)
+        self._catalog_bodies: Dict[bool, bytes] = {}
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def requests_for(self, path: str) -> List[Dict[str, Any]]:
+        """Return the recorded request bodies sent to ``path``"""
+        with self._lock:
+            return [
+                body for request_path, body in self.requests if request_path == path
+            ]
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.errors = 0
+
+    def start(self) -> "FakeAutoLocaliseServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeAutoLocaliseServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def handle(self, path: str, body: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Produce the status code and JSON response for a request
+
+        Overrides may return a third element with extra response headers.
+        """
+        if path == "/v1/translations":
+            return 200, {"translations": self.catalog}
+
+        if path == "/v1/translate":
+            if self.error_rate:
+                with self._lock:
+                    failed = self._random.random() < self.error_rate
+                    self.errors += failed
+                if failed:
+                    return self.error_status, {"error": "Injected error"}
+
+            target = body.get("targetLocale")
+            translations = {
+                item["hashkey"]: f"{target}:{item['text']}"
+                for item in body.get("texts", [])
+            }
+            return 200, {"translations": translations}
+
+        return 404, {"error": "Not found"}
+
+    def encode(self, path: str, data: Dict[str, Any], compress: bool) -> bytes:
+        """Encode a response body, reusing the encoded catalog if cached"""
+        cached = self.cache_catalog and path == "/v1/translations"
+        if cached and compress in self._catalog_bodies:
+            return self._catalog_bodies[compress]
+
+        encoded = json.dumps(data).encode("utf-8")
+        if compress:
+            encoded = gzip.compress(encoded, compresslevel=5)
+        if cached:
+            self._catalog_bodies[compress] = encoded
+        return encoded
+
+    def transfer(self, size: int) -> None:
+        """Wait as long as sending size bytes over the simulated link takes"""
+        if self.bandwidth:
+            time.sleep(size / self.bandwidth)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; don't let Nagle's
+            # algorithm hold back the body on kept-alive connections
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length)
+                encoding = self.headers.get("Content-Encoding")
+                if encoding == "gzip":
+                    raw = gzip.decompress(raw)
+                server.transfer(length)
+                body = json.loads(raw or b"{}")
+
+                with server._lock:
+                    server.requests.append((self.path, body))
+                    server.encodings.append(encoding)
+
+                if server.latency:
+                    time.sleep(server.latency)
+
+                status, data, *extra = server.handle(self.path, body)
+                compress = server.compress and "gzip" in self.headers.get(
+                    "Accept-Encoding", ""
+                )
+                encoded = server.encode(self.path, data, compress)
+                server.transfer(len(encoded))
+
+                self.send_response(status)
+                if compress:
+                    self.send_header("Content-Encoding", "gzip")
+                for name, value in (extra[0] if extra else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                if self.close_connection:
+                    self.send_header("Connection", "close")
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
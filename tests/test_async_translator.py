@@ -0,0 +1,395 @@
+"""Tests for the asyncio translator client"""
+
+import asyncio
+import threading
+import time
+from string import Template
+
+import pytest
+
+from autolocalise import AsyncTranslator, Translator
+from autolocalise.cache import get_global_cache
+
+from .fake_server import FakeAutoLocaliseServer
+
+pytest.importorskip("httpx")
+
+
+def make_translator(server, target_locale="fr"):
+    """Create an async translator pointed at the local stand-in server"""
+    translator = AsyncTranslator(
+        api_key="test-key", source_locale="en", target_locale=target_locale
+    )
+    translator.base_url = server.url
+    return translator
+
+
+class TestAsyncTranslator:
+    """Test cases for AsyncTranslator against a local stand-in server"""
+
+    def setup_method(self):
+        """Clear global cache and start a fresh server before each test"""
+        Translator.clear_global_cache()
+        self.server = FakeAutoLocaliseServer().start()
+
+    def teardown_method(self):
+        self.server.stop()
+
+    def test_translate(self):
+        """Test translation of cache misses through the API"""
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                return await translator.translate(["Hello", "World"])
+
+        result = asyncio.run(run())
+
+        assert result == {"Hello": "fr:Hello", "World": "fr:World"}
+        translate_calls = self.server.requests_for("/v1/translate")
+        assert len(translate_calls) == 1
+        assert translate_calls[0]["sourceLocale"] == "en"
+        assert translate_calls[0]["texts"][0] == {
+            "hashkey": "69609650",
+            "text": "Hello",
+            "persist": True,
+        }
+
+    def test_server_translations_loaded_once(self):
+        """Test existing server translations are fetched lazily and reused"""
+        self.server.catalog = {"69609650": "Bonjour"}  # Hash of "Hello"
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                first = await translator.translate(["Hello"])
+                second = await translator(["Hello", "World"])
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == {"Hello": "Bonjour"}
+        assert second == {"Hello": "Bonjour", "World": "fr:World"}
+        assert len(self.server.requests_for("/v1/translations")) == 1
+        assert len(self.server.requests_for("/v1/translate")) == 1
+
+    def test_shares_global_cache(self):
+        """Test that async translations land in the shared global cache"""
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                await translator.translate(["Hello"])
+                # A second call should be served from the cache
+                return await translator.translate(["Hello"])
+
+        assert asyncio.run(run()) == {"Hello": "fr:Hello"}
+        assert get_global_cache().get("Hello", "en", "fr") == "fr:Hello"
+        assert len(self.server.requests_for("/v1/translate")) == 1
+
+    def test_concurrent_translations(self):
+        """Test many coroutines translating concurrently on one loop"""
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                return await asyncio.gather(
+                    *(translator.translate([f"text {i}"], "de") for i in range(20))
+                )
+
+        results = asyncio.run(run())
+
+        for i, result in enumerate(results):
+            assert result == {f"text {i}": f"de:text {i}"}
+
+    def test_translate_template(self):
+        """Test template translation with parameter protection"""
+        template = Template("Hello $name, welcome to ${place}!")
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                return await translator.translate_template(
+                    template, name="Alice", place="Paris"
+                )
+
+        assert asyncio.run(run()) == "fr:Hello Alice, welcome to Paris!"
+        sent = self.server.requests_for("/v1/translate")[0]["texts"][0]["text"]
+        assert sent == "Hello X1X, welcome to X2X!"
+
+    def test_invalid_template_type(self):
+        """Test error handling for non-Template objects"""
+        translator = make_translator(self.server)
+
+        with pytest.raises(ValueError):
+            asyncio.run(translator.translate_template("Not a template"))
+
+    def test_network_error_fallback(self):
+        """Test fallback to original text when the API is unreachable"""
+        translator = make_translator(self.server)
+        self.server.stop()
+
+        result = asyncio.run(translator.translate(["Hello"]))
+
+        assert result == {"Hello": "Hello"}
+
+    def test_large_batch_is_chunked(self):
+        """Test that misses are sent in chunks of max_batch_size texts"""
+        texts = [f"text {i}" for i in range(5)]
+
+        async def run():
+            translator = make_translator(self.server)
+            translator.max_batch_size = 2
+            async with translator:
+                return await translator.translate(texts)
+
+        result = asyncio.run(run())
+
+        assert result == {text: f"fr:{text}" for text in texts}
+        chunk_sizes = sorted(
+            len(body["texts"]) for body in self.server.requests_for("/v1/translate")
+        )
+        assert chunk_sizes == [1, 2, 2]
+
+    def test_chunk_concurrency_bounded_per_translator(self):
+        """Test that max_workers bounds chunk requests across concurrent calls"""
+        in_flight = []
+        peak = []
+
+        async def send_chunk(texts, source_lang, target_lang):
+            in_flight.append(texts)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(texts)
+            return {text: f"fr:{text}" for text in texts}
+
+        async def run():
+            translator = make_translator(self.server)
+            translator.max_batch_size = 1
+            translator.max_workers = 2
+            translator._send_chunk = send_chunk
+            async with translator:
+                return await asyncio.gather(
+                    *(
+                        translator.translate([f"call {i} a", f"call {i} b"])
+                        for i in range(5)
+                    )
+                )
+
+        results = asyncio.run(run())
+
+        assert results[4] == {"call 4 a": "fr:call 4 a", "call 4 b": "fr:call 4 b"}
+        assert len(peak) == 10
+        assert max(peak) == 2
+
+    def test_streamed_catalog_error_reported(self, caplog):
+        """Test that the error body of a streamed catalog response is read"""
+        handle = self.server.handle
+
+        def failing_handle(path, body):
+            if path == "/v1/translations":
+                return 500, {"error": "Catalog unavailable"}
+            return handle(path, body)
+
+        self.server.handle = failing_handle
+
+        async def run():
+            translator = make_translator(self.server)
+            translator.stream_catalog = True
+            async with translator:
+                return await translator.translate(["Hello"])
+
+        with caplog.at_level("ERROR", logger="autolocalise"):
+            assert asyncio.run(run()) == {"Hello": "fr:Hello"}
+
+        assert "Catalog unavailable" in caplog.text
+        assert "read()" not in caplog.text
+
+    def test_waiters_time_out(self):
+        """Test that waiting on a stuck owner falls back after the timeout"""
+
+        async def run():
+            translator = AsyncTranslator(
+                api_key="test-key",
+                source_locale="en",
+                target_locale="fr",
+                read_timeout=0.1,
+                connect_timeout=0.1,
+            )
+            translator.base_url = self.server.url
+            async with translator:
+                started = time.monotonic()
+                result = await translator.translate(["Stuck"])
+                return result, time.monotonic() - started
+
+        registry = AsyncTranslator("test-key", "en", "fr")._inflight
+        owned, _ = registry.claim(["Stuck"], "en", "fr")
+        future = registry._pending[("Stuck", "en", "fr")]
+        try:
+            result, elapsed = asyncio.run(run())
+            # The owner's request is left running
+            assert not future.cancelled()
+        finally:
+            registry.release(owned, {}, "en", "fr")
+
+        assert result == {"Stuck": "Stuck"}
+        assert 0.15 < elapsed < 2
+        assert self.server.requests_for("/v1/translate") == []
+
+    def test_concurrent_identical_misses_share_one_request(self):
+        """Test that identical concurrent misses are coalesced"""
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                return await asyncio.gather(
+                    *(translator.translate(["New string"]) for _ in range(10))
+                )
+
+        results = asyncio.run(run())
+
+        assert all(result == {"New string": "fr:New string"} for result in results)
+        assert len(self.server.requests_for("/v1/translate")) == 1
+
+    def test_background_warmup(self):
+        """Test that the first translation does not wait for the catalog"""
+        release = threading.Event()
+        self.server.catalog = {"69609650": "Bonjour"}  # Hash of "Hello"
+        handle = self.server.handle
+
+        def slow_handle(path, body):
+            if path == "/v1/translations":
+                release.wait(2)
+            return handle(path, body)
+
+        self.server.handle = slow_handle
+
+        async def run():
+            translator = AsyncTranslator(
+                api_key="test-key",
+                source_locale="en",
+                target_locale="fr",
+                background_warmup=True,
+            )
+            translator.base_url = self.server.url
+
+            first = await translator.translate(["Hello"])
+            not_ready = translator.ready()
+            timed_out = await translator.wait_ready(timeout=0.01)
+
+            release.set()
+            finished = await translator.wait_ready(timeout=2)
+            # Drop the API result cached by the first call
+            translator.clear_cache()
+            second = await translator.translate(["Hello"])
+            await translator.aclose()
+            return first, not_ready, timed_out, finished, second
+
+        first, not_ready, timed_out, finished, second = asyncio.run(run())
+
+        assert first == {"Hello": "fr:Hello"}
+        assert not_ready is False
+        assert timed_out is False
+        assert finished is True
+        assert second == {"Hello": "Bonjour"}
+
+    def test_other_locale_loaded_on_first_use(self):
+        """Test that a new target locale fetches its own server translations"""
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                await translator.translate(["Hello"])
+                await translator.translate(["Hello"], target_locale="de")
+                await translator.translate(["World"], target_locale="de")
+
+        asyncio.run(run())
+
+        catalog_calls = self.server.requests_for("/v1/translations")
+        assert [call["targetLocale"] for call in catalog_calls] == ["fr", "de"]
+
+    def test_incremental_refresh(self):
+        """Test that refreshes send the cursor and merge the delta"""
+        handle = self.server.handle
+
+        def delta_handle(path, body):
+            if path == "/v1/translations" and "since" in body:
+                return 200, {
+                    "translations": {"69609650": "Salut"},
+                    "delta": True,
+                    "cursor": body["since"] + 1,
+                }
+            if path == "/v1/translations":
+                return 200, {"translations": {"69609650": "Bonjour"}, "cursor": 1}
+            return handle(path, body)
+
+        self.server.handle = delta_handle
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                first = await translator.translate(["Hello"])
+                await translator.refresh()
+                translator.clear_cache()
+                second = await translator.translate(["Hello"])
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == {"Hello": "Bonjour"}
+        assert second == {"Hello": "Salut"}
+        catalog_calls = self.server.requests_for("/v1/translations")
+        assert [call.get("since") for call in catalog_calls] == [None, 1]
+
+    def test_translate_templates(self):
+        """Test batch template translation in one request"""
+
+        async def run():
+            async with make_translator(self.server) as translator:
+                return await translator.translate_templates(
+                    [
+                        (Template("Hello $name"), {"name": "Alice"}),
+                        (Template("You have ${count} messages"), {"count": 3}),
+                    ]
+                )
+
+        results = asyncio.run(run())
+
+        assert results == ["fr:Hello Alice", "fr:You have 3 messages"]
+        assert len(self.server.requests_for("/v1/translate")) == 1
+
+    def test_store_runs_off_the_event_loop(self, tmp_path):
+        """Test that persistent store reads and writes never block the loop"""
+        from autolocalise.store import SQLiteStore
+
+        self.server.catalog = {"69609650": "Bonjour"}  # Hash of "Hello"
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+        store.set("Stored", "Enregistré", "en", "fr")
+        threads = []
+
+        class RecordingStore:
+            def __getattr__(self, name):
+                method = getattr(store, name)
+
+                def call(*args, **kwargs):
+                    threads.append((name, threading.current_thread()))
+                    return method(*args, **kwargs)
+
+                return call
+
+        async def run():
+            translator = AsyncTranslator(
+                api_key="test-key",
+                source_locale="en",
+                target_locale="fr",
+                store=RecordingStore(),
+            )
+            translator.base_url = self.server.url
+            async with translator:
+                result = await translator.translate(["Hello", "Stored", "New"])
+            return result, threading.current_thread()
+
+        result, loop_thread = asyncio.run(run())
+
+        assert result == {"Hello": "Bonjour", "Stored": "Enregistré", "New": "fr:New"}
+        assert {name for name, _ in threads} >= {
+            "get_catalog",
+            "set_catalog",
+            "get_many",
+            "set_batch",
+        }
+        assert all(thread is not loop_thread for _, thread in threads)
+        assert store.get("New", "en", "fr") == "fr:New"
+        store.close()
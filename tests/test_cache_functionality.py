@@ -1,10 +1,20 @@
 """Tests for cache functionality and thread safety"""
 
+import multiprocessing
+import pytest
 from unittest.mock import Mock, patch
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from autolocalise import Translator
-from autolocalise.cache import TranslationCache, get_global_cache
+from autolocalise.admission import CountMinSketch, TinyLFU
+from autolocalise.exceptions import ConfigurationError
+from autolocalise.cache import (
+    ShardedTranslationCache,
+    TranslationCache,
+    get_global_cache,
+    set_global_cache,
+)
+from autolocalise.shared_cache import SharedMemoryCache
 
 
 class TestCacheBasics:
@@ -157,6 +167,255 @@ class TestCacheBasics:
         assert cache.get("Hello", "en", "fr") == "Salut"
         assert cache.size() == 1  # Size shouldn't change
 
+    def test_get_many(self):
+        """Test looking up several texts at once"""
+        cache = TranslationCache()
+        cache.set_batch({"Hello": "Bonjour", "Goodbye": "Au revoir"}, "en", "fr")
+
+        assert cache.get_many(["Hello", "Missing", "Goodbye"], "en", "fr") == {
+            "Hello": "Bonjour",
+            "Goodbye": "Au revoir",
+        }
+        assert cache.get_many(["Hello"], "en", "es") == {}
+        assert cache.get_many([], "en", "fr") == {}
+
+
+class TestCacheEviction:
+    """Test cases for LRU eviction, TTL expiry and byte budgets"""
+
+    def test_lru_keeps_recently_used_entries(self):
+        """Test that reading an entry protects it from eviction"""
+        cache = TranslationCache(max_size=3)
+
+        for i in range(3):
+            cache.set(f"text_{i}", f"translation_{i}", "en", "fr")
+
+        # Touch the oldest entry so it becomes most recently used
+        assert cache.get("text_0", "en", "fr") == "translation_0"
+
+        cache.set("text_3", "translation_3", "en", "fr")
+
+        assert cache.get("text_0", "en", "fr") == "translation_0"
+        assert cache.get("text_1", "en", "fr") is None
+        assert cache.size() == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_get_many_marks_entries_used_and_drops_expired(self):
+        """Test that bulk lookups refresh LRU order and honour TTLs"""
+        cache = TranslationCache(max_size=3)
+
+        with patch("autolocalise.cache.time.monotonic", return_value=1000.0):
+            cache.set("text_0", "translation_0", "en", "fr", ttl=10)
+            cache.set("text_1", "translation_1", "en", "fr")
+            cache.set("text_2", "translation_2", "en", "fr")
+
+        with patch("autolocalise.cache.time.monotonic", return_value=1050.0):
+            assert cache.get_many(["text_0", "text_1"], "en", "fr") == {
+                "text_1": "translation_1"
+            }
+            assert cache.size() == 2
+
+            cache.set("text_3", "translation_3", "en", "fr")
+            cache.set("text_4", "translation_4", "en", "fr")
+
+            assert cache.get("text_1", "en", "fr") == "translation_1"
+            assert cache.get("text_2", "en", "fr") is None
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after their time-to-live"""
+        cache = TranslationCache(ttl=60)
+
+        with patch("autolocalise.cache.time.monotonic", return_value=1000.0):
+            cache.set("Hello", "Bonjour", "en", "fr")
+            cache.set("Goodbye", "Au revoir", "en", "fr", ttl=300)
+            assert cache.get("Hello", "en", "fr") == "Bonjour"
+
+        with patch("autolocalise.cache.time.monotonic", return_value=1061.0):
+            assert cache.get("Hello", "en", "fr") is None
+            assert cache.get("Goodbye", "en", "fr") == "Au revoir"
+            assert cache.size() == 1
+
+    def test_purge_expired(self):
+        """Test removing every expired entry at once"""
+        cache = TranslationCache()
+
+        with patch("autolocalise.cache.time.monotonic", return_value=1000.0):
+            cache.set("Hello", "Bonjour", "en", "fr", ttl=10)
+            cache.set("Hello", "Hola", "en", "es", ttl=10)
+            cache.set("Goodbye", "Au revoir", "en", "fr")
+
+        with patch("autolocalise.cache.time.monotonic", return_value=1011.0):
+            assert cache.purge_expired() == 2
+
+        assert cache.size() == 1
+        assert cache.get("Goodbye", "en", "fr") == "Au revoir"
+
+    def test_max_bytes_budget(self):
+        """Test that the byte budget evicts least recently used entries"""
+        entry_bytes = TranslationCache()
+        entry_bytes.set("a" * 1000, "b" * 1000, "en", "fr")
+        budget = entry_bytes.size_bytes() * 3
+
+        cache = TranslationCache(max_bytes=budget)
+        for i in range(5):
+            cache.set(f"{i}" * 1000, f"{i}" * 1000, "en", "fr")
+
+        assert cache.size() == 3
+        assert cache.size_bytes() <= budget
+        assert cache.get("0" * 1000, "en", "fr") is None
+        assert cache.get("4" * 1000, "en", "fr") == "4" * 1000
+
+    def test_entry_larger_than_budget_is_not_cached(self):
+        """Test that an entry that can never fit is skipped"""
+        cache = TranslationCache(max_bytes=1000)
+        cache.set("Hello", "Bonjour", "en", "fr")
+
+        cache.set("x" * 2000, "y", "en", "fr")
+
+        assert cache.get("x" * 2000, "en", "fr") is None
+        assert cache.get("Hello", "en", "fr") == "Bonjour"
+
+    def test_byte_accounting_on_overwrite_and_clear(self):
+        """Test that overwriting and clearing keep byte totals consistent"""
+        cache = TranslationCache()
+        cache.set("Hello", "Bonjour", "en", "fr")
+        single = cache.size_bytes()
+
+        cache.set("Hello", "Bonjour", "en", "fr")
+        assert cache.size_bytes() == single
+
+        cache.clear("en", "fr")
+        assert cache.size_bytes() == 0
+
+    def test_set_global_cache(self):
+        """Test replacing the global cache with a configured instance"""
+        original = get_global_cache()
+        custom = TranslationCache(max_size=10, ttl=5)
+
+        try:
+            set_global_cache(custom)
+            assert get_global_cache() is custom
+            translator = Translator(
+                api_key="test", source_locale="en", target_locale="fr"
+            )
+            assert translator._cache is custom
+        finally:
+            set_global_cache(original)
+
+
+def simulate_hit_ratio(cache, rounds=20, hot_keys=50, one_offs_per_round=200):
+    """Replay a workload of hot UI strings mixed with one-off texts
+
+    Returns the hit ratio for the hot strings only.
+    """
+    hits = lookups = 0
+    one_off = 0
+
+    for _ in range(rounds):
+        for i in range(hot_keys):
+            key = f"hot_{i}"
+            lookups += 1
+            if cache.get(key, "en", "fr") is not None:
+                hits += 1
+            else:
+                cache.set(key, f"translated_{key}", "en", "fr")
+
+        for _ in range(one_offs_per_round):
+            key = f"user_text_{one_off}"
+            one_off += 1
+            if cache.get(key, "en", "fr") is None:
+                cache.set(key, f"translated_{key}", "en", "fr")
+
+    return hits / lookups
+
+
+class TestCacheAdmission:
+    """Test cases for the TinyLFU admission policy"""
+
+    def test_count_min_sketch_estimates(self):
+        """Test frequency estimates and saturation"""
+        sketch = CountMinSketch(width=64)
+
+        for _ in range(5):
+            sketch.increment("popular")
+        sketch.increment("rare")
+
+        assert sketch.estimate("popular") >= 5
+        assert sketch.estimate("rare") >= 1
+        assert sketch.estimate("popular") > sketch.estimate("rare")
+
+        for _ in range(100):
+            sketch.increment("saturated")
+        assert sketch.estimate("saturated") == 15
+
+    def test_count_min_sketch_halve(self):
+        """Test that halving ages every counter"""
+        sketch = CountMinSketch(width=16)
+        for _ in range(8):
+            sketch.increment("key")
+
+        sketch.halve()
+
+        assert sketch.estimate("key") == 4
+
+    def test_tinylfu_aging(self):
+        """Test that TinyLFU forgets old popularity after its sample size"""
+        policy = TinyLFU(capacity=10)
+        for _ in range(9):
+            policy.record("key")
+        assert policy.frequency("key") == 9
+
+        for i in range(policy.sample_size - 9):
+            policy.record(f"filler_{i}")
+
+        assert policy.frequency("key") == 4
+
+    def test_tinylfu_admit(self):
+        """Test that admission favours the more frequent key"""
+        policy = TinyLFU(capacity=100)
+        for _ in range(3):
+            policy.record("frequent")
+        policy.record("infrequent")
+
+        assert policy.admit("frequent", "infrequent")
+        assert not policy.admit("infrequent", "frequent")
+
+    def test_one_off_entries_do_not_flush_hot_set(self):
+        """Test that TinyLFU keeps hot strings under a scan of one-offs"""
+        lru = TranslationCache(max_size=100)
+        tinylfu = TranslationCache(max_size=100, admission="tinylfu")
+
+        lru_ratio = simulate_hit_ratio(lru)
+        tinylfu_ratio = simulate_hit_ratio(tinylfu)
+
+        assert tinylfu_ratio > 0.8
+        assert tinylfu_ratio > lru_ratio
+        assert tinylfu.stats()["rejections"] > 0
+
+    def test_admits_while_not_full(self):
+        """Test that admission only applies once the cache is full"""
+        cache = TranslationCache(max_size=3, admission="tinylfu")
+
+        for i in range(3):
+            cache.set(f"text_{i}", f"translation_{i}", "en", "fr")
+
+        assert cache.size() == 3
+        assert cache.stats()["rejections"] == 0
+
+    def test_updates_bypass_admission(self):
+        """Test that overwriting an existing entry is always allowed"""
+        cache = TranslationCache(max_size=1, admission="tinylfu")
+        cache.set("Hello", "Bonjour", "en", "fr")
+
+        cache.set("Hello", "Salut", "en", "fr")
+
+        assert cache.get("Hello", "en", "fr") == "Salut"
+
+    def test_unknown_admission_policy(self):
+        """Test that an unknown policy name is rejected"""
+        with pytest.raises(ConfigurationError):
+            TranslationCache(admission="lfu")
+
 
 class TestCacheThreadSafety:
     """Test cases for cache thread safety"""
@@ -202,6 +461,82 @@ class TestCacheThreadSafety:
         assert translator._cache is cache1
 
 
+class TestShardedCache:
+    """Test cases for the lock-striped cache"""
+
+    def test_basic_operations(self):
+        """Test that the sharded cache behaves like TranslationCache"""
+        cache = ShardedTranslationCache(shards=4)
+
+        cache.set("Hello", "Bonjour", "en", "fr")
+        cache.set_batch({"Goodbye": "Au revoir", "Thanks": "Merci"}, "en", "fr")
+        cache.set("Hello", "Hola", "en", "es")
+
+        assert cache.get("Hello", "en", "fr") == "Bonjour"
+        assert cache.get("Goodbye", "en", "fr") == "Au revoir"
+        assert cache.get("Hello", "en", "es") == "Hola"
+        assert cache.get("Missing", "en", "fr") is None
+        assert cache.size() == 4
+
+        cache.clear("en", "fr")
+        assert cache.size() == 1
+        cache.clear()
+        assert cache.size() == 0
+
+    def test_get_many(self):
+        """Test bulk lookups across shards"""
+        cache = ShardedTranslationCache(shards=4)
+        translations = {f"text_{i}": f"t_{i}" for i in range(50)}
+        cache.set_batch(translations, "en", "fr")
+
+        found = cache.get_many(list(translations) + ["missing"], "en", "fr")
+
+        assert found == translations
+
+    def test_entries_spread_over_shards(self):
+        """Test that keys are distributed across shards"""
+        cache = ShardedTranslationCache(shards=8)
+        cache.set_batch({f"text_{i}": f"t_{i}" for i in range(200)}, "en", "fr")
+
+        used = [shard.size() for shard in cache._shards if shard.size() > 0]
+        assert len(used) == 8
+        assert cache.stats()["entries"] == 200
+        assert cache.stats()["shards"] == 8
+
+    def test_limits_divided_between_shards(self):
+        """Test that max_size bounds the total across shards"""
+        cache = ShardedTranslationCache(shards=4, max_size=40)
+        for i in range(400):
+            cache.set(f"text_{i}", f"t_{i}", "en", "fr")
+
+        assert cache.size() <= 40
+        assert cache.stats()["evictions"] >= 360
+
+    def test_concurrent_access(self):
+        """Test concurrent reads and writes from multiple threads"""
+        cache = ShardedTranslationCache(shards=4)
+        results = []
+
+        def worker(thread_id):
+            for i in range(100):
+                cache.set(f"text_{thread_id}_{i}", f"t_{thread_id}_{i}", "en", "fr")
+            for i in range(100):
+                value = cache.get(f"text_{thread_id}_{i}", "en", "fr")
+                results.append(value == f"t_{thread_id}_{i}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(worker, i) for i in range(8)]:
+                future.result()
+
+        assert all(results)
+        assert cache.size() == 800
+
+    def test_invalid_shard_count(self):
+        """Test that a non-positive shard count is rejected"""
+        with pytest.raises(ConfigurationError):
+            ShardedTranslationCache(shards=0)
+
+
 class TestSharedCache:
     """Test cases for shared cache functionality"""
 
@@ -397,3 +732,212 @@ class TestCacheOperations:
         Translator.clear_global_cache()
         assert t1.cache_size() == 0
         assert t2.cache_size() == 0
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_translate_uses_bulk_cache_operations(self, mock_post):
+        """Test one cache read and one write per call, with inputs deduped"""
+        mock_post.side_effect = [
+            Mock(status_code=404),
+            Mock(
+                status_code=200,
+                json=lambda: {"translations": {"83766130": "Monde"}},
+            ),
+        ]
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+        translator._cache.set("Hello", "Bonjour", "en", "fr")
+        cache = translator._cache
+
+        with patch.object(
+            cache, "get_many", wraps=cache.get_many
+        ) as get_many, patch.object(
+            cache, "set_batch", wraps=cache.set_batch
+        ) as set_batch, patch.object(
+            cache, "get"
+        ) as get, patch.object(
+            cache, "set"
+        ) as set_:
+            result = translator.translate(["Hello", "World", "Hello", "World"])
+
+        assert result == {"Hello": "Bonjour", "World": "Monde"}
+        get_many.assert_called_once_with(["Hello", "World"], "en", "fr")
+        set_batch.assert_called_once_with({"World": "Monde"}, "en", "fr", ttl=None)
+        get.assert_not_called()
+        set_.assert_not_called()
+        sent = mock_post.call_args.kwargs["json"]["texts"]
+        assert [item["text"] for item in sent] == ["World"]
+
+
+def write_shared_translations(path, worker_id):
+    """Write translations to a shared cache from a separate process"""
+    cache = SharedMemoryCache(path, max_size=1000)
+    for i in range(50):
+        cache.set(f"text_{worker_id}_{i}", f"translation_{worker_id}_{i}", "en", "fr")
+    cache.close()
+
+
+class TestSharedMemoryCache:
+    """Test cases for the cross-process shared memory cache"""
+
+    def test_basic_operations(self, tmp_path):
+        """Test storing, reading and clearing translations"""
+        cache = SharedMemoryCache(str(tmp_path / "cache"), max_size=100)
+
+        assert cache.get("Hello", "en", "fr") is None
+
+        cache.set("Hello", "Bonjour", "en", "fr")
+        cache.set_batch({"Goodbye": "Au revoir", "Hello": "Salut"}, "en", "fr")
+        cache.set("Hello", "Hola", "en", "es")
+
+        assert cache.get("Hello", "en", "fr") == "Salut"
+        assert cache.get("Hello", "en", "es") == "Hola"
+        assert cache.get("Héllo wörld 🌍", "en", "fr") is None
+        assert cache.size() == 3
+        assert cache.stats() == {
+            "entries": 3,
+            "bytes": cache.size_bytes(),
+            "evictions": 0,
+            "rejections": 0,
+        }
+
+        cache.clear("en", "fr")
+        assert cache.get("Hello", "en", "fr") is None
+        assert cache.get("Hello", "en", "es") == "Hola"
+        assert cache.size() == 1
+
+        cache.clear()
+        assert cache.size() == 0
+        cache.close()
+
+    def test_visible_to_other_instances(self, tmp_path):
+        """Test that a second mapping of the same file sees the entries"""
+        path = str(tmp_path / "cache")
+        first = SharedMemoryCache(path, max_size=100)
+        # Geometry is decided by the process that created the file
+        second = SharedMemoryCache(path, max_size=5)
+
+        first.set("Héllo wörld 🌍", "Bonjour le monde 🌍", "en", "fr")
+        assert second.get("Héllo wörld 🌍", "en", "fr") == "Bonjour le monde 🌍"
+
+        first.close()
+        second.close()
+
+    def test_visible_across_processes(self, tmp_path):
+        """Test that translations written by other processes are shared"""
+        path = str(tmp_path / "cache")
+        cache = SharedMemoryCache(path, max_size=1000)
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=4, mp_context=context) as executor:
+            list(executor.map(write_shared_translations, [path] * 4, range(4)))
+
+        assert cache.size() == 200
+        assert cache.get("text_3_49", "en", "fr") == "translation_3_49"
+        cache.close()
+
+    def test_full_cache_is_reset(self, tmp_path):
+        """Test that the cache starts over instead of growing"""
+        cache = SharedMemoryCache(str(tmp_path / "cache"), max_size=10)
+
+        for i in range(30):
+            cache.set(f"text_{i}", f"translation_{i}", "en", "fr")
+
+        assert cache.size() <= 12
+        assert cache.get("text_29", "en", "fr") == "translation_29"
+        assert cache.stats()["evictions"] > 0
+
+        small = SharedMemoryCache(str(tmp_path / "small"), max_bytes=200)
+        for i in range(10):
+            small.set(f"text_{i}", "x" * 50, "en", "fr")
+        assert small.size_bytes() <= 200
+        assert small.get("text_9", "en", "fr") == "x" * 50
+
+        cache.close()
+        small.close()
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test that expired entries are not returned"""
+        cache = SharedMemoryCache(str(tmp_path / "cache"), max_size=100)
+
+        with patch("autolocalise.shared_cache.time.time", return_value=1000.0):
+            cache.set("Hello", "Bonjour", "en", "fr", ttl=10)
+            cache.set("Goodbye", "Au revoir", "en", "fr", ttl=100)
+            cache.set("Thanks", "Merci", "en", "fr")
+
+        with patch("autolocalise.shared_cache.time.time", return_value=1050.0):
+            assert cache.get("Hello", "en", "fr") is None
+            assert cache.get("Goodbye", "en", "fr") == "Au revoir"
+
+        with patch("autolocalise.shared_cache.time.time", return_value=2000.0):
+            assert cache.purge_expired() == 1
+            assert cache.get("Thanks", "en", "fr") == "Merci"
+
+        assert cache.size() == 1
+        cache.close()
+
+    def test_get_many(self, tmp_path):
+        """Test bulk lookups, dropping expired entries"""
+        cache = SharedMemoryCache(str(tmp_path / "cache"), max_size=100)
+
+        with patch("autolocalise.shared_cache.time.time", return_value=1000.0):
+            cache.set("Hello", "Bonjour", "en", "fr", ttl=10)
+            cache.set_batch(
+                {"Goodbye": "Au revoir", "Héllo 🌍": "Salut 🌍"}, "en", "fr"
+            )
+
+        with patch("autolocalise.shared_cache.time.time", return_value=1050.0):
+            found = cache.get_many(
+                ["Hello", "Goodbye", "Héllo 🌍", "Missing"], "en", "fr"
+            )
+
+        assert found == {"Goodbye": "Au revoir", "Héllo 🌍": "Salut 🌍"}
+        assert cache.size() == 2
+        cache.close()
+
+    def test_expired_entry_rewritten_meanwhile_is_kept(self, tmp_path):
+        """Test that dropping an expired entry keeps a fresh value written by
+        another process between the read and the delete"""
+        path = str(tmp_path / "cache")
+        cache = SharedMemoryCache(path, max_size=100)
+        other = SharedMemoryCache(path, max_size=100)
+        locked = cache._locked
+        rewrites = ["Hello", "Goodbye"]
+
+        def rewrite_then_lock(exclusive):
+            if exclusive:
+                other.set(rewrites.pop(0), "Salut", "en", "fr")
+            return locked(exclusive)
+
+        with patch("autolocalise.shared_cache.time.time", return_value=1000.0):
+            cache.set_batch(
+                {"Hello": "Bonjour", "Goodbye": "Au revoir"}, "en", "fr", 10
+            )
+
+        with patch("autolocalise.shared_cache.time.time", return_value=1050.0):
+            with patch.object(cache, "_locked", rewrite_then_lock):
+                assert cache.get("Hello", "en", "fr") is None
+                assert cache.get_many(["Goodbye"], "en", "fr") == {}
+
+        assert cache.get("Hello", "en", "fr") == "Salut"
+        assert cache.get("Goodbye", "en", "fr") == "Salut"
+        cache.close()
+        other.close()
+
+    def test_as_global_cache(self, tmp_path):
+        """Test installing the shared cache as the global cache"""
+        cache = SharedMemoryCache(str(tmp_path / "cache"))
+        previous = get_global_cache()
+        set_global_cache(cache)
+        try:
+            with patch("autolocalise.translator.requests.Session.post") as mock_post:
+                mock_post.return_value = Mock(status_code=404)
+                translator = Translator(
+                    api_key="test-key", source_locale="en", target_locale="fr"
+                )
+            cache.set("Hello", "Bonjour", "en", "fr")
+
+            assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
+        finally:
+            set_global_cache(previous)
+            cache.close()
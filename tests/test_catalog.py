@@ -0,0 +1,466 @@
+"""Tests for the per-locale server translation index"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from autolocalise import Translator
+from autolocalise.catalog import CatalogIndex, CompactCatalog
+from autolocalise.exceptions import ConfigurationError
+from autolocalise.store import SQLiteStore
+
+# Hash of "Hello"
+HELLO = "69609650"
+
+CATALOGS = {
+    "fr": {HELLO: "Bonjour"},
+    "de": {HELLO: "Hallo"},
+    "es": {HELLO: "Hola"},
+}
+
+
+def catalog_post(url, json=None, timeout=None):
+    """Stand-in for Session.post serving a catalog per target locale"""
+    if url.endswith("/v1/translations"):
+        catalog = CATALOGS.get(json["targetLocale"])
+        if catalog is None:
+            return Mock(status_code=404)
+        return Mock(status_code=200, json=lambda: {"translations": catalog})
+
+    translations = {
+        item["hashkey"]: f"{json['targetLocale']}:{item['text']}"
+        for item in json["texts"]
+    }
+    return Mock(status_code=200, json=lambda: {"translations": translations})
+
+
+def catalog_requests(mock_post):
+    """Target locales requested from /v1/translations, in order"""
+    return [
+        call[1]["json"]["targetLocale"]
+        for call in mock_post.call_args_list
+        if call[0][0].endswith("/v1/translations")
+    ]
+
+
+class TestCatalogIndex:
+    """Test cases for CatalogIndex"""
+
+    def test_load_and_get(self):
+        """Test that language pairs are stored separately"""
+        index = CatalogIndex()
+
+        assert index.get("en", "fr") is None
+        assert not index.is_loaded("en", "fr")
+
+        index.load({HELLO: "Bonjour"}, "en", "fr")
+        index.load({}, "en", "de")
+
+        assert index.is_loaded("en", "fr")
+        assert index.get("en", "fr") == {HELLO: "Bonjour"}
+        assert index.get("en", "de") == {}
+        assert index.get("en", "es") is None
+
+    def test_max_locales(self):
+        """Test that the least recently used language pair is dropped"""
+        index = CatalogIndex(max_locales=2)
+        index.load({"1": "a"}, "en", "fr")
+        index.load({"1": "b"}, "en", "de")
+        index.get("en", "fr")
+        index.load({"1": "c"}, "en", "es")
+
+        assert index.is_loaded("en", "fr")
+        assert not index.is_loaded("en", "de")
+        assert index.is_loaded("en", "es")
+        assert index.stats()["evictions"] == 1
+
+    def test_max_entries(self):
+        """Test that each language pair keeps at most max_entries"""
+        index = CatalogIndex(max_entries=10)
+        index.load({str(i): f"t{i}" for i in range(100)}, "en", "fr")
+
+        assert len(index.get("en", "fr")) == 10
+
+    def test_stats(self):
+        """Test per-locale entry counts and memory estimates"""
+        index = CatalogIndex()
+        index.load({str(i): f"t{i}" for i in range(100)}, "en", "fr")
+        index.load({"1": "a"}, "en", "de")
+
+        stats = index.stats()
+        assert stats["entries"] == 101
+        assert stats["locales"]["en:fr"]["entries"] == 100
+        assert stats["locales"]["en:fr"]["bytes"] > stats["locales"]["en:de"]["bytes"]
+        assert stats["bytes"] == sum(
+            locale["bytes"] for locale in stats["locales"].values()
+        )
+
+
+class TestCompactCatalog:
+    """Test cases for CompactCatalog and compact catalog storage"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    def test_mapping_matches_dict(self):
+        """Test lookups, iteration and non-integer keys"""
+        translations = {str(i * 7919 - 2**31): f"Grüße {i}" for i in range(1000)}
+        translations.update(
+            {str(2**31 - 1): "max", "12x": "text key", "007": "padded", "": "empty"}
+        )
+        catalog = CompactCatalog(translations)
+
+        assert len(catalog) == len(translations)
+        assert catalog == translations
+        assert dict(catalog) == translations
+        assert catalog[str(2**31 - 1)] == "max"
+        assert catalog.get("007") == "padded"
+        assert "7" not in catalog
+        assert catalog.get("7", "default") == "default"
+        assert catalog.get(str(2**31)) is None
+        with pytest.raises(KeyError):
+            catalog["1"]
+
+    def test_empty(self):
+        catalog = CompactCatalog({})
+
+        assert not catalog
+        assert catalog.get(HELLO) is None
+        assert list(catalog) == []
+
+    def test_uses_less_memory(self):
+        """Test that compact storage is reported smaller than a dict"""
+        translations = {str(i * 7919): f"translation {i}" for i in range(10_000)}
+        plain = CatalogIndex()
+        compact = CatalogIndex(compact=True)
+        plain.load(translations, "en", "fr")
+        compact.load(translations, "en", "fr")
+
+        assert compact.get("en", "fr") == plain.get("en", "fr")
+        assert compact.stats()["bytes"] < plain.stats()["bytes"] / 2
+
+    def test_merge(self):
+        """Test that merges into a compact pair keep it compact"""
+        index = CatalogIndex(compact=True)
+        index.load({"1": "a", "2": "b"}, "en", "fr", cursor=1)
+
+        assert index.merge({"1": "A", "3": "c"}, ["2"], "en", "fr", cursor=2)
+
+        assert isinstance(index.get("en", "fr"), CompactCatalog)
+        assert index.get("en", "fr") == {"1": "A", "3": "c"}
+        assert index.stats()["locales"]["en:fr"]["entries"] == 2
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_translator_with_compact_catalog(self, mock_post):
+        """Test that server translations are served from compact storage"""
+        mock_post.side_effect = catalog_post
+        translator = Translator("test-key", "en", "fr", compact_catalog=True)
+
+        assert isinstance(translator._server_translations, CompactCatalog)
+        assert translator.translate(["Hello", "World"]) == {
+            "Hello": "Bonjour",
+            "World": "fr:World",
+        }
+
+
+class TestPerLocaleCatalogs:
+    """Test cases for loading server translations per target locale"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_other_locale_loaded_on_first_use(self, mock_post):
+        """Test that each target locale uses its own server translations"""
+        mock_post.side_effect = catalog_post
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+
+        assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
+        assert translator.translate(["Hello"], target_locale="de") == {"Hello": "Hallo"}
+        translator.translate(["Hello"], target_locale="de")
+
+        assert catalog_requests(mock_post) == ["fr", "de"]
+        translate_calls = [
+            call for call in mock_post.call_args_list if "v1/translate" in str(call)
+        ]
+        assert len(translate_calls) == 0
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_preload_locales(self, mock_post):
+        """Test that configured locales are loaded at startup"""
+        mock_post.side_effect = catalog_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            preload_locales=["de", "es", "fr"],
+        )
+
+        assert sorted(catalog_requests(mock_post)) == ["de", "es", "fr"]
+        assert translator.ready()
+        assert translator.catalog_stats()["entries"] == 3
+
+        assert translator.translate(["Hello"], target_locale="es") == {"Hello": "Hola"}
+        assert len(mock_post.call_args_list) == 3
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_background_preload(self, mock_post):
+        """Test that preloading can run in the background"""
+        mock_post.side_effect = catalog_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            background_warmup=True,
+            preload_locales=["de"],
+        )
+
+        assert translator.wait_ready(timeout=2)
+        assert sorted(catalog_requests(mock_post)) == ["de", "fr"]
+        translator.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_close_joins_catalog_loads(self, mock_post):
+        """Test that close() waits for locales loading in the background"""
+
+        def slow_post(url, json=None, timeout=None):
+            if url.endswith("/v1/translations") and json["targetLocale"] == "de":
+                time.sleep(0.2)
+            return catalog_post(url, json=json, timeout=timeout)
+
+        mock_post.side_effect = slow_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            background_warmup=True,
+        )
+        assert translator.wait_ready(timeout=2)
+
+        # Falls back while the locale loads on its own thread
+        translator.translate(["Hello"], target_locale="de")
+        translator.close()
+
+        assert translator._catalogs.is_loaded("en", "de")
+        assert not any(
+            thread.name == "autolocalise-catalog" for thread in threading.enumerate()
+        )
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_max_catalog_locales(self, mock_post):
+        """Test that dropped locales are loaded again when used"""
+        mock_post.side_effect = catalog_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            max_catalog_locales=1,
+        )
+
+        translator.translate(["Hello"], target_locale="de")
+        Translator.clear_global_cache()
+        assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
+
+        assert catalog_requests(mock_post) == ["fr", "de", "fr"]
+        assert list(translator.catalog_stats()["locales"]) == ["en:fr"]
+
+
+def catalog_response(translations, etag=None, **fields):
+    """Mock /v1/translations response"""
+    headers = {"ETag": etag} if etag else {}
+    data = dict(fields, translations=translations)
+    return Mock(status_code=200, headers=headers, json=lambda: data)
+
+
+class TestCatalogSync:
+    """Test cases for conditional and incremental catalog refreshes"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    def test_merge(self):
+        """Test that merges only touch the changed hashes"""
+        index = CatalogIndex(max_entries=3)
+        assert not index.merge({"1": "a"}, [], "en", "fr")
+
+        index.load({"1": "a", "2": "b"}, "en", "fr", etag='"v1"', cursor=1)
+        size = index.stats()["bytes"]
+
+        assert index.merge({"1": "A", "3": "c", "4": "d"}, ["2"], "en", "fr", cursor=2)
+        assert index.get("en", "fr") == {"1": "A", "3": "c", "4": "d"}
+        assert index.validators("en", "fr") == (None, 2)
+        assert index.stats()["bytes"] > size
+
+        # Full, so new hashes are dropped but existing ones still update
+        index.merge({"5": "e", "1": "B"}, [], "en", "fr")
+        assert index.get("en", "fr") == {"1": "B", "3": "c", "4": "d"}
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_unchanged_catalog_is_not_downloaded(self, mock_post):
+        """Test that refreshes send the ETag and keep the catalog on 304"""
+        mock_post.side_effect = [
+            catalog_response({HELLO: "Bonjour"}, etag='"v1"'),
+            Mock(status_code=304, headers={}),
+        ]
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+        translator.refresh()
+
+        refresh_call = mock_post.call_args_list[1]
+        assert refresh_call[1]["headers"] == {"If-None-Match": '"v1"'}
+        assert "since" not in refresh_call[1]["json"]
+        assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_incremental_refresh(self, mock_post):
+        """Test that deltas are requested with the cursor and merged"""
+        mock_post.side_effect = [
+            catalog_response({HELLO: "Bonjour", "1": "un"}, cursor=41),
+            catalog_response({HELLO: "Salut"}, delta=True, deleted=["1"], cursor=42),
+        ]
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+        assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
+
+        translator.refresh()
+        Translator.clear_global_cache()
+
+        assert mock_post.call_args_list[1][1]["json"]["since"] == 41
+        assert "headers" not in mock_post.call_args_list[1][1]
+        assert translator._server_translations == {HELLO: "Salut"}
+        assert translator.translate(["Hello"]) == {"Hello": "Salut"}
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_incremental_refresh_saves_only_changes(self, mock_post, tmp_path):
+        """Test that a merged delta is written to the store as a delta"""
+        mock_post.side_effect = [
+            catalog_response({HELLO: "Bonjour", "1": "un"}, cursor=41),
+            catalog_response({HELLO: "Salut"}, delta=True, deleted=["1"], cursor=42),
+        ]
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", store=store
+        )
+
+        with patch.object(store, "set_catalog") as set_catalog, patch.object(
+            store, "update_catalog", wraps=store.update_catalog
+        ) as update_catalog:
+            translator.refresh()
+
+        set_catalog.assert_not_called()
+        update_catalog.assert_called_once_with(
+            {HELLO: "Salut"}, ["1"], "en", "fr", etag=None, cursor=42
+        )
+        assert store.get_catalog("en", "fr") == {
+            "translations": {HELLO: "Salut"},
+            "etag": None,
+            "cursor": 42,
+        }
+        store.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_delta_for_evicted_pair_is_dropped(self, mock_post):
+        """Test that a delta arriving after its pair was evicted is not
+        loaded as the full catalog, so the pair is loaded again in full"""
+        mock_post.side_effect = [
+            catalog_response({HELLO: "Bonjour", "1": "un"}, cursor=41),
+            catalog_response({HELLO: "Bonjour", "1": "un"}, cursor=43),
+        ]
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+        translator._catalogs.clear()
+
+        translator._load_server_translations(
+            {"translations": {HELLO: "Salut"}, "delta": True, "cursor": 42},
+            "en",
+            "fr",
+        )
+
+        assert not translator._catalogs.is_loaded("en", "fr")
+        assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
+        assert "since" not in mock_post.call_args_list[1][1]["json"]
+        assert translator._catalogs.validators("en", "fr") == (None, 43)
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_failed_refresh_keeps_catalog(self, mock_post):
+        """Test that a failed refresh does not drop loaded translations"""
+        mock_post.side_effect = [
+            catalog_response({HELLO: "Bonjour"}),
+            requests.exceptions.ConnectionError("Network error"),
+        ]
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+        translator.refresh()
+
+        assert translator._server_translations == {HELLO: "Bonjour"}
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_background_refresh(self, mock_post):
+        """Test that the refresher re-syncs loaded locales periodically"""
+        refreshed = threading.Event()
+
+        def post(url, json=None, timeout=None, headers=None):
+            if mock_post.call_count >= 3:
+                refreshed.set()
+            return catalog_response({HELLO: "Bonjour"}, etag='"v1"')
+
+        mock_post.side_effect = post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            refresh_interval=0.01,
+        )
+
+        assert refreshed.wait(2)
+        translator.close()
+        assert translator._refresh_thread is not None
+        assert not translator._refresh_thread.is_alive()
+
+        # Cached translations expire so refreshed edits become visible
+        translator.translate(["Hello"])
+        assert translator._cache._cache["en:fr"]["Hello"][1] is not None
+
+    def test_invalid_refresh_interval(self):
+        """Test that a non-positive refresh interval is rejected"""
+        with pytest.raises(ConfigurationError):
+            Translator(
+                api_key="test-key",
+                source_locale="en",
+                target_locale="fr",
+                refresh_interval=0,
+            )
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_restart_reuses_saved_catalog(self, mock_post, tmp_path):
+        """Test that a restarted translator revalidates the saved catalog"""
+        mock_post.side_effect = [
+            catalog_response({HELLO: "Bonjour"}, etag='"v1"', cursor=7),
+            Mock(status_code=304, headers={}),
+        ]
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+
+        Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", store=store
+        )
+        restarted = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", store=store
+        )
+
+        restart_call = mock_post.call_args_list[1]
+        assert restart_call[1]["headers"] == {"If-None-Match": '"v1"'}
+        assert restart_call[1]["json"]["since"] == 7
+        assert restarted.translate(["Hello"]) == {"Hello": "Bonjour"}
+        store.close()
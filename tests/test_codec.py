@@ -0,0 +1,150 @@
+"""Tests for JSON codecs and request compression"""
+
+import asyncio
+import gzip
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from autolocalise import Translator, codec
+from autolocalise.codec import JSONCodec, OrjsonCodec, encode_body, get_codec
+from autolocalise.exceptions import ConfigurationError
+
+from .fake_server import FakeAutoLocaliseServer
+
+PAYLOAD = {"texts": [{"hashkey": "1", "text": "Grüße ✓", "persist": True}]}
+
+
+class TestCodecs:
+    """Test cases for codec selection and body encoding"""
+
+    def test_get_codec(self):
+        """Test codec resolution by name and passthrough of custom codecs"""
+        assert isinstance(get_codec("json"), JSONCodec)
+        custom = Mock()
+        assert get_codec(custom) is custom
+
+        expected = OrjsonCodec if codec.orjson is not None else JSONCodec
+        assert isinstance(get_codec("auto"), expected)
+
+        with pytest.raises(ConfigurationError):
+            get_codec("yaml")
+
+    def test_auto_falls_back_to_stdlib(self):
+        with patch.object(codec, "orjson", None):
+            assert isinstance(get_codec("auto"), JSONCodec)
+            with pytest.raises(ConfigurationError):
+                get_codec("orjson")
+
+    @pytest.mark.parametrize("name", ["json", "orjson"])
+    def test_round_trip(self, name):
+        if name == "orjson":
+            pytest.importorskip("orjson")
+        json_codec = get_codec(name)
+
+        encoded = json_codec.dumps(PAYLOAD)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == PAYLOAD
+        assert json_codec.loads(encoded) == PAYLOAD
+
+    def test_encode_body_compresses_above_threshold(self):
+        """Test that only bodies reaching the threshold are gzipped"""
+        small, headers = encode_body(PAYLOAD, JSONCodec(), compress_threshold=10_000)
+        assert headers == {"Content-Type": "application/json"}
+        assert json.loads(small) == PAYLOAD
+
+        large_payload = {"texts": [PAYLOAD["texts"][0]] * 500}
+        large, headers = encode_body(
+            large_payload, JSONCodec(), compress_threshold=1000
+        )
+        assert headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(large)) == large_payload
+        assert len(large) < len(JSONCodec().dumps(large_payload)) / 10
+
+    def test_encode_body_without_threshold(self):
+        body, headers = encode_body(PAYLOAD, JSONCodec())
+        assert "Content-Encoding" not in headers
+
+    def test_negative_threshold_rejected(self):
+        with pytest.raises(ConfigurationError):
+            Translator("test-key", "en", "fr", compress_threshold=-1)
+
+
+class TestTranslatorCodec:
+    """Test cases for codecs and compression in translators"""
+
+    def setup_method(self):
+        """Clear global cache and start a fresh server before each test"""
+        Translator.clear_global_cache()
+        self.server = FakeAutoLocaliseServer().start()
+
+    def teardown_method(self):
+        self.server.stop()
+
+    def make_translator(self, **kwargs):
+        with patch("autolocalise.translator.DEFAULT_BASE_URL", self.server.url):
+            return Translator("test-key", "en", "fr", **kwargs)
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_codec_encodes_body(self, mock_post):
+        """Test that a codec sends pre-encoded bytes and parses content"""
+        mock_post.side_effect = [
+            Mock(status_code=404),
+            Mock(status_code=200, content=b'{"translations":{"69609650":"Bonjour"}}'),
+        ]
+        translator = Translator("test-key", "en", "fr", json_codec="json")
+
+        assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
+
+        translate_call = mock_post.call_args_list[1]
+        assert "json" not in translate_call[1]
+        assert json.loads(translate_call[1]["data"])["texts"][0]["text"] == "Hello"
+        assert translate_call[1]["headers"] == {"Content-Type": "application/json"}
+
+    def test_large_requests_are_gzipped(self):
+        """Test compression of large bodies against a server"""
+        self.server.compress = True
+        translator = self.make_translator(json_codec="auto", compress_threshold=2048)
+
+        small = translator.translate(["Hello"])
+        texts = [f"Text number {i} with some padding" for i in range(200)]
+        large = translator.translate(texts)
+
+        assert small == {"Hello": "fr:Hello"}
+        assert large == {text: f"fr:{text}" for text in texts}
+        # Catalog request, small batch, large batch
+        assert self.server.encodings == [None, None, "gzip"]
+        translator.close()
+
+    def test_compressed_responses_decoded(self):
+        """Test that gzip responses are accepted and decoded"""
+        self.server.compress = True
+        self.server.catalog = {"69609650": "Bonjour"}  # Hash of "Hello"
+        translator = self.make_translator(json_codec="auto")
+
+        assert translator.translate(["Hello", "World"]) == {
+            "Hello": "Bonjour",
+            "World": "fr:World",
+        }
+        translator.close()
+
+    def test_async_compression(self):
+        """Test that the async client compresses large bodies too"""
+        pytest.importorskip("httpx")
+        from autolocalise import AsyncTranslator
+
+        self.server.compress = True
+        texts = [f"Text number {i} with some padding" for i in range(200)]
+
+        async def run():
+            translator = AsyncTranslator(
+                "test-key", "en", "fr", json_codec="auto", compress_threshold=2048
+            )
+            translator.base_url = self.server.url
+            async with translator:
+                return await translator.translate(texts)
+
+        assert asyncio.run(run()) == {text: f"fr:{text}" for text in texts}
+        assert self.server.encodings == [None, "gzip"]
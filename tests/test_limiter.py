@@ -0,0 +1,260 @@
+"""Tests for adaptive concurrency and rate limiting"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from autolocalise import Translator
+from autolocalise.exceptions import ConfigurationError
+from autolocalise.limiter import (
+    RequestLimiter,
+    get_request_limiter,
+    set_request_limiter,
+)
+
+
+def api_post(url, json=None, timeout=None, **kwargs):
+    """Stand-in for Session.post returning "fr:" translations"""
+    if url.endswith("/v1/translations"):
+        return Mock(status_code=404)
+    translations = {item["hashkey"]: f"fr:{item['text']}" for item in json["texts"]}
+    return Mock(status_code=200, json=lambda: {"translations": translations})
+
+
+def saturate(limiter, latency=0.01, status_code=200):
+    """Fill every slot and release them all with the same outcome"""
+    held = limiter.limit
+    for _ in range(held):
+        limiter.acquire()
+    for _ in range(held):
+        limiter.release(latency, status_code)
+
+
+class TestRequestLimiter:
+    """Test cases for RequestLimiter"""
+
+    def test_limits_concurrency(self):
+        """Test that no more than limit requests run at once"""
+        limiter = RequestLimiter(initial_limit=2, max_limit=2)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def request():
+            limiter.acquire()
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+            limiter.release(0.02, 200)
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+        assert limiter.stats()["inflight"] == 0
+
+    def test_additive_increase_when_saturated(self):
+        """Test that the limit grows while it is fully used"""
+        limiter = RequestLimiter(initial_limit=2, max_limit=4)
+
+        for _ in range(20):
+            saturate(limiter)
+
+        assert limiter.limit == 4
+
+    def test_no_increase_when_underused(self):
+        """Test that an app-limited client does not inflate the limit"""
+        limiter = RequestLimiter(initial_limit=2)
+
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(0.01, 200)
+
+        assert limiter.limit == 2
+
+    def test_rate_limited_response_halves_limit(self):
+        """Test multiplicative decrease on 429"""
+        limiter = RequestLimiter(initial_limit=8)
+
+        limiter.acquire()
+        limiter.release(0.01, 429)
+
+        assert limiter.limit == 4
+        assert limiter.stats()["throttled"] == 1
+
+    def test_decrease_once_per_round_trip(self):
+        """Test that a burst of 429s from one window backs off once"""
+        limiter = RequestLimiter(initial_limit=8)
+
+        for _ in range(4):
+            limiter.acquire()
+        for _ in range(4):
+            limiter.release(1.0, 429)
+
+        assert limiter.limit == 4
+        assert limiter.stats()["decreases"] == 1
+
+    def test_latency_increase_decreases_limit(self):
+        """Test that latency far above the baseline backs off"""
+        limiter = RequestLimiter(initial_limit=8, latency_tolerance=2.0)
+        limiter.acquire()
+        limiter.release(0.01, 200)
+
+        limiter.acquire()
+        limiter.release(0.5, 200)
+
+        assert limiter.limit == 4
+
+    def test_failures_without_response_keep_limit(self):
+        limiter = RequestLimiter(initial_limit=4)
+        limiter.acquire()
+        limiter.release(0.01, None)
+
+        assert limiter.limit == 4
+        assert limiter.stats()["inflight"] == 0
+
+    def test_rate_limit(self):
+        """Test that the token bucket spaces out requests"""
+        limiter = RequestLimiter(rate=50, burst=1)
+
+        started = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(0.001, 200)
+
+        # First request uses the burst, the other four wait 20ms each
+        assert time.monotonic() - started >= 0.07
+
+    def test_async_acquire_waits_for_thread_release(self):
+        """Test that tasks and threads share the same slots"""
+        limiter = RequestLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+
+        async def run():
+            timer = threading.Timer(0.05, limiter.release, args=(0.05, 200))
+            timer.start()
+            await asyncio.wait_for(limiter.acquire_async(), timeout=5)
+            limiter.release(0.01, 200)
+
+        asyncio.run(run())
+        assert limiter.stats()["inflight"] == 0
+
+    def test_cancelled_async_waiter_gives_up_its_place(self):
+        limiter = RequestLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire()
+
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(limiter.acquire_async(), timeout=0.02)
+
+        asyncio.run(run())
+        limiter.release(0.01, 200)
+
+        assert limiter.stats() == {
+            "limit": 1,
+            "inflight": 0,
+            "waiting": 0,
+            "throttled": 0,
+            "decreases": 0,
+            "baseline_latency": 0.01,
+        }
+
+    def test_acquire_timeout(self):
+        limiter = RequestLimiter(initial_limit=1, max_limit=1)
+        assert limiter.acquire(timeout=0) is True
+        assert limiter.acquire(timeout=0) is False
+
+        started = time.monotonic()
+        assert limiter.acquire(timeout=0.05) is False
+        assert time.monotonic() - started >= 0.05
+        assert limiter.stats()["waiting"] == 0
+
+        limiter.release(0.01, 200)
+        assert limiter.acquire(timeout=0) is True
+
+    def test_invalid_settings_rejected(self):
+        with pytest.raises(ConfigurationError):
+            RequestLimiter(initial_limit=10, max_limit=5)
+        with pytest.raises(ConfigurationError):
+            RequestLimiter(rate=0)
+        with pytest.raises(ConfigurationError):
+            RequestLimiter(backoff_ratio=1.5)
+
+
+class TestSharedLimiter:
+    """Test cases for sharing limiters between translators"""
+
+    def setup_method(self):
+        """Clear global cache and limiters before each test"""
+        Translator.clear_global_cache()
+        set_request_limiter("test-key", None)
+        set_request_limiter("other-key", None)
+
+    def test_registry_shares_per_api_key(self):
+        assert get_request_limiter("test-key") is get_request_limiter("test-key")
+        assert get_request_limiter("test-key") is not get_request_limiter("other-key")
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_translators_share_limiter(self, mock_post):
+        """Test that translators with the same API key use one limiter"""
+        mock_post.side_effect = api_post
+        limiter = RequestLimiter(initial_limit=2)
+        set_request_limiter("test-key", limiter)
+
+        first = Translator("test-key", "en", "fr", limit_requests=True)
+        second = Translator("test-key", "en", "de", limit_requests=True)
+        unlimited = Translator("test-key", "en", "es")
+
+        assert first._limiter is limiter
+        assert second._limiter is limiter
+        assert unlimited._limiter is None
+
+        assert first.translate(["Hello"]) == {"Hello": "fr:Hello"}
+        stats = limiter.stats()
+        assert stats["inflight"] == 0
+        assert stats["baseline_latency"] is not None
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_throttled_responses_reduce_shared_limit(self, mock_post):
+        """Test that a 429 seen by one translator slows down the others"""
+        mock_post.return_value = Mock(
+            status_code=429, headers={}, json=lambda: {"error": "Too many requests"}
+        )
+        limiter = RequestLimiter(initial_limit=8)
+        set_request_limiter("test-key", limiter)
+
+        translator = Translator("test-key", "en", "fr", limit_requests=True)
+        assert translator.translate(["Hello"]) == {"Hello": "Hello"}
+
+        assert limiter.limit == 4
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_sync_call_on_event_loop_does_not_wait_for_slots(self, mock_post):
+        """Test that a sync translate inside a coroutine doesn't deadlock
+        waiting for slots that the loop's own coroutines hold"""
+        mock_post.side_effect = api_post
+        limiter = RequestLimiter(initial_limit=1, max_limit=1)
+        set_request_limiter("test-key", limiter)
+        translator = Translator("test-key", "en", "fr", limit_requests=True)
+
+        async def run():
+            # Held by a coroutine of this loop, released only after the call
+            await limiter.acquire_async()
+            try:
+                return translator.translate(["Hello"])
+            finally:
+                limiter.release(0.01, 200)
+
+        started = time.monotonic()
+        assert asyncio.run(run()) == {"Hello": "fr:Hello"}
+        assert time.monotonic() - started < 5
+        assert limiter.stats()["inflight"] == 0
@@ -0,0 +1,194 @@
+"""Tests for the translation metrics registry"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from autolocalise import Translator
+from autolocalise.metrics import (
+    MetricsRegistry,
+    get_metrics_registry,
+    set_metrics_registry,
+)
+
+# Hash of "Hello"
+HELLO = "69609650"
+
+
+def translations_response(translations):
+    return Mock(status_code=200, json=lambda: {"translations": translations})
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    def test_counts_and_histograms(self):
+        registry = MetricsRegistry(latency_buckets=(0.1, 1.0))
+        registry.count_texts("en", "fr", cache=2, api=1)
+        registry.count_texts("en", "fr", cache=1, fallback=0)
+        registry.observe_request("en", "fr", 3, 0.05, 200)
+        registry.observe_request("en", "fr", 700, 2.0, None)
+
+        pair = registry.snapshot()["pairs"]["en:fr"]
+
+        assert pair["texts"]["cache"] == 3
+        assert pair["texts"]["api"] == 1
+        assert pair["texts"]["fallback"] == 0
+        assert pair["requests"] == {"200": 1, "error": 1}
+        assert pair["latency"]["counts"] == [1, 0, 1]
+        assert pair["latency"]["sum"] == pytest.approx(2.05)
+        assert pair["batch_size"]["count"] == 2
+
+    def test_snapshot_includes_cache_stats(self):
+        Translator.clear_global_cache()
+        snapshot = MetricsRegistry().snapshot()
+
+        assert snapshot["pairs"] == {}
+        assert snapshot["cache"]["evictions"] == 0
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.count_texts("en", "fr", cache=1)
+        registry.reset()
+
+        assert registry.snapshot()["pairs"] == {}
+
+    def test_prometheus_export(self):
+        """Test counters and cumulative histogram buckets in text format"""
+        registry = MetricsRegistry(latency_buckets=(0.1, 1.0))
+        registry.count_texts("en", "fr", cache=2)
+        registry.observe_request("en", "fr", 3, 0.05, 200)
+        registry.observe_request("en", "fr", 3, 0.5, 429)
+
+        text = registry.to_prometheus()
+
+        assert text.endswith("\n")
+        assert "# TYPE autolocalise_texts_total counter" in text
+        assert (
+            'autolocalise_texts_total{source="en",target="fr",outcome="cache"} 2'
+            in text
+        )
+        assert (
+            'autolocalise_requests_total{source="en",target="fr",status="429"} 1'
+            in text
+        )
+        assert "# TYPE autolocalise_request_duration_seconds histogram" in text
+        for bound, count in (("0.1", 1), ("1.0", 2), ("+Inf", 2)):
+            assert (
+                f"autolocalise_request_duration_seconds_bucket"
+                f'{{source="en",target="fr",le="{bound}"}} {count}'
+            ) in text
+        assert (
+            'autolocalise_request_duration_seconds_count{source="en",target="fr"} 2'
+            in text
+        )
+        assert "autolocalise_cache_evictions_total 0" in text
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.count_texts("en", 'f"r', cache=1)
+
+        assert 'target="f\\"r"' in registry.to_prometheus()
+
+    def test_shared_registry(self):
+        registry = MetricsRegistry()
+        set_metrics_registry(registry)
+        try:
+            assert get_metrics_registry() is registry
+        finally:
+            set_metrics_registry(None)
+        assert get_metrics_registry() is not registry
+
+
+class TestTranslatorMetrics:
+    """Test cases for metrics recorded by translators"""
+
+    def setup_method(self):
+        """Clear global cache and metrics before each test"""
+        Translator.clear_global_cache()
+        set_metrics_registry(None)
+
+    def teardown_method(self):
+        set_metrics_registry(None)
+
+    def texts(self):
+        return get_metrics_registry().snapshot()["pairs"]["en:fr"]["texts"]
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_outcomes(self, mock_post):
+        """Test counts of cache, catalog and API resolutions"""
+        mock_post.side_effect = [
+            translations_response({HELLO: "Bonjour"}),
+            translations_response({"83766130": "Monde"}),  # Hash of "World"
+        ]
+        translator = Translator("test-key", "en", "fr", collect_metrics=True)
+
+        translator.translate(["Hello", "World", "World", ""])
+        translator.translate(["Hello", "World"])
+
+        assert self.texts() == {
+            "cache": 2,
+            "catalog": 1,
+            "store": 0,
+            "api": 1,
+            "shared": 0,
+            "fallback": 0,
+        }
+        pair = get_metrics_registry().snapshot()["pairs"]["en:fr"]
+        assert pair["requests"] == {"200": 1}
+        assert pair["batch_size"]["sum"] == 1
+        assert pair["latency"]["count"] == 1
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_fallbacks(self, mock_post):
+        """Test that failed requests count texts as fallbacks"""
+        mock_post.side_effect = [
+            Mock(status_code=404),
+            requests.exceptions.ConnectionError("Network error"),
+            Mock(status_code=500, json=lambda: {}),
+        ]
+        translator = Translator("test-key", "en", "fr", collect_metrics=True)
+
+        translator.translate(["Hello", "World"])
+        translator.translate(["Hello"])
+
+        assert self.texts()["fallback"] == 3
+        assert self.texts()["api"] == 0
+        requests_by_status = get_metrics_registry().snapshot()["pairs"]["en:fr"][
+            "requests"
+        ]
+        assert requests_by_status == {"error": 1, "500": 1}
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_disabled_by_default(self, mock_post):
+        mock_post.side_effect = [
+            Mock(status_code=404),
+            translations_response({HELLO: "Bonjour"}),
+        ]
+        translator = Translator("test-key", "en", "fr")
+        translator.translate(["Hello"])
+
+        assert get_metrics_registry().snapshot()["pairs"] == {}
+
+    def test_async_translator(self):
+        pytest.importorskip("httpx")
+        from autolocalise import AsyncTranslator
+
+        async def run():
+            translator = AsyncTranslator("test-key", "en", "fr", collect_metrics=True)
+            translator._ensure_server_translations = Mock(return_value=asyncio.sleep(0))
+            translator._post = Mock(
+                return_value=asyncio.sleep(0, translations_response({HELLO: "Bonjour"}))
+            )
+            return await translator.translate(["Hello"])
+
+        assert asyncio.run(run()) == {"Hello": "Bonjour"}
+        assert self.texts()["api"] == 1
+        pair = get_metrics_registry().snapshot()["pairs"]["en:fr"]
+        assert pair["requests"] == {"200": 1}
@@ -0,0 +1,203 @@
+"""Tests for the persistent SQLite translation store"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from autolocalise import Translator
+from autolocalise.store import SQLiteStore
+
+
+def write_from_process(path, worker_id):
+    """Write translations from a separate process"""
+    store = SQLiteStore(path)
+    for i in range(50):
+        store.set(f"text_{worker_id}_{i}", f"translation_{worker_id}_{i}", "en", "fr")
+    store.close()
+    return worker_id
+
+
+class TestSQLiteStore:
+    """Test cases for SQLiteStore operations"""
+
+    def test_basic_operations(self, tmp_path):
+        """Test storing, reading and clearing translations"""
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+
+        assert store.get("Hello", "en", "fr") is None
+
+        store.set("Hello", "Bonjour", "en", "fr")
+        store.set_batch({"Goodbye": "Au revoir", "Hello": "Salut"}, "en", "fr")
+        store.set("Hello", "Hola", "en", "es")
+
+        assert store.get("Hello", "en", "fr") == "Salut"
+        assert store.get("Hello", "en", "es") == "Hola"
+        assert store.size() == 3
+
+        store.clear("en", "fr")
+        assert store.size() == 1
+        store.clear()
+        assert store.size() == 0
+        store.close()
+
+    def test_get_many(self, tmp_path):
+        """Test bulk lookups, including more texts than one query allows"""
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+        store.set_batch({f"text_{i}": f"t_{i}" for i in range(1200)}, "en", "fr")
+
+        texts = [f"text_{i}" for i in range(0, 1500, 3)]
+        found = store.get_many(texts, "en", "fr")
+
+        assert found == {f"text_{i}": f"t_{i}" for i in range(0, 1200, 3)}
+        assert store.get_many([], "en", "fr") == {}
+        store.close()
+
+    def test_catalog_updates(self, tmp_path):
+        """Test saving a catalog and applying an incremental update to it"""
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+        assert store.get_catalog("en", "fr") is None
+
+        store.set_catalog({"1": "un", "2": "deux"}, "en", "fr", etag='"v1"', cursor=1)
+        store.update_catalog({"2": "DEUX", "3": "trois"}, ["1"], "en", "fr", cursor=2)
+
+        assert store.get_catalog("en", "fr") == {
+            "translations": {"2": "DEUX", "3": "trois"},
+            "etag": None,
+            "cursor": 2,
+        }
+
+        store.set_catalog({"4": "quatre"}, "en", "fr")
+        assert store.get_catalog("en", "fr")["translations"] == {"4": "quatre"}
+
+        store.clear("en", "fr")
+        assert store.get_catalog("en", "fr") is None
+        store.close()
+
+    def test_survives_reopen(self, tmp_path):
+        """Test that translations persist across store instances"""
+        path = str(tmp_path / "translations.db")
+        store = SQLiteStore(path)
+        store.set("Hello", "Bonjour", "en", "fr")
+        store.close()
+
+        reopened = SQLiteStore(path)
+        assert reopened.get("Hello", "en", "fr") == "Bonjour"
+        reopened.close()
+
+    def test_concurrent_threads(self, tmp_path):
+        """Test that every thread can read and write through its connection"""
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+
+        def worker(thread_id):
+            for i in range(20):
+                store.set(f"text_{thread_id}_{i}", f"t_{thread_id}_{i}", "en", "fr")
+            return all(
+                store.get(f"text_{thread_id}_{i}", "en", "fr") == f"t_{thread_id}_{i}"
+                for i in range(20)
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert all(executor.map(worker, range(4)))
+
+        assert store.size() == 80
+        store.close()
+
+    def test_thread_connections_closed_on_exit(self, tmp_path):
+        """Test that short-lived threads don't leave connections open"""
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+        store.set("Hello", "Bonjour", "en", "fr")
+
+        for _ in range(50):
+            threads = [
+                threading.Thread(target=store.get_many, args=(["Hello"], "en", "fr"))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(store._connections) <= 5
+        assert store.get("Hello", "en", "fr") == "Bonjour"
+        store.close()
+
+    def test_concurrent_processes(self, tmp_path):
+        """Test that several processes can write to one database"""
+        path = str(tmp_path / "translations.db")
+        SQLiteStore(path).close()
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=4, mp_context=context) as executor:
+            list(executor.map(write_from_process, [path] * 4, range(4)))
+
+        store = SQLiteStore(path)
+        assert store.size() == 200
+        assert store.get("text_3_49", "en", "fr") == "translation_3_49"
+        store.close()
+
+
+class TestTranslatorWithStore:
+    """Test cases for using a store behind the in-memory cache"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_read_through(self, mock_post, tmp_path):
+        """Test that stored translations avoid API calls after a restart"""
+        mock_post.return_value = Mock(status_code=404)
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+        store.set("Hello", "Bonjour", "en", "fr")
+
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", store=store
+        )
+        result = translator.translate(["Hello"])
+
+        assert result == {"Hello": "Bonjour"}
+        assert mock_post.call_count == 1  # Only /v1/translations
+        # Promoted into the in-memory cache
+        assert translator._cache.get("Hello", "en", "fr") == "Bonjour"
+        store.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_write_through(self, mock_post, tmp_path):
+        """Test that API translations are written to the store"""
+        mock_post.side_effect = [
+            Mock(status_code=404),
+            Mock(
+                status_code=200,
+                json=lambda: {"translations": {"69609650": "Bonjour"}},
+            ),
+        ]
+        store = SQLiteStore(str(tmp_path / "translations.db"))
+
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", store=store
+        )
+        translator.translate(["Hello"])
+
+        assert store.get("Hello", "en", "fr") == "Bonjour"
+        store.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_store_errors_do_not_break_translation(self, mock_post):
+        """Test that a failing store is bypassed"""
+        mock_post.side_effect = [
+            Mock(status_code=404),
+            Mock(
+                status_code=200,
+                json=lambda: {"translations": {"69609650": "Bonjour"}},
+            ),
+        ]
+        store = Mock()
+        store.get_many.side_effect = OSError("disk I/O error")
+        store.set_batch.side_effect = OSError("disk I/O error")
+
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", store=store
+        )
+
+        assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
@@ -0,0 +1,457 @@
+"""Tests for request retries and the circuit breaker"""
+
+import asyncio
+import time
+from email.utils import formatdate
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from autolocalise import Translator
+from autolocalise.exceptions import APIError, ConfigurationError, NetworkError
+from autolocalise.resilience import CircuitBreaker, RetryPolicy, parse_retry_after
+
+from .fake_server import FakeAutoLocaliseServer
+
+
+def translated(json):
+    """Successful /v1/translate response prefixing texts with "fr:" """
+    translations = {item["hashkey"]: f"fr:{item['text']}" for item in json["texts"]}
+    return Mock(status_code=200, json=lambda: {"translations": translations})
+
+
+def failing_post(responses):
+    """Stand-in for Session.post that fails /v1/translate with the given
+    responses (or exceptions) before succeeding"""
+    pending = list(responses)
+
+    def post(url, json=None, timeout=None, **kwargs):
+        if url.endswith("/v1/translations"):
+            return Mock(status_code=404)
+        if pending:
+            outcome = pending.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return translated(json)
+
+    return post
+
+
+def error_response(status_code, retry_after=None):
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return Mock(
+        status_code=status_code,
+        headers=headers,
+        json=lambda: {"error": f"Error {status_code}"},
+    )
+
+
+def translate_requests(mock_post):
+    return [
+        call
+        for call in mock_post.call_args_list
+        if call[0][0].endswith("/v1/translate")
+    ]
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy"""
+
+    def test_should_retry_transient_errors_only(self):
+        """Test that rate limits, server errors and network errors are retried"""
+        policy = RetryPolicy(retries=2)
+
+        assert policy.should_retry(APIError("busy", status_code=429), 0)
+        assert policy.should_retry(APIError("down", status_code=503), 1)
+        assert policy.should_retry(NetworkError("reset"), 0)
+        assert not policy.should_retry(APIError("bad", status_code=400), 0)
+        assert not policy.should_retry(NetworkError("reset"), 2)
+
+    def test_delay_is_jittered_exponential_backoff(self):
+        """Test that delays stay within the growing, capped backoff window"""
+        policy = RetryPolicy(retries=10, backoff=0.5, max_backoff=3.0)
+        error = NetworkError("reset")
+
+        for attempt, bound in [(0, 0.5), (1, 1.0), (2, 2.0), (5, 3.0)]:
+            delays = [policy.delay(error, attempt) for _ in range(200)]
+            assert all(0 <= delay <= bound for delay in delays)
+            # Jitter spreads retries out
+            assert len(set(delays)) > 1
+
+    def test_delay_honours_retry_after(self):
+        """Test that a server-requested delay is used, up to the cap"""
+        policy = RetryPolicy(max_retry_after=10.0)
+
+        assert policy.delay(APIError("busy", status_code=429, retry_after=4), 0) == 4
+        assert policy.delay(APIError("busy", status_code=429, retry_after=90), 0) == 10
+
+    def test_negative_settings_rejected(self):
+        with pytest.raises(ConfigurationError):
+            RetryPolicy(retries=-1)
+
+    def test_parse_retry_after(self):
+        """Test both Retry-After formats"""
+        assert parse_retry_after("7") == 7.0
+        assert 25 <= parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+        assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker"""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit opens once, after failure_threshold failures"""
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is True
+        assert not breaker.allow()
+        # Further failures don't report opening again
+        assert breaker.record_failure() is False
+        assert breaker.stats() == {"state": "open", "failures": 4, "opened": 1}
+
+    def test_success_resets(self):
+        """Test that a success closes the circuit and clears the failure count"""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.record_failure() is False
+
+        breaker.record_failure()
+        assert breaker.is_open
+        breaker.record_success()
+        assert breaker.allow()
+
+    def test_one_probe_at_a_time(self):
+        """Test that only one caller can claim the probe of an open circuit"""
+        breaker = CircuitBreaker(failure_threshold=1)
+        assert breaker.start_probe() is False  # Closed
+
+        breaker.record_failure()
+        assert breaker.start_probe() is True
+        assert breaker.start_probe() is False
+
+        breaker.end_probe()
+        assert breaker.start_probe() is True
+
+    def test_invalid_settings_rejected(self):
+        with pytest.raises(ConfigurationError):
+            CircuitBreaker(failure_threshold=0)
+
+
+class TestTranslatorResilience:
+    """Test cases for retries and circuit breaking in Translator"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_no_retries_by_default(self, mock_post):
+        """Test that failed requests are sent once unless retries are enabled"""
+        mock_post.side_effect = failing_post([error_response(503)])
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+
+        assert translator.translate(["Hello"]) == {"Hello": "Hello"}
+        assert len(translate_requests(mock_post)) == 1
+
+    @patch("autolocalise.translator.time.sleep")
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_retries_transient_failures(self, mock_post, mock_sleep):
+        """Test that 5xx and network errors are retried with backoff"""
+        mock_post.side_effect = failing_post(
+            [error_response(502), requests.exceptions.ConnectionError("reset")]
+        )
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            retry_policy=RetryPolicy(retries=3, backoff=0.1),
+        )
+
+        assert translator.translate(["Hello"]) == {"Hello": "fr:Hello"}
+        assert len(translate_requests(mock_post)) == 3
+        assert mock_sleep.call_count == 2
+        assert all(0 <= call[0][0] <= 0.2 for call in mock_sleep.call_args_list)
+
+    @patch("autolocalise.translator.time.sleep")
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_honours_retry_after(self, mock_post, mock_sleep):
+        """Test that the delay requested by a 429 response is used"""
+        mock_post.side_effect = failing_post([error_response(429, retry_after="3")])
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            retry_policy=RetryPolicy(retries=1),
+        )
+
+        assert translator.translate(["Hello"]) == {"Hello": "fr:Hello"}
+        mock_sleep.assert_called_once_with(3.0)
+
+    @patch("autolocalise.translator.time.sleep")
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_client_errors_not_retried(self, mock_post, mock_sleep):
+        """Test that a 400 response is not retried"""
+        mock_post.side_effect = failing_post([error_response(400)])
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            retry_policy=RetryPolicy(retries=3),
+        )
+
+        assert translator.translate(["Hello"]) == {"Hello": "Hello"}
+        assert len(translate_requests(mock_post)) == 1
+        mock_sleep.assert_not_called()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_open_circuit_falls_back_without_requests(self, mock_post):
+        """Test that an open circuit returns source text without calling the API"""
+        mock_post.side_effect = failing_post(
+            [requests.exceptions.ConnectionError("down")] * 2
+        )
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            circuit_breaker=breaker,
+        )
+
+        translator.translate(["One"])
+        translator.translate(["Two"])
+        assert breaker.is_open
+
+        assert translator.translate(["Three"]) == {"Three": "Three"}
+        assert len(translate_requests(mock_post)) == 2
+        translator.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_client_errors_do_not_open_circuit(self, mock_post):
+        """Test that only transient failures count towards opening the circuit"""
+        mock_post.side_effect = failing_post([error_response(400)] * 3)
+        breaker = CircuitBreaker(failure_threshold=2)
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            circuit_breaker=breaker,
+        )
+
+        for text in ["One", "Two", "Three"]:
+            translator.translate([text])
+
+        assert not breaker.is_open
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_background_probe_closes_circuit(self, mock_post):
+        """Test that the circuit closes once a background probe succeeds"""
+        down = {"value": True}
+
+        def post(url, json=None, timeout=None, **kwargs):
+            if down["value"]:
+                raise requests.exceptions.ConnectionError("down")
+            if url.endswith("/v1/translations"):
+                return Mock(status_code=404)
+            return translated(json)
+
+        mock_post.side_effect = post
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.02)
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            circuit_breaker=breaker,
+        )
+
+        translator.translate(["Hello"])
+        assert breaker.is_open
+
+        down["value"] = False
+        deadline = time.time() + 5
+        while breaker.is_open and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert not breaker.is_open
+        assert translator.translate(["Hello"]) == {"Hello": "fr:Hello"}
+        translator.close()
+
+        # Probes are unpersisted one-text /v1/translate requests
+        probe = translate_requests(mock_post)[1][1]["json"]
+        assert [item["persist"] for item in probe["texts"]] == [False]
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_probe_client_errors_keep_circuit_open(self, mock_post):
+        """Test that only a 2xx probe response closes the circuit"""
+        mock_post.side_effect = failing_post(
+            [requests.exceptions.ConnectionError("down")] + [error_response(401)] * 1000
+        )
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            circuit_breaker=breaker,
+        )
+
+        translator.translate(["Hello"])
+        deadline = time.time() + 5
+        while len(translate_requests(mock_post)) < 4 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert len(translate_requests(mock_post)) >= 4
+        assert breaker.is_open
+        translator.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_probe_taken_over_after_close(self, mock_post):
+        """Test that a shared circuit still recovers when the translator
+        probing it is closed"""
+        down = {"value": True}
+
+        def post(url, json=None, timeout=None, **kwargs):
+            if url.endswith("/v1/translations"):
+                return Mock(status_code=404)
+            if down["value"]:
+                raise requests.exceptions.ConnectionError("down")
+            return translated(json)
+
+        mock_post.side_effect = post
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.02)
+        first = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            circuit_breaker=breaker,
+        )
+        second = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            circuit_breaker=breaker,
+        )
+
+        first.translate(["Hello"])
+        first.close()
+        down["value"] = False
+        assert breaker.is_open
+
+        # Falls back, but starts probing in place of the closed translator
+        assert second.translate(["Hello"]) == {"Hello": "Hello"}
+        deadline = time.time() + 5
+        while breaker.is_open and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert not breaker.is_open
+        assert second.translate(["Hello"]) == {"Hello": "fr:Hello"}
+        second.close()
+
+
+class TestAsyncTranslatorResilience:
+    """Test cases for retries and circuit breaking in AsyncTranslator"""
+
+    def setup_method(self):
+        """Clear global cache and start a fresh server before each test"""
+        pytest.importorskip("httpx")
+        Translator.clear_global_cache()
+        self.server = FakeAutoLocaliseServer().start()
+
+    def teardown_method(self):
+        self.server.stop()
+
+    def make_translator(self, **kwargs):
+        from autolocalise import AsyncTranslator
+
+        translator = AsyncTranslator(
+            api_key="test-key", source_locale="en", target_locale="fr", **kwargs
+        )
+        translator.base_url = self.server.url
+        return translator
+
+    def test_retries_rate_limited_requests(self):
+        """Test that a 429 with Retry-After is retried"""
+        handle = self.server.handle
+        rate_limited = []
+
+        def limited_handle(path, body):
+            if path == "/v1/translate" and not rate_limited:
+                rate_limited.append(body)
+                return 429, {"error": "Too many requests"}, {"Retry-After": "0"}
+            return handle(path, body)
+
+        self.server.handle = limited_handle
+
+        async def run():
+            async with self.make_translator(
+                retry_policy=RetryPolicy(retries=2)
+            ) as translator:
+                return await translator.translate(["Hello"])
+
+        assert asyncio.run(run()) == {"Hello": "fr:Hello"}
+        assert len(self.server.requests_for("/v1/translate")) == 2
+
+    def test_no_probe_after_close(self):
+        """Test that a closed translator leaves probing to other translators"""
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+
+        async def run():
+            translator = self.make_translator(circuit_breaker=breaker)
+            await translator.aclose()
+            result = await translator.translate(["Hello"])
+            return result, translator._probe_task
+
+        result, probe_task = asyncio.run(run())
+
+        assert result == {"Hello": "Hello"}
+        assert probe_task is None
+        assert breaker.start_probe() is True
+
+    def test_open_circuit_and_recovery(self):
+        """Test that an open circuit falls back instantly and recovers"""
+        handle = self.server.handle
+        down = {"value": True}
+
+        def flaky_handle(path, body):
+            if path == "/v1/translate" and down["value"]:
+                return 503, {"error": "Unavailable"}
+            return handle(path, body)
+
+        self.server.handle = flaky_handle
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.02)
+
+        async def run():
+            async with self.make_translator(circuit_breaker=breaker) as translator:
+                first = await translator.translate(["Hello"])
+                assert breaker.is_open
+                second = await translator.translate(["World"])
+                sent_while_open = len(
+                    [
+                        body
+                        for body in self.server.requests_for("/v1/translate")
+                        if body["texts"][0]["persist"]
+                    ]
+                )
+
+                down["value"] = False
+                for _ in range(250):
+                    if not breaker.is_open:
+                        break
+                    await asyncio.sleep(0.02)
+                third = await translator.translate(["Hello"])
+                return first, second, sent_while_open, third
+
+        first, second, sent_while_open, third = asyncio.run(run())
+
+        assert first == {"Hello": "Hello"}
+        assert second == {"World": "World"}
+        assert sent_while_open == 1
+        assert third == {"Hello": "fr:Hello"}
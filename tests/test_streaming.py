@@ -0,0 +1,155 @@
+"""Tests for streaming catalog parsing"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from autolocalise import Translator
+from autolocalise.streaming import CatalogStreamParser, parse_catalog
+
+from .fake_server import FakeAutoLocaliseServer
+
+HELLO = "69609650"  # Hash of "Hello"
+
+RESPONSE = {
+    "delta": False,
+    "translations": {HELLO: "Bonjour", "12": "Grüße ✓", "-3": 'Quote " and \\'},
+    "cursor": 1234567,
+    "deleted": ["1", "2"],
+    "meta": {"nested": [1.5, None, True]},
+}
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestCatalogStreamParser:
+    """Test cases for the incremental /v1/translations parser"""
+
+    @pytest.mark.parametrize("ascii", [False, True])
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100_000])
+    def test_matches_json_loads_for_any_chunking(self, size, ascii):
+        """Test that chunk boundaries (even inside UTF-8 characters) don't matter"""
+        body = json.dumps(RESPONSE, ensure_ascii=ascii, indent=1).encode("utf-8")
+
+        assert parse_catalog(chunked(body, size)) == RESPONSE
+
+    def test_number_split_across_chunks(self):
+        """Test that a number at the end of a chunk waits for the next one"""
+        assert parse_catalog([b'{"cursor": 12', b'34, "translations": {}}']) == {
+            "cursor": 1234,
+            "translations": {},
+        }
+
+        for chunks, cursor in (
+            ([b'{"cursor": 12.', b'5, "translations": {}}'], 12.5),
+            ([b'{"cursor": 12.5e', b'3, "translations": {}}'], 12500.0),
+            ([b'{"cursor": 1E', b'+2, "translations": {}}'], 100.0),
+            ([b'{"cursor": -', b'7, "translations": {}}'], -7),
+            ([b'{"translations": {}, "cursor": 1.2', b"5}"], 1.25),
+        ):
+            assert parse_catalog(chunks) == {"cursor": cursor, "translations": {}}
+
+    def test_entries_are_parsed_as_they_arrive(self):
+        parser = CatalogStreamParser()
+
+        parser.feed(b'{"translations": {"1": "un", "2": "de')
+        assert parser.translations == {"1": "un"}
+
+        parser.feed(b'ux"}}')
+        assert parser.close() == {"translations": {"1": "un", "2": "deux"}}
+
+    def test_missing_or_null_translations(self):
+        assert parse_catalog([b"{}"]) == {"translations": {}}
+        assert parse_catalog([b'{"translations": null}']) == {"translations": None}
+
+    @pytest.mark.parametrize(
+        "body",
+        [b"", b'{"translations": {"1": "un"', b'{"translations": {"1" "un"}}', b"[]"],
+    )
+    def test_invalid_bodies_raise(self, body):
+        with pytest.raises(json.JSONDecodeError):
+            parse_catalog(chunked(body, 4))
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b'{"translations": {"a": "b",}}',
+            b'{"translations": {"a": "b" , }}',
+            b'{"translations": {"a": {"x": 1},}}',
+            b'{"translations": {}, "cursor": 1,}',
+            b'{"translations": {,}}',
+            b"{,}",
+        ],
+    )
+    @pytest.mark.parametrize("size", [1, 3, 100])
+    def test_trailing_commas_rejected_like_json_loads(self, body, size):
+        """Test that the streamed and non-streamed paths accept the same bodies"""
+        with pytest.raises(json.JSONDecodeError):
+            json.loads(body)
+        with pytest.raises(json.JSONDecodeError):
+            parse_catalog(chunked(body, size))
+
+
+class TestTranslatorStreaming:
+    """Test cases for translators loading catalogs with stream_catalog"""
+
+    def setup_method(self):
+        """Clear global cache and start a fresh server before each test"""
+        Translator.clear_global_cache()
+        catalog = {str(i): f"traduction {i}" for i in range(5000)}
+        catalog[HELLO] = "Bonjour"
+        self.server = FakeAutoLocaliseServer(catalog).start()
+
+    def teardown_method(self):
+        self.server.stop()
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_streamed_catalog(self, compress):
+        """Test that a streamed catalog serves lookups like a parsed one"""
+        self.server.compress = compress
+        with patch("autolocalise.translator.DEFAULT_BASE_URL", self.server.url):
+            translator = Translator("test-key", "en", "fr", stream_catalog=True)
+
+        assert translator.catalog_stats()["entries"] == 5001
+        assert translator.translate(["Hello", "World"]) == {
+            "Hello": "Bonjour",
+            "World": "fr:World",
+        }
+        assert len(self.server.requests_for("/v1/translate")) == 1
+        translator.close()
+
+    def test_truncated_catalog_is_ignored(self, caplog):
+        """Test that a broken streamed body leaves an empty catalog"""
+        with patch("autolocalise.translator.DEFAULT_BASE_URL", self.server.url):
+            with patch(
+                "autolocalise.translator.parse_catalog",
+                side_effect=json.JSONDecodeError("Incomplete", "", 0),
+            ):
+                translator = Translator("test-key", "en", "fr", stream_catalog=True)
+
+        assert translator.catalog_stats()["entries"] == 0
+        assert "Failed to check server translations" in caplog.text
+        assert translator.translate(["Hello"]) == {"Hello": "fr:Hello"}
+        translator.close()
+
+    def test_async_streamed_catalog(self):
+        pytest.importorskip("httpx")
+        from autolocalise import AsyncTranslator
+
+        self.server.compress = True
+
+        async def run():
+            translator = AsyncTranslator("test-key", "en", "fr", stream_catalog=True)
+            translator.base_url = self.server.url
+            async with translator:
+                result = await translator.translate(["Hello", "World"])
+                return result, translator.catalog_stats()["entries"]
+
+        result, entries = asyncio.run(run())
+
+        assert result == {"Hello": "Bonjour", "World": "fr:World"}
+        assert entries == 5001
@@ -2,8 +2,10 @@
 
 import pytest
 from string import Template
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from autolocalise import templates
+from autolocalise.templates import compile_template, protect_template, restore_params
 from autolocalise.translator import Translator
 
 
@@ -45,6 +47,12 @@ class TestTemplateSupport:
         translator.translate_template = RealTranslator.translate_template.__get__(
             translator
         )
+        translator.translate_templates = RealTranslator.translate_templates.__get__(
+            translator
+        )
+        translator._compile_templates = RealTranslator._compile_templates.__get__(
+            translator
+        )
 
         return translator
 
@@ -115,3 +123,89 @@ class TestTemplateSupport:
         )
         assert "Hola" in result
         assert "Maria" in result
+
+    def test_translate_templates(self, mock_translator):
+        """Test translating many templates with a single translate call"""
+        results = mock_translator.translate_templates(
+            [
+                (Template("Hello $name!"), {"name": "Alice"}),
+                (Template("Welcome to ${place}"), {"place": "Paris"}),
+                (Template("Hello $name!"), {"name": "Bob"}),
+                (Template("Goodbye"), None),
+            ]
+        )
+
+        assert results == [
+            "Bonjour Alice!",
+            "Bienvenue to Paris",
+            "Bonjour Bob!",
+            "FR_Goodbye",
+        ]
+        assert mock_translator.translate.call_count == 1
+        texts = mock_translator.translate.call_args[0][0]
+        assert texts == ["Hello X1X!", "Welcome to X1X", "Hello X1X!", "Goodbye"]
+
+    def test_translate_templates_invalid_type(self, mock_translator):
+        """Test that every item must hold a Template"""
+        with pytest.raises(ValueError):
+            mock_translator.translate_templates([("Hello $name", {"name": "A"})])
+
+        assert mock_translator.translate_templates([]) == []
+
+
+class TestCompiledTemplates:
+    """Test cases for the compiled template cache"""
+
+    def test_compiled_template_is_cached(self):
+        """Test that a template is compiled once per parameter name set"""
+        first = compile_template("Hello $name", frozenset({"name"}))
+
+        assert compile_template("Hello $name", frozenset({"name"})) is first
+        assert compile_template("Hello $name", frozenset()) is not first
+        assert first.protected == "Hello X1X"
+        assert first.placeholders == (("X1X", "name"),)
+
+    def test_repeat_render_skips_regex(self):
+        """Test that rendering a compiled template does no regex work"""
+        compiled = compile_template("$count new ${kind}", frozenset({"count", "kind"}))
+        compiled.render("X1X nouveaux X2X", {"count": 1, "kind": "a"})
+
+        with patch.object(templates, "_VAR_PATTERN") as pattern, patch.object(
+            templates.re, "split"
+        ) as split:
+            compiled = compile_template(
+                "$count new ${kind}", frozenset({"count", "kind"})
+            )
+            result = compiled.render("X1X nouveaux X2X", {"count": 5, "kind": "emails"})
+
+        assert result == "5 nouveaux emails"
+        pattern.finditer.assert_not_called()
+        split.assert_not_called()
+
+    def test_render_single_pass(self):
+        """Test that placeholders are restored wherever the translation has them"""
+        compiled = compile_template("$a and $b", frozenset({"a", "b"}))
+
+        # Parameter values are never re-scanned for placeholders
+        assert compiled.render("X2X, X1X, X2X", {"a": "X2X", "b": "B"}) == "B, X2X, B"
+        assert compiled.render("no placeholders", {"a": 1, "b": 2}) == (
+            "no placeholders"
+        )
+
+    def test_adjacent_parameters(self):
+        """Test that a parameter directly followed by another is protected"""
+        protected, reverse_map = protect_template(
+            "${unit}$count $count${unit}", {"count": 3, "unit": "kg"}
+        )
+
+        assert protected == "X1XX2X X2XX1X"
+        assert reverse_map == {"X1X": "kg", "X2X": "3"}
+
+    def test_protect_template_compatibility(self):
+        """Test the placeholder helpers used before compilation existed"""
+        protected, reverse_map = protect_template(
+            "Hi $name, ${name}! $names $other", {"name": "Ann", "other": 1}
+        )
+
+        assert protected == "Hi X1X, X1X! $names X2X"
+        assert restore_params("Salut X1X, X2X", reverse_map) == "Salut Ann, 1"
@@ -0,0 +1,185 @@
+"""Tests for tracing hooks"""
+
+import asyncio
+from contextlib import contextmanager
+from string import Template
+from unittest.mock import Mock, patch
+
+import pytest
+
+from autolocalise import Translator
+from autolocalise import tracing
+from autolocalise.exceptions import ConfigurationError
+from autolocalise.tracing import OpenTelemetryHook, PhaseTimer, add_hook, remove_hook
+
+# Hash of "Hello"
+HELLO = "69609650"
+
+
+def translations_response(translations):
+    return Mock(status_code=200, json=lambda: {"translations": translations})
+
+
+class RecordingHook:
+    """Hook recording span names, attributes and nesting depth"""
+
+    def __init__(self):
+        self.spans = []
+        self.depth = 0
+
+    def __call__(self, name, attributes):
+        return self.record(name, attributes)
+
+    @contextmanager
+    def record(self, name, attributes):
+        span = Mock()
+        self.spans.append((name, dict(attributes), self.depth, span))
+        self.depth += 1
+        try:
+            yield span
+        finally:
+            self.depth -= 1
+
+    def names(self):
+        return [name for name, _, _, _ in self.spans]
+
+    def find(self, name):
+        return next(span for span in self.spans if span[0] == name)
+
+
+class TestTracing:
+    """Test cases for tracing hooks"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+        self.hook = RecordingHook()
+        add_hook(self.hook)
+
+    def teardown_method(self):
+        remove_hook(self.hook)
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_translate_phases(self, mock_post):
+        """Test that a translation traces each phase inside the root span"""
+        mock_post.side_effect = [
+            translations_response({"1": "Autre"}),
+            translations_response({HELLO: "Bonjour"}),
+        ]
+        translator = Translator("test-key", "en", "fr")
+        self.hook.spans.clear()
+
+        assert translator.translate(["Hello", ""]) == {"Hello": "Bonjour", "": ""}
+
+        names = self.hook.names()
+        assert names[0] == "autolocalise.translate"
+        for phase in (
+            "validate",
+            "cache_lookup",
+            "hash",
+            "catalog_lookup",
+            "http_request",
+            "json_decode",
+            "cache_write",
+        ):
+            assert f"autolocalise.{phase}" in names
+        assert all(depth > 0 for _, _, depth, _ in self.hook.spans[1:])
+
+        _, attributes, _, _ = self.hook.find("autolocalise.translate")
+        assert attributes == {"source": "en", "target": "fr", "texts": 2}
+        _, attributes, _, span = self.hook.find("autolocalise.http_request")
+        assert attributes == {"path": "/v1/translate"}
+        span.set_attribute.assert_called_once_with("http.status_code", 200)
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_cached_translation_skips_network_phases(self, mock_post):
+        mock_post.side_effect = [translations_response({HELLO: "Bonjour"})]
+        translator = Translator("test-key", "en", "fr")
+        translator.translate(["Hello"])
+        self.hook.spans.clear()
+
+        translator.translate(["Hello"])
+
+        assert self.hook.names() == [
+            "autolocalise.translate",
+            "autolocalise.validate",
+            "autolocalise.cache_lookup",
+        ]
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_template_phases(self, mock_post):
+        mock_post.side_effect = [translations_response({})]
+        translator = Translator("test-key", "en", "fr")
+        translator._translate_texts = Mock(return_value={})
+        self.hook.spans.clear()
+
+        translator.translate_template(Template("Hello $name"), name="Ana")
+
+        names = self.hook.names()
+        assert names[:2] == [
+            "autolocalise.translate_template",
+            "autolocalise.template_compile",
+        ]
+        assert "autolocalise.translate" in names
+
+    def test_remove_hook(self):
+        remove_hook(self.hook)
+
+        assert tracing.span("translate") is tracing._NULL_SPAN
+        remove_hook(self.hook)
+
+    def test_span_passes_exceptions(self):
+        with pytest.raises(ValueError):
+            with tracing.span("translate"):
+                raise ValueError("boom")
+
+        assert self.hook.depth == 0
+
+    def test_phase_timer(self):
+        timer = PhaseTimer()
+        add_hook(timer)
+        try:
+            with tracing.span("hash"):
+                pass
+            with tracing.span("hash"):
+                pass
+        finally:
+            remove_hook(timer)
+
+        stats = timer.stats()
+        assert stats["autolocalise.hash"]["count"] == 2
+        assert stats["autolocalise.hash"]["max"] <= stats["autolocalise.hash"]["total"]
+        timer.reset()
+        assert timer.stats() == {}
+
+    def test_opentelemetry_hook(self):
+        tracer = Mock()
+        hook = OpenTelemetryHook(tracer)
+
+        hook("autolocalise.hash", {"texts": 3})
+
+        tracer.start_as_current_span.assert_called_once_with(
+            "autolocalise.hash", attributes={"texts": 3}
+        )
+
+    def test_opentelemetry_hook_requires_package(self):
+        with patch("autolocalise.tracing.otel_trace", None):
+            with pytest.raises(ConfigurationError):
+                OpenTelemetryHook()
+
+    def test_async_translator(self):
+        pytest.importorskip("httpx")
+        from autolocalise import AsyncTranslator
+
+        async def run():
+            translator = AsyncTranslator("test-key", "en", "fr")
+            translator._ensure_server_translations = Mock(return_value=asyncio.sleep(0))
+            translator._post = Mock(
+                return_value=asyncio.sleep(0, translations_response({HELLO: "Bonjour"}))
+            )
+            return await translator.translate(["Hello"])
+
+        assert asyncio.run(run()) == {"Hello": "Bonjour"}
+        names = self.hook.names()
+        assert names[0] == "autolocalise.translate"
+        assert "autolocalise.cache_write" in names
@@ -1,9 +1,18 @@
 """Tests for translation API interactions"""
 
+import asyncio
+import threading
+import time
+
+import pytest
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
 from unittest.mock import Mock, patch
 
 from autolocalise import Translator, __version__
+from autolocalise.batching import BatchDispatcher
+from autolocalise.inflight import InFlightRegistry
 
 
 class TestTranslationAPI:
@@ -250,3 +259,428 @@ class TestTranslationAPI:
 
         # Should only call API twice (once for /v1/translations, once for /v1/translate)
         assert mock_post.call_count == 2
+
+
+def fake_api_post(url, json=None, timeout=None):
+    """Stand-in for Session.post that prefixes translations with "fr:"
+
+    Requests containing the text "fail" raise a connection error.
+    """
+    if url.endswith("/v1/translations"):
+        return Mock(status_code=404)
+
+    texts = json["texts"]
+    if any(item["text"] == "fail" for item in texts):
+        raise requests.exceptions.ConnectionError("Network error")
+
+    translations = {item["hashkey"]: f"fr:{item['text']}" for item in texts}
+    return Mock(status_code=200, json=lambda: {"translations": translations})
+
+
+class TestChunkedTranslation:
+    """Test cases for splitting large batches of cache misses"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    def translate_calls(self, mock_post):
+        return [
+            call for call in mock_post.call_args_list if "v1/translate" in str(call)
+        ]
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_batch_split_by_count(self, mock_post):
+        """Test that misses are sent in chunks of max_batch_size texts"""
+        mock_post.side_effect = fake_api_post
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", max_batch_size=2
+        )
+
+        texts = [f"text {i}" for i in range(5)]
+        result = translator.translate(texts)
+
+        assert result == {text: f"fr:{text}" for text in texts}
+        chunk_sizes = sorted(
+            len(call[1]["json"]["texts"]) for call in self.translate_calls(mock_post)
+        )
+        assert chunk_sizes == [1, 2, 2]
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_batch_split_by_bytes(self, mock_post):
+        """Test that misses are chunked by approximate payload size"""
+        mock_post.side_effect = fake_api_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            max_batch_bytes=300,
+        )
+
+        texts = [f"{i}" * 200 for i in range(3)]
+        result = translator.translate(texts)
+
+        assert result == {text: f"fr:{text}" for text in texts}
+        assert len(self.translate_calls(mock_post)) == 3
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_failed_chunk_falls_back_for_its_texts(self, mock_post):
+        """Test that a failed chunk does not discard other chunks' results"""
+        mock_post.side_effect = fake_api_post
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", max_batch_size=2
+        )
+
+        result = translator.translate(["Hello", "World", "fail", "Again"])
+
+        assert result == {
+            "Hello": "fr:Hello",
+            "World": "fr:World",
+            "fail": "fail",
+            "Again": "Again",
+        }
+        # Only successful translations are cached
+        assert translator._cache.get("Hello", "en", "fr") == "fr:Hello"
+        assert translator._cache.get("Again", "en", "fr") is None
+
+
+class TestRequestCoalescing:
+    """Test cases for single-flight coalescing of identical cache misses"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    def test_registry_claim_and_release(self):
+        """Test that the second claim on a key waits for the owner"""
+        registry = InFlightRegistry()
+
+        owned, waiting = registry.claim(["Hello", "Hello", "World"], "en", "fr")
+        assert owned == ["Hello", "World"]
+        assert waiting == {}
+
+        owned2, waiting2 = registry.claim(["Hello", "Other"], "en", "fr")
+        assert owned2 == ["Other"]
+        assert list(waiting2) == ["Hello"]
+
+        # Same text for another language pair is independent
+        owned3, _ = registry.claim(["Hello"], "en", "de")
+        assert owned3 == ["Hello"]
+
+        registry.release(owned, {"Hello": "Bonjour"}, "en", "fr")
+        assert waiting2["Hello"].result(timeout=1) == "Bonjour"
+        assert registry.pending() == 2
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_concurrent_identical_misses_share_one_request(self, mock_post):
+        """Test that a thundering herd of identical misses sends one request"""
+        started = threading.Event()
+
+        def slow_post(url, json=None, timeout=None):
+            if url.endswith("/v1/translate"):
+                started.set()
+                time.sleep(0.2)
+            return fake_api_post(url, json=json, timeout=timeout)
+
+        mock_post.side_effect = slow_post
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            first = executor.submit(translator.translate, ["New string"])
+            started.wait(timeout=1)
+            others = [
+                executor.submit(translator.translate, ["New string"]) for _ in range(9)
+            ]
+            results = [first.result()] + [future.result() for future in others]
+
+        assert all(result == {"New string": "fr:New string"} for result in results)
+        translate_calls = [
+            call for call in mock_post.call_args_list if "v1/translate" in str(call)
+        ]
+        assert len(translate_calls) == 1
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_waiters_fall_back_when_owner_fails(self, mock_post):
+        """Test that callers waiting on a failed request get the source text"""
+        started = threading.Event()
+
+        def failing_post(url, json=None, timeout=None):
+            if url.endswith("/v1/translate"):
+                started.set()
+                time.sleep(0.2)
+                raise requests.exceptions.ConnectionError("Network error")
+            return Mock(status_code=404)
+
+        mock_post.side_effect = failing_post
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(translator.translate, ["Hello"])
+            started.wait(timeout=1)
+            second = executor.submit(translator.translate, ["Hello"])
+
+            assert first.result() == {"Hello": "Hello"}
+            assert second.result() == {"Hello": "Hello"}
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_waiters_time_out(self, mock_post):
+        """Test that waiting on a stuck owner falls back after the timeout"""
+        mock_post.side_effect = fake_api_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            read_timeout=0.1,
+            connect_timeout=0.1,
+        )
+        registry = translator._inflight
+        owned, _ = registry.claim(["Stuck"], "en", "fr")
+        try:
+            started = time.monotonic()
+            result = translator.translate(["Stuck"])
+            elapsed = time.monotonic() - started
+        finally:
+            registry.release(owned, {}, "en", "fr")
+
+        assert result == {"Stuck": "Stuck"}
+        assert 0.15 < elapsed < 2
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_sync_call_on_event_loop_does_not_wait_for_its_coroutines(self, mock_post):
+        """Test that a sync call inside a coroutine fetches texts that a
+        coroutine on the same loop is fetching instead of deadlocking"""
+        pytest.importorskip("httpx")
+        from autolocalise import AsyncTranslator
+
+        mock_post.side_effect = fake_api_post
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+
+        async def run():
+            async_translator = AsyncTranslator("test-key", "en", "fr")
+            async_translator._ensure_server_translations = Mock(
+                return_value=asyncio.sleep(0)
+            )
+            started = asyncio.Event()
+
+            async def slow_post(path, payload, *args, **kwargs):
+                started.set()
+                await asyncio.sleep(0.5)
+                return fake_api_post(path, json=payload)
+
+            async_translator._post = slow_post
+            task = asyncio.create_task(async_translator.translate(["Shared"]))
+            await started.wait()
+
+            before = time.monotonic()
+            result = translator.translate(["Shared"])
+            elapsed = time.monotonic() - before
+            return result, elapsed, await task
+
+        result, elapsed, async_result = asyncio.run(asyncio.wait_for(run(), 10))
+
+        assert result == {"Shared": "fr:Shared"}
+        assert async_result == {"Shared": "fr:Shared"}
+        assert elapsed < 5
+        assert translator._inflight.pending() == 0
+
+
+class TestMicroBatching:
+    """Test cases for the cross-thread batch dispatcher"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    def test_concurrent_submissions_share_one_batch(self):
+        """Test that texts submitted within the window are sent together"""
+        calls = []
+
+        def send(texts, source_lang, target_lang):
+            calls.append((list(texts), source_lang, target_lang))
+            return {text: f"{target_lang}:{text}" for text in texts}
+
+        dispatcher = BatchDispatcher(send, window=0.2, max_batch_size=100)
+        futures = [dispatcher.submit([f"text {i}"], "en", "fr") for i in range(10)]
+        results = [future.result(timeout=2) for future in futures]
+        dispatcher.close()
+
+        assert results == [{f"text {i}": f"fr:text {i}"} for i in range(10)]
+        assert len(calls) == 1
+        assert sorted(calls[0][0]) == sorted(f"text {i}" for i in range(10))
+
+        stats = dispatcher.stats()
+        assert stats["requests"] == 10
+        assert stats["batches"] == 1
+        assert stats["average_batch_size"] == 10
+        assert stats["fill_rate"] == 0.1
+
+    def test_full_batch_is_sent_before_window_expires(self):
+        """Test that reaching max_batch_size flushes immediately"""
+        dispatcher = BatchDispatcher(
+            lambda texts, s, t: {text: text.upper() for text in texts},
+            window=10,
+            max_batch_size=3,
+        )
+
+        started = time.monotonic()
+        future = dispatcher.submit(["a", "b", "c"], "en", "fr")
+
+        assert future.result(timeout=2) == {"a": "A", "b": "B", "c": "C"}
+        assert time.monotonic() - started < 2
+        dispatcher.close()
+
+    def test_batches_are_grouped_by_language_pair(self):
+        """Test that each language pair is sent as its own batch"""
+        calls = []
+
+        def send(texts, source_lang, target_lang):
+            calls.append(target_lang)
+            return {text: f"{target_lang}:{text}" for text in texts}
+
+        dispatcher = BatchDispatcher(send, window=0.1)
+        fr = dispatcher.submit(["Hello"], "en", "fr")
+        de = dispatcher.submit(["Hello"], "en", "de")
+
+        assert fr.result(timeout=2) == {"Hello": "fr:Hello"}
+        assert de.result(timeout=2) == {"Hello": "de:Hello"}
+        assert sorted(calls) == ["de", "fr"]
+        dispatcher.close()
+
+    def test_errors_are_fanned_out(self):
+        """Test that a failed batch fails every waiting caller"""
+
+        def send(texts, source_lang, target_lang):
+            raise requests.exceptions.ConnectionError("Network error")
+
+        dispatcher = BatchDispatcher(send, window=0.05)
+        futures = [dispatcher.submit([f"text {i}"], "en", "fr") for i in range(3)]
+
+        for future in futures:
+            assert isinstance(
+                future.exception(timeout=2), requests.exceptions.ConnectionError
+            )
+        dispatcher.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_translator_batches_misses_across_threads(self, mock_post):
+        """Test that concurrent translate calls share one API request"""
+        mock_post.side_effect = fake_api_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            batch_window=0.2,
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(translator.translate, [f"text {i}"]) for i in range(8)
+            ]
+            results = [future.result() for future in futures]
+        translator.close()
+
+        assert results == [{f"text {i}": f"fr:text {i}"} for i in range(8)]
+        translate_calls = [
+            call for call in mock_post.call_args_list if "v1/translate" in str(call)
+        ]
+        assert len(translate_calls) == 1
+        assert translator.dispatcher.stats()["batches"] == 1
+
+
+class TestBackgroundWarmup:
+    """Test cases for loading server translations in the background"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_constructor_does_not_block(self, mock_post):
+        """Test that lookups are served while the catalog is loading"""
+        release = threading.Event()
+
+        def slow_catalog_post(url, json=None, timeout=None):
+            if url.endswith("/v1/translations"):
+                release.wait(2)
+                return Mock(
+                    status_code=200,
+                    json=lambda: {"translations": {"69609650": "Bonjour"}},
+                )
+            return fake_api_post(url, json=json, timeout=timeout)
+
+        mock_post.side_effect = slow_catalog_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            background_warmup=True,
+        )
+
+        assert not translator.ready()
+        assert not translator.wait_ready(timeout=0.01)
+        # Served by the API while the catalog is still loading
+        assert translator.translate(["World"]) == {"World": "fr:World"}
+
+        release.set()
+        assert translator.wait_ready(timeout=2)
+        assert translator.ready()
+        assert translator.translate(["Hello"]) == {"Hello": "Bonjour"}
+        translator.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_ready_after_failed_load(self, mock_post):
+        """Test that a failed catalog load still marks the translator ready"""
+        mock_post.side_effect = requests.exceptions.ConnectionError("Network error")
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            background_warmup=True,
+        )
+
+        assert translator.wait_ready(timeout=2)
+        assert translator._server_translations == {}
+        translator.close()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_blocking_mode_is_ready_immediately(self, mock_post):
+        """Test that the default constructor finishes loading before returning"""
+        mock_post.return_value = Mock(status_code=404)
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+
+        assert translator.ready()
+        assert translator.wait_ready(timeout=0)
+
+
+class TestBatchTemplates:
+    """Test cases for translating many templates in one request"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_cold_templates_share_one_request(self, mock_post):
+        """Test that every template miss goes into one /v1/translate call"""
+        mock_post.side_effect = fake_api_post
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr"
+        )
+
+        items = [(Template(f"Message $n of type {i}"), {"n": i}) for i in range(40)]
+        results = translator.translate_templates(items)
+
+        assert results == [f"fr:Message {i} of type {i}" for i in range(40)]
+        translate_calls = [
+            call for call in mock_post.call_args_list if "v1/translate" in str(call)
+        ]
+        assert len(translate_calls) == 1
+        assert len(translate_calls[0][1]["json"]["texts"]) == 40
@@ -3,8 +3,9 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from autolocalise import Translator
+from autolocalise import Translator, hashing
 from autolocalise.exceptions import ConfigurationError
+from autolocalise.hashing import hash_texts, text_hash
 
 
 class TestTranslatorCore:
@@ -119,3 +120,87 @@ class TestTranslatorCore:
             result = translator(["Hello"])
 
             assert result == {"Hello": "Bonjour"}
+
+    def test_invalid_batch_settings(self):
+        """Test that non-positive batching settings are rejected"""
+        with pytest.raises(ConfigurationError):
+            Translator(
+                api_key="test-key",
+                source_locale="en",
+                target_locale="fr",
+                max_batch_size=0,
+            )
+
+
+def reference_hash(text):
+    """Character-by-character port of the React SDK hash"""
+    hash_value = 0
+    for char in text:
+        hash_value = (hash_value << 5) - hash_value + ord(char)
+        hash_value = hash_value & 0xFFFFFFFF
+        if hash_value > 0x7FFFFFFF:
+            hash_value -= 0x100000000
+    return str(hash_value)
+
+
+HASH_SAMPLES = [
+    "",
+    "Hello",
+    "Hello, world! How are you today?",
+    "Café naïve résumé",
+    "こんにちは世界",
+    "Emoji 🌍🚀 and more 👍",
+    "a" * 10000,
+    "".join(chr(c) for c in range(32, 2000)),
+]
+
+
+class TestHashing:
+    """Test cases for the text hash engine"""
+
+    def setup_method(self):
+        """Forget memoized hashes so every path is exercised"""
+        hashing._memo.clear()
+
+    def test_matches_reference(self):
+        """Test that hashes are identical to the original implementation"""
+        for text in HASH_SAMPLES:
+            assert text_hash(text) == reference_hash(text)
+
+        assert text_hash("Hello") == "69609650"
+
+    def test_translator_uses_same_hash(self):
+        """Test that Translator._generate_hash delegates to the engine"""
+        with patch("autolocalise.translator.requests.Session.post") as mock_post:
+            mock_post.return_value = Mock(status_code=404)
+            translator = Translator(
+                api_key="test-key", source_locale="en", target_locale="fr"
+            )
+
+        for text in HASH_SAMPLES:
+            assert translator._generate_hash(text) == reference_hash(text)
+
+    def test_hash_texts_pure_python(self):
+        """Test batch hashing without NumPy"""
+        with patch.object(hashing, "numpy", None):
+            assert hash_texts(HASH_SAMPLES) == [
+                reference_hash(text) for text in HASH_SAMPLES
+            ]
+
+    @pytest.mark.skipif(hashing.numpy is None, reason="NumPy is not installed")
+    def test_hash_texts_numpy(self):
+        """Test vectorized batch hashing"""
+        texts = HASH_SAMPLES + [f"Label number {i}" for i in range(500)]
+
+        with patch.object(hashing, "NUMPY_MIN_CHARS", 0):
+            assert hash_texts(texts) == [reference_hash(text) for text in texts]
+
+    def test_memo_is_bounded(self):
+        """Test that the memo never grows past its limit"""
+        with patch.object(hashing, "HASH_MEMO_SIZE", 10):
+            for i in range(50):
+                text_hash(f"text {i}")
+            hash_texts([f"batch {i}" for i in range(50)])
+
+            assert len(hashing._memo) == 10
+            assert "batch 49" in hashing._memo
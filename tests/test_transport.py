@@ -0,0 +1,140 @@
+"""Tests for HTTP connection pooling and timeouts"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from autolocalise import Translator
+from autolocalise.exceptions import ConfigurationError
+from autolocalise.transport import create_session, request_timeout
+
+from .fake_server import FakeAutoLocaliseServer
+
+
+def api_post(url, json=None, timeout=None, **kwargs):
+    """Stand-in for Session.post returning "fr:" translations"""
+    if url.endswith("/v1/translations"):
+        return Mock(status_code=404)
+    translations = {item["hashkey"]: f"fr:{item['text']}" for item in json["texts"]}
+    return Mock(status_code=200, json=lambda: {"translations": translations})
+
+
+class TestCreateSession:
+    """Test cases for create_session"""
+
+    def test_pool_settings(self):
+        """Test that pool sizes are applied to both schemes"""
+        session = create_session(pool_connections=3, pool_maxsize=25, pool_block=True)
+
+        for prefix in ("https://", "http://"):
+            adapter = session.get_adapter(f"{prefix}example.com")
+            assert adapter._pool_connections == 3
+            assert adapter._pool_maxsize == 25
+            assert adapter._pool_block is True
+
+    def test_keep_alive_disabled(self):
+        assert create_session(keep_alive=False).headers["Connection"] == "close"
+        assert "close" not in create_session().headers.get("Connection", "")
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ConfigurationError):
+            create_session(pool_maxsize=0)
+
+    def test_request_timeout(self):
+        """Test that connect and read timeouts combine into a tuple"""
+        assert request_timeout(None, None) == 30
+        assert request_timeout(2, None) == (2, 30)
+        assert request_timeout(3.5, 10) == (3.5, 10)
+
+        with pytest.raises(ConfigurationError):
+            request_timeout(0, 10)
+
+
+class TestTranslatorTransport:
+    """Test cases for Translator sessions and timeouts"""
+
+    def setup_method(self):
+        """Clear global cache before each test"""
+        Translator.clear_global_cache()
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_separate_timeouts(self, mock_post):
+        """Test that connect and read timeouts are sent with requests"""
+        mock_post.side_effect = api_post
+        translator = Translator(
+            api_key="test-key",
+            source_locale="en",
+            target_locale="fr",
+            connect_timeout=2,
+            read_timeout=15,
+        )
+
+        translator.translate(["Hello"])
+
+        assert all(call[1]["timeout"] == (2, 15) for call in mock_post.call_args_list)
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_default_pool_fits_workers(self, mock_post):
+        mock_post.side_effect = api_post
+        translator = Translator(
+            api_key="test-key", source_locale="en", target_locale="fr", max_workers=32
+        )
+
+        adapter = translator._session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 32
+
+    @patch("autolocalise.translator.requests.Session.post")
+    def test_shared_session_left_open(self, mock_post):
+        """Test that a passed-in session is used and not closed"""
+        mock_post.side_effect = api_post
+        session = create_session()
+        session.close = Mock()
+
+        first = Translator("test-key", "en", "fr", session=session)
+        second = Translator("test-key", "en", "de", session=session)
+        first.close()
+
+        assert first._session is second._session is session
+        session.close.assert_not_called()
+        assert "autolocalise-python-sdk" in session.headers["User-Agent"]
+
+    def test_shared_session_reuses_connections(self):
+        """Test that translators sharing a session share its connections"""
+        with FakeAutoLocaliseServer() as server:
+            session = create_session(pool_maxsize=4)
+            with patch("autolocalise.translator.DEFAULT_BASE_URL", server.url):
+                translators = [
+                    Translator("test-key", "en", locale, session=session)
+                    for locale in ("fr", "de", "es", "it")
+                ]
+
+            for translator in translators:
+                for n in range(5):
+                    translator.translate([f"Text {n}"])
+
+            assert len(server.requests_for("/v1/translate")) == 20
+            assert server.connections == 1
+            session.close()
+
+    def test_pool_holds_connections_of_all_threads(self):
+        """Test that concurrent threads keep their connections"""
+        with FakeAutoLocaliseServer() as server:
+            with patch("autolocalise.translator.DEFAULT_BASE_URL", server.url):
+                translator = Translator("test-key", "en", "fr", max_workers=8)
+            barrier = threading.Barrier(8)
+
+            def worker(n):
+                for i in range(5):
+                    barrier.wait()
+                    translator.translate([f"Thread {n} text {i}"])
+
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            # One connection per thread at most, each reused for every round
+            assert server.connections <= 8
+            translator.close()